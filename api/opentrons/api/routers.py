@@ -1,11 +1,54 @@
 from opentrons.broker import subscribe, Notifications
+from opentrons.broker.broker import DROP
 from .session import SessionManager, Session
 from .calibration import CalibrationManager
 
+# notifications held for a client that can't keep up, before the oldest
+# running session updates are dropped rather than holding up the protocol
+MAX_NOTIFICATIONS = 1000
+
+
+def _last_command_id(payload):
+    last_command = payload.get('lastCommand')
+    return -1 if last_command is None else last_command['id']
+
+
+def _superseded(previous, message):
+    """
+    Whether :message: makes :previous: redundant: both report a running
+    session in the same state, and :message: has the same or a later last
+    command. Clients only render the latest command, so the updates for the
+    commands in between are dropped
+    """
+    if not all(
+            msg.get('topic') == Session.TOPIC and
+            isinstance(msg['payload'], dict)
+            for msg in (previous, message)):
+        return False
+    before, after = previous['payload'], message['payload']
+    return before.get('state') == after.get('state') and \
+        _last_command_id(before) <= _last_command_id(after)
+
+
+def _droppable(message):
+    """
+    Whether :message: is an update of a running session, which the next
+    one makes redundant. Everything else, calibration updates and state
+    changes included, has to reach the client
+    """
+    return message.get('topic') == Session.TOPIC and \
+        isinstance(message['payload'], dict) and \
+        message['payload'].get('state') == 'running'
+
 
 class MainRouter:
     def __init__(self, loop=None):
-        self._notifications = Notifications(loop=loop)
+        self._notifications = Notifications(
+            loop=loop,
+            maxsize=MAX_NOTIFICATIONS,
+            overflow=DROP,
+            coalesce=_superseded,
+            droppable=_droppable)
         self._unsubscribe = []
         self._unsubscribe += [subscribe(
             Session.TOPIC,
@@ -2,7 +2,6 @@ import ast
 import logging
 from copy import copy
 from time import time
-from functools import reduce
 import json
 
 from opentrons.broker import publish, subscribe
@@ -64,6 +63,10 @@ class Session(object):
         self.commands = []
         self.command_log = {}
         self.errors = []
+        # estimated run time in seconds, of the protocol and of each command
+        # by id, measured during simulation
+        self.estimated_duration = None
+        self.command_durations = []
 
         self._containers = []
         self._instruments = []
@@ -82,28 +85,22 @@ class Session(object):
         self.refresh()
 
     def get_instruments(self):
+        containers = _group(self._interactions)
         return [
             Instrument(
                 instrument=instrument,
-                containers=[
-                    container
-                    for _instrument, container in
-                    self._interactions
-                    if _instrument == instrument
-                ])
+                containers=containers.get(instrument, []))
             for instrument in self._instruments
         ]
 
     def get_containers(self):
+        instruments = _group(
+            (container, instrument)
+            for instrument, container in self._interactions)
         return [
             Container(
                 container=container,
-                instruments=[
-                    instrument
-                    for instrument, _container in
-                    self._interactions
-                    if _container == container
-                ])
+                instruments=instruments.get(container, []))
             for container in self._containers
         ]
 
@@ -123,6 +120,9 @@ class Session(object):
         stack = []
         res = []
         commands = []
+        # (name, id, simulated start time) of commands that may still finish
+        started = []
+        durations = []
 
         self._containers.clear()
         self._instruments.clear()
@@ -131,15 +131,16 @@ class Session(object):
 
         def on_command(message):
             payload = message['payload']
-            description = payload.get('text', '').format(
-                **payload
-            )
+            description = payload.get('text', '')
 
             if message['$'] == 'before':
                 level = len(stack)
 
                 stack.append(message)
                 commands.append(payload)
+                started.append(
+                    (message['name'], len(res), robot.simulated_time()))
+                durations.append(0.0)
 
                 res.append(
                     {
@@ -148,8 +149,17 @@ class Session(object):
                         'id': len(res)})
             else:
                 stack.pop()
+                # commands published only 'before' (like comments) never
+                # finish, and are left with no duration
+                while started:
+                    name, command_id, start = started.pop()
+                    if name == message['name']:
+                        durations[command_id] = \
+                            robot.simulated_time() - start
+                        break
 
         unsubscribe = subscribe(types.COMMAND, on_command)
+        start_time = robot.simulated_time()
 
         try:
             # ensure actual pipettes are cached before driver is disconnected
@@ -162,6 +172,8 @@ class Session(object):
                 execute_protocol(self._protocol)
             else:
                 exec(self._protocol, {})
+            self.estimated_duration = robot.simulated_time() - start_time
+            self.command_durations = durations
         finally:
             # physically attached pipettes are re-cached during robot.connect()
             # which is important, because during a simulation, the robot could
@@ -169,13 +181,13 @@ class Session(object):
             robot.connect()
             unsubscribe()
 
-            instruments, containers, modules, interactions = _accumulate(
-                [_get_labware(command) for command in commands])
+            instruments, containers, modules, interactions = \
+                _collect_labware(commands)
 
-            self._containers.extend(_dedupe(containers))
-            self._instruments.extend(_dedupe(instruments))
-            self._modules.extend(_dedupe(modules))
-            self._interactions.extend(_dedupe(interactions))
+            self._containers.extend(containers)
+            self._instruments.extend(instruments)
+            self._modules.extend(modules)
+            self._interactions.extend(interactions)
 
         return res
 
@@ -316,20 +328,33 @@ class Session(object):
         robot.home_z()
 
 
-def _accumulate(iterable):
-    return reduce(
-        lambda x, y: tuple([x + y for x, y in zip(x, y)]),
-        iterable,
-        ([], [], [], []))
+def _collect_labware(commands):
+    """
+    The instruments, containers, modules and (instrument, container)
+    interactions of :commands:, each without duplicates, in order of first
+    appearance
+    """
+    res = ([], [], [], [])
+    seen = tuple(set() for _ in res)
 
+    for command in commands:
+        for items, known, found in zip(res, seen, _get_labware(command)):
+            for item in found:
+                if item not in known:
+                    known.add(item)
+                    items.append(item)
+
+    return res
 
-def _dedupe(iterable):
-    acc = set()
 
-    for item in iterable:
-        if item not in acc:
-            acc.add(item)
-            yield item
+def _group(pairs):
+    """
+    Dict of each key in :pairs: to the list of values it is paired with
+    """
+    res = {}
+    for key, value in pairs:
+        res.setdefault(key, []).append(value)
+    return res
 
 
 def now():
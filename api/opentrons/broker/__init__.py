@@ -1,4 +1,4 @@
-from .broker import subscribe, publish, Notifications
+from .broker import subscribe, publish, has_subscribers, Notifications
 from . import topics
 
-__all__ = [subscribe, publish, Notifications, topics]
+__all__ = [subscribe, publish, has_subscribers, Notifications, topics]
@@ -1,17 +1,70 @@
 import asyncio
+import threading
 
 from asyncio import Queue
-from concurrent import futures
+from collections import deque
 from contextlib import contextmanager
 
 subscriptions = {}
 
+# What Notifications does with a message once it holds maxsize of them
+BLOCK = 'block'  # the publishing thread waits for the consumer
+DROP = 'drop'  # the oldest message that may be dropped is
+
+
+class _DroppingQueue(Queue):
+    """
+    A Queue that, once it holds :limit: messages, makes room for a new one
+    by dropping the oldest message for which :droppable:(message) is true.
+    Messages that can't be dropped are kept, even over :limit:
+    """
+    def __init__(self, limit, droppable, *, loop=None):
+        super().__init__(loop=loop)
+        self._limit = limit
+        self._droppable = droppable
+
+    def _put(self, item):
+        if len(self._queue) >= self._limit:
+            for index, queued in enumerate(self._queue):
+                if self._droppable(queued):
+                    del self._queue[index]
+                    break
+        super()._put(item)
+
 
 class Notifications(object):
-    def __init__(self, loop=None):
+    """
+    Delivers messages published from any thread to an async consumer on
+    :loop:
+
+    Publishing only appends to a deque, and a single callback scheduled
+    on the loop moves whatever accumulated into :queue:. There, messages
+    for which :coalesce:(previous, message) is true replace the message
+    published right before them.
+
+    With a :maxsize:, a full backlog makes publishing threads wait for
+    the consumer (`BLOCK`) or drops the oldest queued message for which
+    :droppable:(message) is true, any message by default (`DROP`). The
+    loop's own thread never waits, and may go over :maxsize:.
+    """
+    def __init__(self, loop=None, maxsize=0, overflow=BLOCK, coalesce=None,
+                 droppable=None):
+        if overflow not in (BLOCK, DROP):
+            raise ValueError('Unknown overflow policy: {}'.format(overflow))
         self.loop = loop or asyncio.get_event_loop()
-        self.queue = Queue(loop=self.loop)
+        if overflow == DROP and maxsize:
+            self.queue = _DroppingQueue(
+                maxsize, droppable or (lambda message: True), loop=self.loop)
+        else:
+            self.queue = Queue(loop=self.loop)
         self.snoozed = False
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._coalesce = coalesce
+        self._pending = deque()
+        self._drain_scheduled = False
+        self._space = threading.Condition()
+        self._waiting = 0  # publishing threads waiting for space
 
     @contextmanager
     def snooze(self):
@@ -33,31 +86,87 @@ class Notifications(object):
         if self.snoozed:
             return
 
-        future = asyncio.run_coroutine_threadsafe(
-            self.queue.put(message), self.loop)
+        if self._overflow == BLOCK and self._maxsize and \
+                not thread_has_event_loop():
+            self._append_when_space(message)
+        else:
+            self._pending.append(message)
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.loop.call_soon_threadsafe(self._drain)
+
+    def _append_when_space(self, message):
+        # appending under the lock keeps waiting publishers, once woken,
+        # from all taking the same free space
+        with self._space:
+            if self._full():
+                self._waiting += 1
+                try:
+                    self._space.wait_for(lambda: not self._full())
+                finally:
+                    self._waiting -= 1
+            self._pending.append(message)
+
+    def _full(self):
+        return bool(self._maxsize) and \
+            len(self._pending) + self.queue.qsize() >= self._maxsize
+
+    def _drain(self):
+        # Cleared first: messages published from now on schedule another
+        # drain, and those published before are in _pending already
+        self._drain_scheduled = False
+
+        batch = []
+        while self._pending:
+            message = self._pending.popleft()
+            if batch and self._coalesce and \
+                    self._coalesce(batch[-1], message):
+                batch[-1] = message
+            else:
+                batch.append(message)
 
-        if not thread_has_event_loop():
-            futures.wait([future])
+        for message in batch:
+            self.queue.put_nowait(message)
 
     async def __anext__(self):
-        return await self.queue.get()
+        message = await self.queue.get()
+        if self._waiting:
+            with self._space:
+                self._space.notify_all()
+        return message
 
     def __aiter__(self):
         return self
 
 
 def subscribe(topic, handler):
-    handlers = subscriptions[topic] = subscriptions.get(topic, [])
+    handlers = subscriptions.get(topic, ())
     if handler in handlers:
         return
 
-    handlers.append(handler)
+    # handlers are kept in tuples replaced on every change, so publish()
+    # can iterate them as they are
+    subscriptions[topic] = handlers + (handler,)
 
     def unsubscribe():
+        handlers = list(subscriptions.get(topic, ()))
         handlers.remove(handler)
+        if handlers:
+            subscriptions[topic] = tuple(handlers)
+        else:
+            del subscriptions[topic]
 
     return unsubscribe
 
 
+def has_subscribers(topic):
+    """
+    Whether anything is subscribed to :topic:, for publishers to skip
+    building messages nobody receives
+    """
+    return topic in subscriptions
+
+
 def publish(topic, message):
-    [handler(message) for handler in subscriptions.get(topic, [])]
+    for handler in subscriptions.get(topic, ()):
+        handler(message)
@@ -34,6 +34,31 @@ def stringify_location(location):
         )
 
 
+class CommandPayload(dict):
+    """
+    A command's payload whose 'text' is rendered by :render: when first
+    read, and kept from then on, so descriptions nobody reads cost nothing.
+    Until then, 'text' is only seen by `in`, `[]` and `get()`
+    """
+    def __init__(self, render, payload):
+        super().__init__(payload)
+        self._render = render
+
+    def __missing__(self, key):
+        if key != 'text' or self._render is None:
+            raise KeyError(key)
+        text = self['text'] = self._render()
+        self._render = None
+        return text
+
+    def __contains__(self, key):
+        return super().__contains__(key) or \
+            (key == 'text' and self._render is not None)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+
 def make_command(name, payload):
     return {'name': name, 'payload': payload}
 
@@ -50,103 +75,101 @@ def home(mount):
 
 
 def aspirate(instrument, volume, location, rate):
-    location_text = stringify_location(location)
-    text = 'Aspirating {volume} uL from {location} at {rate} speed'.format(
-        volume=volume, location=location_text, rate=rate
-    )
+    def text():
+        return 'Aspirating {volume} uL from {location} at {rate} speed'.format(
+            volume=volume, location=stringify_location(location), rate=rate
+        )
     return make_command(
         name=types.ASPIRATE,
-        payload={
+        payload=CommandPayload(text, {
             'instrument': instrument,
             'volume': volume,
             'location': location,
-            'rate': rate,
-            'text': text
-        }
+            'rate': rate
+        })
     )
 
 
 def dispense(instrument, volume, location, rate):
-    location_text = stringify_location(location)
-    text = 'Dispensing {volume} uL into {location}'.format(
-        volume=volume, location=location_text, rate=rate
-    )
+    def text():
+        return 'Dispensing {volume} uL into {location}'.format(
+            volume=volume, location=stringify_location(location), rate=rate
+        )
 
     return make_command(
         name=types.DISPENSE,
-        payload={
+        payload=CommandPayload(text, {
             'instrument': instrument,
             'volume': volume,
             'location': location,
-            'rate': rate,
-            'text': text
-        }
+            'rate': rate
+        })
     )
 
 
 def consolidate(instrument, volume, source, dest):
-    text = 'Consolidating {volume} from {source} to {dest}'.format(
-        volume=volume,
-        source=stringify_location(source),
-        dest=stringify_location(dest)
-    )
+    def text():
+        return 'Consolidating {volume} from {source} to {dest}'.format(
+            volume=volume,
+            source=stringify_location(source),
+            dest=stringify_location(dest)
+        )
     # incase either source or dest is list of tuple location
     # strip both down to simply lists of Placeables
     locations = [] + location_to_list(source) + location_to_list(dest)
     return make_command(
         name=types.CONSOLIDATE,
-        payload={
+        payload=CommandPayload(text, {
             'instrument': instrument,
             'locations': locations,
             'volume': volume,
             'source': source,
-            'dest': dest,
-            'text': text
-        }
+            'dest': dest
+        })
     )
 
 
 def distribute(instrument, volume, source, dest):
-    text = 'Distributing {volume} from {source} to {dest}'.format(
-        volume=volume,
-        source=stringify_location(source),
-        dest=stringify_location(dest)
-    )
+    def text():
+        return 'Distributing {volume} from {source} to {dest}'.format(
+            volume=volume,
+            source=stringify_location(source),
+            dest=stringify_location(dest)
+        )
     # incase either source or dest is list of tuple location
     # strip both down to simply lists of Placeables
     locations = [] + location_to_list(source) + location_to_list(dest)
     return make_command(
         name=types.DISTRIBUTE,
-        payload={
+        payload=CommandPayload(text, {
             'instrument': instrument,
             'locations': locations,
             'volume': volume,
             'source': source,
-            'dest': dest,
-            'text': text
-        }
+            'dest': dest
+        })
     )
 
 
 def transfer(instrument, volume, source, dest):
-    text = 'Transferring {volume} from {source} to {dest}'.format(
-        volume=volume,
-        source=stringify_location(source),
-        dest=stringify_location(dest)
-    )
+    def text():
+        return 'Transferring {volume} from {source} to {dest}'.format(
+            volume=volume,
+            source=stringify_location(source),
+            dest=stringify_location(dest)
+        )
     # incase either source or dest is list of tuple location
     # strip both down to simply lists of Placeables
     locations = [] + location_to_list(source) + location_to_list(dest)
     return make_command(
         name=types.TRANSFER,
-        payload={
+        payload=CommandPayload(text, {
             'instrument': instrument,
             'locations': locations,
             'volume': volume,
             'source': source,
-            'dest': dest,
-            'text': text
-        }
+            'dest': dest
+        })
     )
 
 
@@ -161,35 +184,36 @@ def comment(msg):
 
 
 def mix(instrument, repetitions, volume, location):
-    text = 'Mixing {repetitions} times with a volume of {volume}ul'.format(
-        repetitions=repetitions, volume=volume
-    )
+    def text():
+        return 'Mixing {repetitions} times with a volume of {volume}ul'.format(
+            repetitions=repetitions, volume=volume
+        )
     return make_command(
         name=types.MIX,
-        payload={
+        payload=CommandPayload(text, {
             'instrument': instrument,
             'location': location,
             'volume': volume,
-            'repetitions': repetitions,
-            'text': text
-        }
+            'repetitions': repetitions
+        })
     )
 
 
 def blow_out(instrument, location):
-    location_text = stringify_location(location)
-    text = 'Blowing out'
+    def text():
+        text = 'Blowing out'
 
-    if location is not None:
-        text += ' at {location}'.format(location=location_text)
+        if location is not None:
+            text += ' at {location}'.format(
+                location=stringify_location(location))
+        return text
 
     return make_command(
         name=types.BLOW_OUT,
-        payload={
+        payload=CommandPayload(text, {
             'instrument': instrument,
-            'location': location,
-            'text': text
-        }
+            'location': location
+        })
     )
 
 
@@ -225,28 +249,28 @@ def return_tip():
 
 
 def pick_up_tip(instrument, location):
-    location_text = stringify_location(location)
-    text = 'Picking up tip {location}'.format(location=location_text)
+    def text():
+        return 'Picking up tip {location}'.format(
+            location=stringify_location(location))
     return make_command(
         name=types.PICK_UP_TIP,
-        payload={
+        payload=CommandPayload(text, {
             'instrument': instrument,
-            'location': location,
-            'text': text
-        }
+            'location': location
+        })
     )
 
 
 def drop_tip(instrument, location):
-    location_text = stringify_location(location)
-    text = 'Dropping tip {location}'.format(location=location_text)
+    def text():
+        return 'Dropping tip {location}'.format(
+            location=stringify_location(location))
     return make_command(
         name=types.DROP_TIP,
-        payload={
+        payload=CommandPayload(text, {
             'instrument': instrument,
-            'location': location,
-            'text': text
-        }
+            'location': location
+        })
     )
 
 
@@ -291,7 +315,8 @@ def tempdeck_deactivate():
 
 
 def delay(seconds, minutes):
-    text = "Delaying for {minutes}m {seconds}s"
+    text = "Delaying for {minutes}m {seconds}s".format(
+        minutes=minutes, seconds=seconds)
     return make_command(
         name=types.DELAY,
         payload={
@@ -325,37 +350,27 @@ def publish(before, after, command, meta=None):
         broker.publish,
         topic=types.COMMAND)
 
+    command_params, command_defaults = _get_command_params(command)
+    # TODO (artyom, 20170927): we are doing this to be able to use
+    # the decorator in Instrument class methods, in which case
+    # self is effectively an instrument.
+    # To narrow the scope of this hack, we are checking if the command
+    # is expecting instrument first.
+    self_is_instrument = 'instrument' in command_params
+
     def decorator(f):
+        # Argument names and defaults are looked up once, here, rather than
+        # on every call of the decorated function
+        params, defaults = _get_params(f)
+
         @functools.wraps(f)
         def decorated(*args, **kwargs):
-            call_args = _get_args(f, args, kwargs)
-            command_args = dict(
-                zip(
-                    reversed(inspect.getargspec(command).args),
-                    reversed(inspect.getargspec(command).defaults or [])))
-
-            # TODO (artyom, 20170927): we are doing this to be able to use
-            # the decorator in Instrument class methods, in which case
-            # self is effectively an instrument.
-            # To narrow the scope of this hack, we are checking if the command
-            # is expecting instrument first.
-            if 'instrument' in inspect.getargspec(command).args:
-                # We are also checking if call arguments have 'self' and
-                # don't have instruments specified, in which case instruments
-                # should take precedence.
-                if 'self' in call_args and 'instrument' not in call_args:
-                    call_args['instrument'] = call_args['self']
-
-            command_args.update({
-                key: call_args[key]
-                for key in
-                set(inspect.getargspec(command).args) & call_args.keys()
-            })
-
-            if meta:
-                command_args['meta'] = meta
-
-            payload = command(**command_args)
+            if not broker.has_subscribers(types.COMMAND):
+                return f(*args, **kwargs)
+
+            payload = command(**_bind_command_args(
+                args, kwargs, params, defaults,
+                command_params, command_defaults, self_is_instrument, meta))
 
             if before:
                 publish_command(
@@ -373,22 +388,57 @@ def publish(before, after, command, meta=None):
     return decorator
 
 
-def _get_args(f, args, kwargs):
-    # Create the initial dictionary with args that have defaults
-    res = {}
-
-    if inspect.getargspec(f).defaults:
-        res = dict(
-            zip(
-                reversed(inspect.getargspec(f).args),
-                reversed(inspect.getargspec(f).defaults)))
-
-    # Update / insert values for positional args
-    res.update(dict(zip(inspect.getargspec(f).args, args)))
-
-    # Update it with values for named args
-    res.update(kwargs)
-    return res
+def _bind_command_args(args, kwargs, params, defaults,
+                       command_params, command_defaults,
+                       self_is_instrument, meta):
+    """
+    Arguments for a command builder, taken from a call of the function
+    it describes
+    """
+    call_args = dict(defaults)
+    call_args.update(zip(params, args))
+    call_args.update(kwargs)
+
+    command_args = dict(command_defaults)
+    for key in command_params:
+        if key in call_args:
+            command_args[key] = call_args[key]
+
+    # We are also checking if call arguments have 'self' and
+    # don't have instruments specified, in which case instruments
+    # should take precedence.
+    if self_is_instrument and 'self' in call_args \
+            and 'instrument' not in call_args:
+        command_args['instrument'] = call_args['self']
+
+    if meta:
+        command_args['meta'] = meta
+    return command_args
+
+
+def _get_params(f):
+    """
+    Names of the positional parameters of :f:, and a dict of the defaults
+    of those that have one
+    """
+    params = [
+        param for param in inspect.signature(f).parameters.values()
+        if param.kind in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ]
+    return (
+        tuple(param.name for param in params),
+        {
+            param.name: param.default
+            for param in params
+            if param.default is not inspect.Parameter.empty
+        })
+
+
+# There are few command builders, but publish() runs again for each call of
+# methods that decorate an inner function (e.g. Pipette.pick_up_tip)
+_get_command_params = functools.lru_cache(maxsize=None)(_get_params)
 
 
 publish.before = functools.partial(publish, before=True, after=False)
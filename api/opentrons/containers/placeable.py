@@ -3,6 +3,8 @@ import math
 import numbers
 import re
 import functools
+import weakref
+import numpy as np
 
 from collections import OrderedDict
 from itertools import chain
@@ -14,6 +16,60 @@ from opentrons.config import feature_flags as ff
 SUPPORTED_MODULES = ['magdeck', 'tempdeck']
 
 
+class _ReadOnlyDict(dict):
+    """
+    A dict that can't be modified, shared between placeables. Copying it
+    gives back the same instance, and unpickling it shares the table again
+    """
+    __slots__ = ('__weakref__',)
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('{} is read-only'.format(type(self).__name__))
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (_shared_properties, (dict(self),))
+
+
+class _NoChildren(_ReadOnlyDict):
+    __slots__ = ()
+
+    def __reduce__(self):
+        return '_NO_CHILDREN'
+
+
+# Shared by every Placeable until its first child is added, so that leaf
+# Wells do not each carry two empty OrderedDicts
+_NO_CHILDREN = _NoChildren()
+_ORIGIN = Vector(0, 0, 0)
+
+# Geometry tables shared by all Wells with identical properties, keyed by
+# their sorted items. A table is dropped once no Well holds it anymore
+_well_properties = weakref.WeakValueDictionary()
+
+
+def _shared_properties(properties):
+    """
+    The read-only table shared by all Wells with :properties:
+
+    Raises TypeError if :properties: has unhashable or unorderable values
+    """
+    key = tuple(sorted(properties.items()))
+    shared = _well_properties.get(key)
+    if shared is None:
+        shared = _ReadOnlyDict(properties)
+        _well_properties[key] = shared
+    return shared
+
+
 def unpack_location(location):
     """
     Returns (:Placeable:, :Vector:) tuple
@@ -75,6 +131,29 @@ def get_container(location):
             return obj
 
 
+def normalize_properties(properties):
+    """
+    Fills in width, length and height of :properties: in place from
+    radius, diameter and depth, defaulting missing dimensions to 0
+    """
+    if 'radius' in properties:
+        properties['width'] = properties['radius'] * 2
+        properties['length'] = properties['radius'] * 2
+
+    if 'diameter' in properties:
+        properties['width'] = properties['diameter']
+        properties['length'] = properties['diameter']
+
+    if 'depth' in properties:
+        properties['height'] = properties['depth']
+
+    for dimension in ['length', 'width', 'height']:
+        if dimension not in properties:
+            properties[dimension] = 0
+
+    return properties
+
+
 def humanize_location(location):
     well, _ = unpack_location(location)
     return repr(well)
@@ -91,6 +170,14 @@ class Placeable(object):
     * calculate coordinates in different reference systems
     """
 
+    __slots__ = (
+        'children_by_name',
+        'children_by_reference',
+        '_coordinates',
+        'parent',
+        'properties'
+    )
+
     def __init__(self, parent=None, properties=None):
         """
         Initiaize placeable.
@@ -101,32 +188,17 @@ class Placeable(object):
         """
 
         # For performance optimization reasons we are tracking children
-        # by name and by reference
-        self.children_by_name = OrderedDict()
-        self.children_by_reference = OrderedDict()
-        self._coordinates = Vector(0, 0, 0)
+        # by name and by reference. Both are allocated on first :add:
+        self.children_by_name = _NO_CHILDREN
+        self.children_by_reference = _NO_CHILDREN
+        self._coordinates = _ORIGIN
 
         self.parent = parent
 
         if properties is None:
             properties = {}
 
-        self.properties = properties
-
-        if 'radius' in properties:
-            properties['width'] = properties['radius'] * 2
-            properties['length'] = properties['radius'] * 2
-
-        if 'diameter' in properties:
-            properties['width'] = properties['diameter']
-            properties['length'] = properties['diameter']
-
-        if 'depth' in properties:
-            properties['height'] = properties['depth']
-
-        for dimension in ['length', 'width', 'height']:
-            if dimension not in properties:
-                properties[dimension] = 0
+        self.properties = normalize_properties(properties)
 
     def __getitem__(self, name):
         """
@@ -176,9 +248,8 @@ class Placeable(object):
         if not self.get_parent():
             raise Exception('Must have a parent')
 
-        children = self.parent.get_children_list()
-        my_loc = children.index(self)
-        return children[my_loc + 1]
+        my_loc = self.parent.get_index_from_name(self.get_name())
+        return self.parent[my_loc + 1]
 
     def iter(self):
         """
@@ -271,6 +342,9 @@ class Placeable(object):
         if coordinates:
             child._coordinates = Vector(coordinates)
         child.parent = self
+        if self.children_by_reference is _NO_CHILDREN:
+            self.children_by_name = OrderedDict()
+            self.children_by_reference = OrderedDict()
         self.children_by_name[name] = child
         self.children_by_reference[child] = name
 
@@ -424,12 +498,8 @@ class Placeable(object):
         If :reference: :Placeable: is provided, returns
         the :Vector: within :reference: coordinate system
         """
-        coordinates = self.from_center(
-            r=radius,
-            theta=(degrees / 180) * math.pi,
-            h=-1,
-            reference=reference)
-        return (self, coordinates + (0, 0, z))
+        x, y, h = self._polar_point(radius, degrees, -1, reference)
+        return (self, Vector(x, y, h + z))
 
     def top(self, z=0, radius=0, degrees=0, reference=None):
         """
@@ -439,12 +509,8 @@ class Placeable(object):
         If :reference: :Placeable: is provided, returns
         the :Vector: within :reference: coordinate system
         """
-        coordinates = self.from_center(
-            r=radius,
-            theta=(degrees / 180) * math.pi,
-            h=1,
-            reference=reference)
-        return (self, coordinates + (0, 0, z))
+        x, y, h = self._polar_point(radius, degrees, 1, reference)
+        return (self, Vector(x, y, h + z))
 
     def from_center(self, x=None, y=None, z=None, r=None,
                     theta=None, h=None, reference=None):
@@ -453,18 +519,72 @@ class Placeable(object):
         (:r:, :theta:, :h:) rations/angle for Polar and returns
         :Vector: using :reference: as origin
         """
-        coords_to_endpoint = None
-        if all([isinstance(i, numbers.Number) for i in (x, y, z)]):
-            coords_to_endpoint = self.from_cartesian(x, y, z)
-
         if all([isinstance(i, numbers.Number) for i in (r, theta, h)]):
-            coords_to_endpoint = self.from_polar(r, theta, h)
+            cx, cy, cz = self.geometry_center()
+            r = r * cx
+            point = (cx + r * math.cos(theta),
+                     cy + r * math.sin(theta),
+                     cz + cz * h)
+        elif all([isinstance(i, numbers.Number) for i in (x, y, z)]):
+            cx, cy, cz = self.geometry_center()
+            point = (cx + cx * x, cy + cy * y, cz + cz * z)
+        else:
+            raise ValueError(
+                'Expected numeric (x, y, z) or (r, theta, h)')
+
+        return Vector(self._to_reference(point, reference))
+
+    def geometry(self):
+        """
+        Returns the :WellGeometry: table of this Placeable's children,
+        *None* if it does not keep one
+        """
+        return None
 
-        coords_to_reference = Vector(0, 0, 0)
-        if reference:
-            coords_to_reference = self.coordinates(reference)
+    def geometry_center(self):
+        """
+        Returns the (x, y, z) center of a :Placeable: in its own
+        coordinates, looked up in the parent's :WellGeometry: if possible
+        """
+        parent = self.parent
+        geometry = parent.geometry() if parent is not None else None
+        if geometry is not None:
+            row = geometry.index.get(self)
+            if row is not None:
+                return geometry.center_rows[row]
+        return (self.x_size() / 2.0,
+                self.y_size() / 2.0,
+                self.z_size() / 2.0)
 
-        return coords_to_reference + coords_to_endpoint
+    def _polar_point(self, radius, degrees, h, reference):
+        """
+        Same as :from_center: with polar arguments, returning a tuple
+        """
+        cx, cy, cz = self.geometry_center()
+        if radius:
+            theta = (degrees / 180) * math.pi
+            r = radius * cx
+            cx, cy = cx + r * math.cos(theta), cy + r * math.sin(theta)
+        return self._to_reference((cx, cy, cz + cz * h), reference)
+
+    def _to_reference(self, point, reference):
+        """
+        Moves a (x, y, z) :point: in this Placeable's coordinates
+        into the :reference: coordinate system
+        """
+        if not reference:
+            return point
+
+        geometry = reference.geometry() if reference is self.parent else None
+        row = geometry.index.get(self) if geometry is not None else None
+        if row is None:
+            ox, oy, oz = self.coordinates(reference)
+        else:
+            # same as self.coordinates(reference), from the table
+            x, y, z = geometry.offset_rows[row]
+            rx, ry, rz = reference._coordinates
+            ox, oy, oz = x + rx, y + ry, z + rz
+        return (ox + point[0], oy + point[1], oz + point[2])
 
 
 class Deck(Placeable):
@@ -496,8 +616,19 @@ class Deck(Placeable):
 class Well(Placeable):
     """
     Class representing a Well
+
+    Wells of the same labware type share one read-only :properties:
+    table instead of each holding a copy
     """
-    pass
+    __slots__ = ()
+
+    def __init__(self, parent=None, properties=None):
+        super(Well, self).__init__(parent=parent, properties=properties)
+        try:
+            self.properties = _shared_properties(self.properties)
+        except TypeError:
+            # unhashable or unorderable values, keep a private table
+            pass
 
 
 class Slot(Placeable):
@@ -514,6 +645,56 @@ class Module(Placeable):
     stackable = True
 
 
+class WellGeometry(object):
+    """
+    Precomputed geometry of a :Container:'s children, one row per child
+    in the order they were added:
+
+    * :centers:, :tops:, :bottoms: in each child's own coordinates
+    * :offsets: of each child within the :Container:
+
+    :index: maps a child to its row. The same rows are kept as tuples of
+    floats for single lookups, which are cheaper than indexing NumPy
+    """
+    __slots__ = (
+        'index',
+        'centers',
+        'offsets',
+        'center_rows',
+        'offset_rows'
+    )
+
+    def __init__(self, children):
+        children = list(children)
+        self.index = {child: row for row, child in enumerate(children)}
+        self.centers = np.array(
+            [(c.x_size(), c.y_size(), c.z_size()) for c in children],
+            dtype=float).reshape(-1, 3) / 2.0
+        self.offsets = np.array(
+            [tuple(c._coordinates) for c in children],
+            dtype=float).reshape(-1, 3)
+        self.center_rows = [tuple(row) for row in self.centers.tolist()]
+        self.offset_rows = [tuple(row) for row in self.offsets.tolist()]
+
+    @property
+    def tops(self):
+        tops = self.centers.copy()
+        tops[:, 2] *= 2
+        return tops
+
+    @property
+    def bottoms(self):
+        bottoms = self.centers.copy()
+        bottoms[:, 2] = 0
+        return bottoms
+
+    def rows(self, children):
+        """
+        Returns the row numbers of :children:, for indexing the arrays
+        """
+        return [self.index[child] for child in children]
+
+
 class Container(Placeable):
     """
     Class representing a container, also implements grid behavior
@@ -523,7 +704,90 @@ class Container(Placeable):
         super(Container, self).__init__(*args, **kwargs)
         self.grid = None
         self.grid_transposed = None
-        self.ordering = None
+        self._children = None
+        self._ordering = None
+        self._geometry = None
+
+    def __getitem__(self, name):
+        if isinstance(name, int):
+            return self.get_children()[name]
+        return super(Container, self).__getitem__(name)
+
+    def __iter__(self):
+        return iter(self.get_children())
+
+    def __len__(self):
+        return len(self.get_children())
+
+    @property
+    def ordering(self):
+        """
+        Names of the wells as a list of columns, used to order children
+        with split labware definitions
+        """
+        return self._ordering
+
+    @ordering.setter
+    def ordering(self, ordering):
+        self._ordering = ordering
+        self._children = None
+
+    def add(self, child, name=None, coordinates=None):
+        super(Container, self).add(child, name, coordinates)
+        self._children = None
+        self.invalidate_geometry()
+
+    def get_children(self):
+        """
+        Returns the children as a tuple, in the same order as
+        :get_children_list:, without copying
+        """
+        split = ff.split_labware_definitions()
+        if self._children is None or self._children[0] != split:
+            if split:
+                names = list(chain.from_iterable(self.ordering))
+                children = tuple(self.get_child_by_name(n) for n in names)
+            else:
+                names = list(self.children_by_name)
+                children = tuple(self.children_by_reference)
+            index = {name: i for i, name in reversed(list(enumerate(names)))}
+            self._children = (split, children, index)
+        return self._children[1]
+
+    def get_index_from_name(self, name):
+        """
+        Retrieves child's index by name
+        """
+        self.get_children()
+        try:
+            return self._children[2][name]
+        except KeyError:
+            raise ValueError('{} is not in {}'.format(name, self))
+
+    def get_children_from_slice(self, s):
+        if isinstance(s.start, str):
+            s = slice(
+                self.get_index_from_name(s.start), s.stop, s.step)
+        if isinstance(s.stop, str):
+            s = slice(
+                s.start, self.get_index_from_name(s.stop), s.step)
+        return WellSeries(list(self.get_children()[s]))
+
+    def geometry(self):
+        """
+        Returns the :WellGeometry: of this Container's children,
+        calculating it on first use
+        """
+        if self._geometry is None:
+            self._geometry = WellGeometry(self.children_by_reference)
+        return self._geometry
+
+    def invalidate_geometry(self):
+        """
+        Invalidates the pre-calculated :WellGeometry:, must be called
+        whenever children are moved
+        """
+        self._geometry = None
 
     def invalidate_grid(self):
         """
@@ -680,10 +944,7 @@ class Container(Placeable):
         return self.wells(*args, **kwargs)
 
     def get_children_list(self):
-        if ff.split_labware_definitions():
-            return [self[i] for i in list(chain.from_iterable(self.ordering))]
-        else:
-            return super(Container, self).get_children_list()
+        return list(self.get_children())
 
     def _parse_wells_to_and_length(self, *args, **kwargs):
         start = args[0] if len(args) else 0
@@ -691,12 +952,10 @@ class Container(Placeable):
         step = kwargs.get('step', 1)
         length = kwargs.get('length', 1)
 
-        wrapped_wells = [
-            w
-            for i in range(3)
-            for w in self.get_children_list()
-        ]
-        total_kids = len(self.get_children_list())
+        # children repeated three times, as indexes into the children
+        children = self.get_children()
+        total_kids = len(children)
+        wrapped_wells = range(total_kids * 3)
 
         if isinstance(start, str):
             start = self.get_index_from_name(start)
@@ -709,14 +968,13 @@ class Container(Placeable):
             elif stop < start:
                 stop -= 1
                 step = step * -1 if step > 0 else step
-            return WellSeries(
-                wrapped_wells[start + total_kids:stop + total_kids:step])
+            indexes = wrapped_wells[start + total_kids:stop + total_kids:step]
         else:
             if length < 0:
                 length *= -1
                 step = step * -1 if step > 0 else step
-            return WellSeries(
-                wrapped_wells[start + total_kids::step][:length])
+            indexes = wrapped_wells[start + total_kids::step][:length]
+        return WellSeries([children[i % total_kids] for i in indexes])
 
     def _parse_wells_x_y(self, *args, **kwargs):
         x = kwargs.get('x', None)
@@ -745,14 +1003,23 @@ class WellSeries(Container):
 
     def __init__(self, wells, name=None):
         if isinstance(wells, dict):
-            self.items = wells
+            self._items = wells
             self.values = list(wells.values())
         else:
-            self.items = {w.get_name(): w for w in wells}
+            # built on first name lookup, slicing only needs :values:
+            self._items = None
             self.values = wells
+        # (children, name -> index), built on first indexed access
+        self._children = None
         self.offset = 0
         self.name = name
 
+    @property
+    def items(self):
+        if self._items is None:
+            self._items = {w.get_name(): w for w in self.values}
+        return self._items
+
     def set_offset(self, offset):
         """
         Set index of a well that will be used to mimic :Placeable:
@@ -788,6 +1055,26 @@ class WellSeries(Container):
                 return name
         return None
 
+    def get_children(self):
+        if self._children is None:
+            children = tuple(self.values)
+            position = {}
+            for i, child in enumerate(children):
+                position.setdefault(id(child), i)
+            index = {
+                name: position[id(child)]
+                for name, child in self.items.items()
+                if id(child) in position}
+            self._children = (children, index)
+        return self._children[0]
+
+    def get_index_from_name(self, name):
+        self.get_children()
+        try:
+            return self._children[1][name]
+        except KeyError:
+            raise ValueError('{} is not in {}'.format(name, self))
+
     def get_children_list(self):
         return list(self.values)
 
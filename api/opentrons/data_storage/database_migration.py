@@ -30,6 +30,7 @@ def add_offset(container):
         dx = x + old_x
         dy = y + old_y
         well._coordinates = Vector(dx, dy, z)
+    container.invalidate_geometry()
 
     return container
 
@@ -40,6 +41,7 @@ def rotate_container_for_alpha(container):
     # Change container coordinates to be at the origin + top of container
     container._coordinates = Vector(0, 0, z)
     transpose_coordinates([well for well in container.wells()])
+    container.invalidate_geometry()
 
     return container
 
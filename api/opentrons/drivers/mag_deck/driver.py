@@ -1,3 +1,4 @@
+import asyncio
 from os import environ
 import logging
 from threading import Event
@@ -6,6 +7,8 @@ from time import sleep
 from serial.serialutil import SerialException
 
 from opentrons.drivers import serial_communication
+from opentrons.drivers.response_parsers import (
+    ParseError, parse_device_info, parse_distance)
 from opentrons.drivers.serial_communication import SerialNoResponse
 
 '''
@@ -51,100 +54,6 @@ class MagDeckError(Exception):
     pass
 
 
-class ParseError(Exception):
-    pass
-
-
-def _parse_string_value_from_substring(substring) -> str:
-    '''
-    Returns the ascii value in the expected string "N:aa11bb22", where "N" is
-    the key, and "aa11bb22" is string value to be returned
-    '''
-    try:
-        value = substring.split(':')[1]
-        return str(value)
-    except (ValueError, IndexError, TypeError, AttributeError):
-        log.exception('Unexpected arg to _parse_string_value_from_substring:')
-        raise ParseError(
-            'Unexpected arg to _parse_string_value_from_substring: {}'.format(
-                substring))
-
-
-def _parse_number_from_substring(substring) -> float:
-    '''
-    Returns the number in the expected string "N:12.3", where "N" is the
-    key, and "12.3" is a floating point value
-
-    For the temp-deck's temperature response, one expected input is something
-    like "T:none", where "none" should return a None value
-    '''
-    try:
-        value = substring.split(':')[1]
-        if value.strip().lower() == 'none':
-            return None
-        return round(float(value), GCODE_ROUNDING_PRECISION)
-    except (ValueError, IndexError, TypeError, AttributeError):
-        log.exception('Unexpected argument to _parse_number_from_substring:')
-        raise ParseError(
-            'Unexpected argument to _parse_number_from_substring: {}'.format(
-                substring))
-
-
-def _parse_key_from_substring(substring) -> str:
-    '''
-    Returns the key in the expected string "N:12.3", where "N" is the
-    key, and "12.3" is a floating point value
-    '''
-    try:
-        return substring.split(':')[0]
-    except (ValueError, IndexError, TypeError, AttributeError):
-        log.exception('Unexpected argument to _parse_key_from_substring:')
-        raise ParseError(
-            'Unexpected argument to _parse_key_from_substring: {}'.format(
-                substring))
-
-
-def _parse_device_information(device_info_string) -> dict:
-    '''
-    Parse the mag-deck's device information response.
-    Example response from temp-deck: "serial:aa11 model:bb22 version:cc33"
-    '''
-    error_msg = 'Unexpected argument to _parse_device_information: {}'.format(
-        device_info_string)
-    if not device_info_string or \
-            not isinstance(device_info_string, str):
-        raise ParseError(error_msg)
-    parsed_values = device_info_string.strip().split(' ')
-    if len(parsed_values) < 3:
-        log.error(error_msg)
-        raise ParseError(error_msg)
-    res = {
-        _parse_key_from_substring(s): _parse_string_value_from_substring(s)
-        for s in parsed_values[:3]
-    }
-    for key in ['model', 'version', 'serial']:
-        if key not in res:
-            raise ParseError(error_msg)
-    return res
-
-
-def _parse_distance_response(distance_string) -> float:
-    '''
-    Parse responses of 'GET_PLATE_HEIGHT' & 'GET_CURRENT_POSITION'
-    Example response of-
-    GET_PLATE_HEIGHT: "height:12.34"
-    GET_CURRENT_POSITION: "Z:12.34"
-    '''
-    err_msg = 'Unexpected argument to _parse_distance_response: {}'.format(
-        distance_string)
-    if not distance_string or \
-            not isinstance(distance_string, str):
-        raise ParseError(err_msg)
-    if 'Z' not in distance_string and 'height' not in distance_string:
-        raise ParseError(err_msg)
-    return _parse_number_from_substring(distance_string.strip())
-
-
 class MagDeck:
     def __init__(self, config={}):
         self.run_flag = Event()
@@ -250,6 +159,18 @@ class MagDeck:
             return str(e)
         return ''
 
+    async def move_async(self, position_mm, loop=None) -> str:
+        '''
+        Non-blocking move(), returns once the magnets reach position_mm
+        '''
+        try:
+            position_mm = round(float(position_mm), GCODE_ROUNDING_PRECISION)
+            await self._send_command_async(
+                '{0} Z{1}'.format(GCODES['MOVE'], position_mm), loop=loop)
+        except (MagDeckError, SerialException, SerialNoResponse) as e:
+            return str(e)
+        return ''
+
     def get_device_info(self) -> dict:
         '''
         Queries Temp-Deck for it's build version, model, and serial number
@@ -316,7 +237,32 @@ class MagDeck:
         command_line = command + ' ' + MAG_DECK_COMMAND_TERMINATOR
         ret_code = self._recursive_write_and_return(
             command_line, timeout, DEFAULT_COMMAND_RETRIES)
+        return self._check_response(ret_code)
 
+    async def _send_command_async(
+            self, command, timeout=DEFAULT_MAG_DECK_TIMEOUT, loop=None):
+        command_line = command + ' ' + MAG_DECK_COMMAND_TERMINATOR
+        retries = DEFAULT_COMMAND_RETRIES
+        while True:
+            try:
+                ret_code = await serial_communication.write_and_return_async(
+                    command_line,
+                    MAG_DECK_ACK,
+                    self._connection,
+                    timeout,
+                    loop=loop)
+                break
+            except SerialNoResponse:
+                retries -= 1
+                if retries <= 0:
+                    raise
+                await asyncio.sleep(DEFAULT_STABILIZE_DELAY)
+                if self._connection:
+                    self._connection.close()
+                    self._connection.open()
+        return self._check_response(ret_code)
+
+    def _check_response(self, ret_code):
         # Smoothieware returns error state if a switch was hit while moving
         if (ERROR_KEYWORD in ret_code.lower()) or \
                 (ALARM_KEYWORD in ret_code.lower()):
@@ -349,7 +295,7 @@ class MagDeck:
     def _update_plate_height(self) -> str:
         try:
             res = self._send_command(GCODES['GET_PLATE_HEIGHT'])
-            distance = _parse_distance_response(res)
+            distance = parse_distance(res)
         except (MagDeckError, SerialException, SerialNoResponse) as e:
             return str(e)
         self._plate_height = distance
@@ -358,7 +304,7 @@ class MagDeck:
     def _update_mag_position(self) -> str:
         try:
             res = self._send_command(GCODES['GET_CURRENT_POSITION'])
-            distance = _parse_distance_response(res)
+            distance = parse_distance(res)
         except (MagDeckError, SerialException, SerialNoResponse) as e:
             return str(e)
         self._mag_position = distance
@@ -367,7 +313,7 @@ class MagDeck:
     def _recursive_get_info(self, retries) -> dict:
         try:
             device_info = self._send_command(GCODES['DEVICE_INFO'])
-            return _parse_device_information(device_info)
+            return parse_device_info(device_info)
         except ParseError as e:
             retries -= 1
             if retries <= 0:
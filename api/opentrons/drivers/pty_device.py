@@ -0,0 +1,79 @@
+import logging
+import os
+import select
+import tty
+from threading import Event, Thread
+
+log = logging.getLogger(__name__)
+
+POLL_INTERVAL = 0.05
+
+
+class PtyDevice:
+    """
+    Fake serial device behind a pseudo-terminal, for exercising drivers
+    and serial transports without hardware (POSIX only).
+
+    Open :attr:`port` like any serial port. Each line written to it is
+    passed to :handler: without its line ending, and whatever string the
+    handler returns is written back. Lines are handled in order on a
+    background thread, so both blocking and asyncio clients can use it.
+
+    >>> device = PtyDevice(lambda line: 'ok\\r\\n')  # doctest: +SKIP
+    >>> with device:  # doctest: +SKIP
+    ...     connection = serial_communication.connect(port=device.port)
+    """
+    def __init__(self, handler):
+        self.handler = handler
+        self.port = None
+        self._master = None
+        self._slave = None
+        self._thread = None
+        self._stop_event = Event()
+
+    def start(self):
+        self._master, self._slave = os.openpty()
+        # no echo or newline translation, like a real device
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+        self._stop_event.clear()
+        self._thread = Thread(target=self._serve, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        for fd in (self._master, self._slave):
+            if fd is not None:
+                os.close(fd)
+        self._master = self._slave = None
+
+    def write(self, data):
+        """ Sends unsolicited :data: to whoever has the port open """
+        os.write(self._master, data.encode())
+
+    def _serve(self):
+        received = b''
+        while not self._stop_event.is_set():
+            readable, _, _ = select.select(
+                [self._master], [], [], POLL_INTERVAL)
+            if not readable:
+                continue
+            try:
+                received += os.read(self._master, 1024)
+            except OSError:
+                break
+            *lines, received = received.split(b'\n')
+            for line in lines:
+                response = self.handler(line.rstrip(b'\r').decode())
+                if response:
+                    self.write(response)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
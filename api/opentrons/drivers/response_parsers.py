@@ -0,0 +1,165 @@
+"""
+Parsers for the replies of Smoothieware and the Temp-Deck and Mag-Deck
+firmware, shared by their drivers.
+
+Each parser scans its reply once with a precompiled pattern and raises
+:class:`ParseError` unless every expected value is present and
+well-formed. Numbers are rounded to GCODE_ROUNDING_PRECISION digits.
+"""
+import re
+from typing import Dict, Optional
+
+GCODE_ROUNDING_PRECISION = 3
+
+SMOOTHIE_AXES = 'XYZABC'
+
+_NUMBER = r'[-+]?(?:\d+(?:\.\d*)?|\.\d+)'
+
+# a whole word like "X:12.3", Smoothieware sometimes adds a trailing ":"
+_AXIS_VALUE_RE = re.compile(
+    r'(?<!\S)([XYZABCxyzabc]):({}):?(?!\S)'.format(_NUMBER))
+# M114.2 reports every axis in this order, so one search finds them all
+_POSITION_RE = re.compile(r'\s+'.join(
+    r'(?<!\S){}:({}):?(?!\S)'.format(axis, _NUMBER)
+    for axis in SMOOTHIE_AXES))
+_SWITCH_RE = re.compile(
+    r'(?<!\S)([XYZABC])_max:({0})(?!\S)|(?<!\S)Probe:\s*({0})(?!\S)'.format(
+        _NUMBER))
+_TEMPERATURE_RE = re.compile(
+    r'(?<!\S)([TC]):((?i:none)|{})(?!\S)'.format(_NUMBER))
+_DEVICE_INFO_RE = re.compile(r'(?<!\S)(serial|model|version):(\S*)')
+_DISTANCE_RE = re.compile(
+    r'(?<!\S)(?:Z|height):\s*({})(?!\S)'.format(_NUMBER))
+
+_LINE_BREAKS = str.maketrans('', '', '\r\n')
+
+
+class ParseError(Exception):
+    pass
+
+
+def _unexpected(parser, response):
+    return ParseError('Unexpected argument to {}: {}'.format(
+        parser, response))
+
+
+def _number(value):
+    return round(float(value), GCODE_ROUNDING_PRECISION)
+
+
+def _check_response(parser, response):
+    if not response or not isinstance(response, str):
+        raise _unexpected(parser, response)
+
+
+def parse_position(response) -> Dict[str, float]:
+    '''
+    Parses Smoothieware's reply to M114.2 into the coordinate of each axis
+
+    Example input: "ok MCS: X:418.0000 Y:353.0000 Z:218.0000 A:218.0000
+    B:19.0000 C:19.0000"
+    '''
+    _check_response('parse_position', response)
+    match = _POSITION_RE.search(response)
+    if match:
+        return dict(zip(SMOOTHIE_AXES, map(_number, match.groups())))
+    res = {
+        axis.upper(): _number(value)
+        for axis, value in _AXIS_VALUE_RE.findall(response)
+    }
+    if len(res) != len(SMOOTHIE_AXES):
+        raise _unexpected('parse_position', response)
+    return res
+
+
+def parse_homing_status(response) -> Dict[str, bool]:
+    '''
+    Parses Smoothieware's reply to G28.6 into whether each axis is homed
+
+    Example input: "X:1 Y:0 Z:0 A:0 B:0 C:0"
+    '''
+    _check_response('parse_homing_status', response)
+    res = {
+        axis.upper(): bool(float(value))
+        for axis, value in _AXIS_VALUE_RE.findall(response)
+    }
+    if len(res) != len(SMOOTHIE_AXES):
+        raise _unexpected('parse_homing_status', response)
+    return res
+
+
+def parse_switches(response) -> Dict[str, bool]:
+    '''
+    Parses Smoothieware's reply to M119 into whether each axis' limit
+    switch and the probe are triggered
+
+    Example input: "X_max:0 Y_max:0 Z_max:0 A_max:0 B_max:0 C_max:0
+    (AL)2.01:0 (BL)2.01:0 (CL)2.01:0 Probe: 0"
+    '''
+    _check_response('parse_switches', response)
+    res = {}
+    for axis, axis_value, probe_value in _SWITCH_RE.findall(response):
+        if axis:
+            res[axis] = bool(float(axis_value))
+        else:
+            res['Probe'] = bool(float(probe_value))
+    if len(res) != len(SMOOTHIE_AXES) + 1:
+        raise _unexpected('parse_switches', response)
+    return res
+
+
+def parse_temperature(response) -> Dict[str, Optional[float]]:
+    '''
+    Parses the Temp-Deck's reply to M105 into its current and target
+    temperatures. The target is None if no temperature is set
+
+    Example input: "T:none C:25"
+    '''
+    _check_response('parse_temperature', response)
+    res = {
+        key: None if value.lower() == 'none' else _number(value)
+        for key, value in _TEMPERATURE_RE.findall(response)
+    }
+    if len(res) != 2:
+        raise _unexpected('parse_temperature', response)
+    return {'current': res['C'], 'target': res['T']}
+
+
+def parse_device_info(response) -> Dict[str, str]:
+    '''
+    Parses a module's reply to M115 into its serial, model and version
+
+    Example input: "serial:aa11 model:bb22 version:cc33"
+    '''
+    _check_response('parse_device_info', response)
+    res = dict(_DEVICE_INFO_RE.findall(response))
+    if len(res) != 3:
+        raise _unexpected('parse_device_info', response)
+    return res
+
+
+def parse_distance(response) -> float:
+    '''
+    Parses the Mag-Deck's reply to M836 (plate height) or M114.2 (magnet
+    position) into millimeters
+
+    Example inputs: "height:12.34", "Z:12.34"
+    '''
+    _check_response('parse_distance', response)
+    match = _DISTANCE_RE.search(response)
+    if not match:
+        raise _unexpected('parse_distance', response)
+    return _number(match.group(1))
+
+
+def remove_echo(command, response) -> str:
+    '''
+    Smoothieware can enter a weird state, where it repeats back the sent
+    command at the beginning of its response. Strips each word of
+    :command: echoed in :response:, and all line breaks
+    '''
+    for word in command.strip().split(' '):
+        word = word.strip()
+        if word and word in response:
+            response = response.replace(word, '')
+    return response.translate(_LINE_BREAKS)
@@ -1,7 +1,10 @@
+import asyncio
 import serial
 from serial.tools import list_ports
 import contextlib
 import logging
+import threading
+import weakref
 
 log = logging.getLogger(__name__)
 
@@ -9,6 +12,9 @@ RECOVERY_TIMEOUT = 10
 DEFAULT_SERIAL_TIMEOUT = 5
 DEFAULT_WRITE_TIMEOUT = 30
 
+_port_locks = weakref.WeakKeyDictionary()
+_port_locks_lock = threading.Lock()
+
 
 class SerialNoResponse(Exception):
     pass
@@ -41,6 +47,37 @@ def serial_with_temp_timeout(serial_connection, timeout):
     serial_connection.timeout = saved_timeout
 
 
+def port_lock(serial_connection):
+    '''
+    Returns the lock every function here holds while using
+    :serial_connection:, so that threads and coroutines sharing a port
+    don't interleave their commands and responses
+    '''
+    with _port_locks_lock:
+        lock = _port_locks.get(serial_connection)
+        if lock is None:
+            lock = _port_locks[serial_connection] = threading.Lock()
+    return lock
+
+
+async def _acquire_async(lock, loop=None):
+    '''
+    Takes :lock: without stalling the event loop. A busy lock is waited for
+    in the loop's default executor, which holds one of its threads until
+    the port is free
+    '''
+    if lock.acquire(blocking=False):
+        return
+    loop = loop or asyncio.get_event_loop()
+    acquiring = loop.run_in_executor(None, lock.acquire)
+    try:
+        await asyncio.shield(acquiring, loop=loop)
+    except asyncio.CancelledError:
+        # the executor still takes the lock, give it back once it has
+        acquiring.add_done_callback(lambda _: lock.release())
+        raise
+
+
 def _parse_serial_response(response, ack):
     if ack in response:
         parsed_response = response.split(ack)[0]
@@ -50,7 +87,8 @@ def _parse_serial_response(response, ack):
 
 
 def clear_buffer(serial_connection):
-    serial_connection.reset_input_buffer()
+    with port_lock(serial_connection):
+        serial_connection.reset_input_buffer()
 
 
 def _write_to_device_and_return(cmd, ack, device_connection):
@@ -72,6 +110,107 @@ def _write_to_device_and_return(cmd, ack, device_connection):
     return ''
 
 
+def write(command, serial_connection):
+    '''Write a command without waiting for its response'''
+    log.debug('Write -> {}'.format(command.encode()))
+    with port_lock(serial_connection):
+        serial_connection.write(command.encode())
+
+
+def read_until(ack, serial_connection, timeout=DEFAULT_WRITE_TIMEOUT):
+    '''Read up to and including :ack:, and return the response before it'''
+    with port_lock(serial_connection), serial_with_temp_timeout(
+            serial_connection, timeout) as device_connection:
+        response = device_connection.read_until(ack.encode())
+    log.debug('Read <- {}'.format(response))
+    if ack.encode() not in response:
+        raise SerialNoResponse(
+            'No response from serial port after {} second(s)'.format(
+                timeout))
+    clean_response = _parse_serial_response(response, ack.encode())
+    if clean_response:
+        return clean_response.decode()
+    return ''
+
+
+class _AckReader:
+    '''
+    Collects what a serial connection receives, while an event loop watches
+    its file descriptor, until the response ends with :ack:. Like
+    `read_until`, it reads one byte at a time so that whatever follows the
+    ack stays on the port for the next reader
+    '''
+    def __init__(self, serial_connection, ack, loop):
+        self._connection = serial_connection
+        self._ack = ack.encode()
+        self._response = bytearray()
+        self.response = loop.create_future()
+
+    def data_received(self):
+        if self.response.done():
+            return
+        try:
+            while self._connection.in_waiting:
+                self._response += self._connection.read(1)
+                if self._response.endswith(self._ack):
+                    self.response.set_result(bytes(self._response))
+                    return
+        except Exception as e:
+            self.response.set_exception(e)
+
+
+async def read_until_async(
+        ack, serial_connection, timeout=DEFAULT_WRITE_TIMEOUT, loop=None):
+    '''
+    Non-blocking :func:`read_until`: waits for :ack: on :serial_connection:
+    without tying up a thread, and returns the response before it
+    '''
+    loop = loop or asyncio.get_event_loop()
+    lock = port_lock(serial_connection)
+    await _acquire_async(lock, loop=loop)
+    try:
+        return await _read_until_async(ack, serial_connection, timeout, loop)
+    finally:
+        lock.release()
+
+
+async def _read_until_async(ack, serial_connection, timeout, loop):
+    reader = _AckReader(serial_connection, ack, loop)
+    fd = serial_connection.fileno()
+    loop.add_reader(fd, reader.data_received)
+    try:
+        # bytes received before the reader was added don't wake the loop
+        reader.data_received()
+        response = await asyncio.wait_for(reader.response, timeout)
+    except asyncio.TimeoutError:
+        raise SerialNoResponse(
+            'No response from serial port after {} second(s)'.format(
+                timeout))
+    finally:
+        loop.remove_reader(fd)
+    log.debug('Read <- {}'.format(response))
+    clean_response = _parse_serial_response(response, ack.encode())
+    if clean_response:
+        return clean_response.decode()
+    return ''
+
+
+async def write_and_return_async(
+        command, ack, serial_connection, timeout=DEFAULT_WRITE_TIMEOUT,
+        loop=None):
+    '''Non-blocking :func:`write_and_return`'''
+    loop = loop or asyncio.get_event_loop()
+    lock = port_lock(serial_connection)
+    await _acquire_async(lock, loop=loop)
+    try:
+        serial_connection.reset_input_buffer()
+        log.debug('Write -> {}'.format(command.encode()))
+        serial_connection.write(command.encode())
+        return await _read_until_async(ack, serial_connection, timeout, loop)
+    finally:
+        lock.release()
+
+
 def _connect(port_name, baudrate):
     ser = serial.Serial(
         port=port_name,
@@ -98,9 +237,9 @@ def _attempt_command_recovery(command, ack, serial_conn):
 def write_and_return(
         command, ack, serial_connection, timeout=DEFAULT_WRITE_TIMEOUT):
     '''Write a command and return the response'''
-    clear_buffer(serial_connection)
-    with serial_with_temp_timeout(
+    with port_lock(serial_connection), serial_with_temp_timeout(
             serial_connection, timeout) as device_connection:
+        device_connection.reset_input_buffer()
         response = _write_to_device_and_return(command, ack, device_connection)
     return response
 
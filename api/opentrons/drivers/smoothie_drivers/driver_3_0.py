@@ -1,3 +1,4 @@
+import asyncio
 from os import environ
 import logging
 from time import sleep
@@ -6,7 +7,12 @@ from typing import Dict
 
 from serial.serialutil import SerialException
 
-from opentrons.drivers import serial_communication
+from opentrons.drivers import response_parsers, serial_communication
+from opentrons.drivers.response_parsers import ParseError
+from opentrons.drivers.smoothie_drivers import motion
+from opentrons.drivers.smoothie_drivers.position_history import (
+    PositionHistory, DEFAULT_HISTORY_SIZE
+)
 from opentrons.drivers.rpi_drivers import gpio
 '''
 - Driver is responsible for providing an interface for motion control
@@ -60,6 +66,10 @@ SEC_PER_MIN = 60
 
 DEFAULT_SMOOTHIE_TIMEOUT = 1
 DEFAULT_MOVEMENT_TIMEOUT = 30
+# moves time out after their estimated duration times this factor, plus the
+# margin in seconds, which accounts for serial latency and current dwells
+MOVEMENT_TIMEOUT_FACTOR = 1.5
+MOVEMENT_TIMEOUT_MARGIN = 5
 SMOOTHIE_BOOT_TIMEOUT = 3
 DEFAULT_STABILIZE_DELAY = 0.1
 
@@ -84,7 +94,8 @@ GCODES = {'HOME': 'G28.2',
           'SET_MAX_SPEED': 'M203.1',
           'SET_CURRENT': 'M907',
           'DISENGAGE_MOTOR': 'M18',
-          'HOMING_STATUS': 'G28.6'}
+          'HOMING_STATUS': 'G28.6',
+          'WAIT': 'M400'}
 
 # Number of digits after the decimal point for coordinates being sent
 # to Smoothie
@@ -93,59 +104,28 @@ GCODE_ROUNDING_PRECISION = 3
 SMOOTHIE_COMMAND_TERMINATOR = 'M400\r\n\r\n'
 SMOOTHIE_ACK = 'ok\r\nok\r\n'
 
+# In streaming mode moves are sent as single lines without M400, and each
+# line is acknowledged with a single 'ok' once it is in the planner queue
+SMOOTHIE_STREAM_ACK = 'ok\r\n'
+# Most streamed lines waiting for their 'ok', keeps them within
+# Smoothieware's serial receive buffer
+STREAMING_WINDOW = 4
+
 
 class SmoothieError(Exception):
     pass
 
 
-class ParseError(Exception):
-    pass
-
+# module attributes, so tests can patch them
+_parse_position_response = response_parsers.parse_position
+_parse_switch_values = response_parsers.parse_switches
+_parse_homing_status_values = response_parsers.parse_homing_status
 
-def _parse_number_from_substring(smoothie_substring):
-    '''
-    Returns the number in the expected string "N:12.3", where "N" is the
-    axis, and "12.3" is a floating point value for the axis' position
-    '''
-    try:
-        return round(
-            float(smoothie_substring.split(':')[1]),
-            GCODE_ROUNDING_PRECISION
-        )
-    except (ValueError, IndexError, TypeError, AttributeError):
-        log.exception('Unexpected argument to _parse_number_from_substring:')
-        raise ParseError(
-            'Unexpected argument to _parse_number_from_substring: {}'.format(
-                smoothie_substring))
 
-
-def _parse_axis_from_substring(smoothie_substring):
-    '''
-    Returns the axis in the expected string "N:12.3", where "N" is the
-    axis, and "12.3" is a floating point value for the axis' position
-    '''
-    try:
-        return smoothie_substring.split(':')[0].title()  # upper 1st letter
-    except (ValueError, IndexError, TypeError, AttributeError):
-        log.exception('Unexpected argument to _parse_axis_from_substring:')
-        raise ParseError(
-            'Unexpected argument to _parse_axis_from_substring: {}'.format(
-                smoothie_substring))
-
-
-def _parse_position_response(raw_axis_values):
-    parsed_values = raw_axis_values.strip().split(' ')
-    if len(parsed_values) < 8:
-        msg = 'Unexpected response in _parse_position_response: {}'.format(
-            raw_axis_values)
-        log.error(msg)
-        raise ParseError(msg)
-
-    data = {
-        _parse_axis_from_substring(s): _parse_number_from_substring(s)
-        for s in parsed_values[2:]  # remove first two items ('ok', 'MCS:')
-    }
-    return data
+def _is_error_response(ret_code):
+    # Smoothieware returns error state if a switch was hit while moving
+    return (ERROR_KEYWORD in ret_code.lower()) or \
+        (ALARM_KEYWORD in ret_code.lower())
 
 
 def _parse_instrument_data(smoothie_response):
@@ -190,69 +170,16 @@ def _byte_array_to_hex_string(byte_array):
     return res
 
 
-def _parse_switch_values(raw_switch_values):
-    if not raw_switch_values or not isinstance(raw_switch_values, str):
-        raise ParseError(
-            'Unexpected argument to _parse_switch_values: {}'.format(
-                raw_switch_values))
-
-    # probe has a space after it's ":" for some reason
-    if 'Probe: ' in raw_switch_values:
-        raw_switch_values = raw_switch_values.replace('Probe: ', 'Probe:')
-
-    parsed_values = raw_switch_values.strip().split(' ')
-    res = {
-        _parse_axis_from_substring(s): bool(_parse_number_from_substring(s))
-        for s in parsed_values
-        if any([n in s for n in ['max', 'Probe']])
-    }
-    # remove the extra "_max" character from each axis key in the dict
-    res = {
-        key.split('_')[0]: val
-        for key, val in res.items()
-    }
-    if len((list(AXES) + ['Probe']) & res.keys()) != 7:
-        raise ParseError(
-            'Unexpected argument to _parse_switch_values: {}'.format(
-                raw_switch_values))
-    return res
-
-
-def _parse_homing_status_values(raw_homing_status_values):
-    '''
-        Parse the Smoothieware response to a G28.6 command (homing-status)
-        A "1" means it has been homed, and "0" means it has not been homed
-
-        Example response after homing just X axis:
-        "X:1 Y:0 Z:0 A:0 B:0 C:0"
-
-        returns: dict
-            Key is axis, value is True if the axis needs to be homed
-    '''
-    if not raw_homing_status_values or \
-            not isinstance(raw_homing_status_values, str):
-        raise ParseError(
-            'Unexpected argument to _parse_homing_status_values: {}'.format(
-                raw_homing_status_values))
-    parsed_values = raw_homing_status_values.strip().split(' ')
-    res = {
-        _parse_axis_from_substring(s): bool(_parse_number_from_substring(s))
-        for s in parsed_values
-    }
-    if len(list(AXES) & res.keys()) != 6:
-        raise ParseError(
-            'Unexpected argument to _parse_homing_status_values: {}'.format(
-                raw_homing_status_values))
-    return res
-
-
 class SmoothieDriver_3_0_0:
-    def __init__(self, config):
+    def __init__(self, config, history_size=DEFAULT_HISTORY_SIZE,
+                 history_path=None):
         self.run_flag = Event()
         self.run_flag.set()
 
         self._position = HOMED_POSITION.copy()
-        self.log = []
+        # the most recent positions, see PositionHistory
+        self.log = PositionHistory(
+            AXES, size=history_size, spill_path=history_path)
 
         # why do we do this after copying the HOMED_POSITION?
         self._update_position({axis: 0 for axis in AXES})
@@ -261,6 +188,21 @@ class SmoothieDriver_3_0_0:
         self._connection = None
         self._config = config
 
+        # estimated seconds the commands run while simulating would have
+        # taken on a robot, see advance_clock()
+        self.simulated_time = 0.0
+
+        # Streaming mode, see set_streaming()
+        self._streaming = False
+        self._streamed = False  # moves were streamed since the last M400
+        self._unacked_lines = 0
+        # estimated seconds the moves streamed since the last M400 take
+        self._streamed_duration = 0.0
+        # currents Smoothieware was last told to use, None if unknown
+        self._sent_current = None
+        # currents set by the last generated M907, not yet acknowledged
+        self._pending_current = None
+
         # Current settings:
         # The amperage of each axis, has been organized into three states:
         # Current-Settings is the amperage each axis was last set to
@@ -297,8 +239,13 @@ class SmoothieDriver_3_0_0:
         self._max_speed_settings = config.default_max_speed.copy()
         self._saved_max_speed_settings = self._max_speed_settings.copy()
         self._combined_speed = float(DEFAULT_AXES_SPEED)
+        self._acceleration = motion.parse_acceleration(config.acceleration)
         self._saved_axes_speed = float(self._combined_speed)
 
+        # speed settings waiting to be sent with the next command, see flush()
+        self._buffered_speed = None
+        self._buffered_max_speed = {}
+
         # position after homing
         self._homed_position = HOMED_POSITION.copy()
         self.homed_flags = {}
@@ -321,7 +268,7 @@ class SmoothieDriver_3_0_0:
             for axis, value in target.items() if value is not None
         })
 
-        self.log += [self._position.copy()]
+        self.log.append(self._position)
 
     def update_position(self, default=None):
         if default is None:
@@ -349,6 +296,29 @@ class SmoothieDriver_3_0_0:
 
         self._update_position(updated_position)
 
+    async def update_position_async(self, loop=None):
+        '''
+        Non-blocking `update_position()`, reading the position from
+        Smoothieware on the event loop
+        '''
+        if self.simulating:
+            return
+
+        retries = DEFAULT_COMMAND_RETRIES
+        while True:
+            position_response = await self._send_command_async(
+                GCODES['CURRENT_POSITION'], loop=loop)
+            try:
+                updated_position = _parse_position_response(position_response)
+                break
+            except ParseError:
+                retries -= 1
+                if retries <= 0:
+                    raise
+                await asyncio.sleep(DEFAULT_STABILIZE_DELAY)
+
+        self._update_position(updated_position)
+
     def read_pipette_id(self, mount):
         '''
         Reads in an attached pipette's UUID
@@ -437,6 +407,8 @@ class SmoothieDriver_3_0_0:
             self._connection.close()
         self._connection = None
         self.simulating = True
+        self._clear_stream()
+        self.log.flush()
 
     def is_connected(self):
         if not self._connection:
@@ -552,17 +524,46 @@ class SmoothieDriver_3_0_0:
     def current(self):
         return self._current_settings['now']
 
+    @property
+    def streaming(self):
+        return self._streaming
+
+    def set_streaming(self, enabled):
+        '''
+        Enables or disables streaming mode. In streaming mode, moves that do
+        not involve the plunger axes (B, C) are sent without M400 and without
+        waiting for them to finish, so that Smoothieware's planner can blend
+        consecutive moves. At most STREAMING_WINDOW lines are left without
+        their 'ok' at any time.
+
+        Every other command (plunger moves, homing, probing, reads, settings)
+        first waits until all streamed moves are done. An error caused by a
+        streamed move is raised by the next command that waits. Disabling
+        streaming waits for all streamed moves.
+
+        While streaming, axes are not set to their dwelling current between
+        moves, because Smoothieware applies M907 as soon as it receives it,
+        not after the moves queued before it.
+
+        enabled
+            Boolean, True to enable streaming mode
+        '''
+        if not enabled:
+            self._wait_for_stream()
+        self._streaming = bool(enabled)
+
     @property
     def speed(self):
         pass
 
     def set_speed(self, value):
-        ''' set total axes movement speed in mm/second'''
+        '''
+        set total axes movement speed in mm/second, sent with the next
+        command (see `flush()`)
+        '''
         self._combined_speed = float(value)
-        speed_per_min = int(self._combined_speed * SEC_PER_MIN)
-        command = GCODES['SET_SPEED'] + str(speed_per_min)
-        log.debug("set_speed: {}".format(command))
-        self._send_command(command)
+        self._buffered_speed = self._combined_speed
+        log.debug("set_speed: {}".format(self._combined_speed))
 
     def push_speed(self):
         self._saved_axes_speed = float(self._combined_speed)
@@ -572,21 +573,20 @@ class SmoothieDriver_3_0_0:
 
     def set_axis_max_speed(self, settings):
         '''
-        Sets the maximum speed (mm/sec) that a given axis will move
+        Sets the maximum speed (mm/sec) that a given axis will move, sent
+        with the next command (see `flush()`)
 
         settings
             Dict with axes as valies (e.g.: 'X', 'Y', 'Z', 'A', 'B', or 'C')
             and floating point number for millimeters per second (mm/sec)
         '''
+        settings = {
+            axis.upper(): value
+            for axis, value in settings.items()
+        }
         self._max_speed_settings.update(settings)
-        values = ['{}{}'.format(axis.upper(), value)
-                  for axis, value in sorted(settings.items())]
-        command = '{} {}'.format(
-            GCODES['SET_MAX_SPEED'],
-            ' '.join(values)
-        )
-        log.debug("set_axis_max_speed: {}".format(command))
-        self._send_command(command)
+        self._buffered_max_speed.update(settings)
+        log.debug("set_axis_max_speed: {}".format(settings))
 
     def push_axis_max_speed(self):
         self._saved_max_speed_settings = self._max_speed_settings.copy()
@@ -594,6 +594,33 @@ class SmoothieDriver_3_0_0:
     def pop_axis_max_speed(self):
         self.set_axis_max_speed(self._saved_max_speed_settings)
 
+    def flush(self):
+        '''
+        Sends buffered speed settings now. Speed and max-speed setters don't
+        send anything themselves, but are merged into the line of the next
+        command, so a set_speed/move/pop_speed sequence costs one round trip.
+        Every command carries them, so they always take effect before the
+        next move or read
+        '''
+        command = self._take_buffered_command()
+        if command:
+            self._send_command(command)
+
+    def _take_buffered_command(self):
+        # gcode for the buffered speed settings, which are then cleared
+        values = []
+        if self._buffered_max_speed:
+            values.append('{} {}'.format(
+                GCODES['SET_MAX_SPEED'],
+                ' '.join('{}{}'.format(axis, value) for axis, value in
+                         sorted(self._buffered_max_speed.items()))))
+        if self._buffered_speed is not None:
+            values.append(GCODES['SET_SPEED'] + str(
+                int(self._buffered_speed * SEC_PER_MIN)))
+        self._buffered_speed = None
+        self._buffered_max_speed = {}
+        return ' '.join(values)
+
     def set_active_current(self, settings):
         '''
         Sets the amperage of each motor for when it is activated by driver.
@@ -684,18 +711,29 @@ class SmoothieDriver_3_0_0:
         '''
         Sends the driver's current settings to the serial port as gcode. Call
         this method to set the axis-current state on the actual Smoothie
-        motor-driver.
+        motor-driver. Nothing is sent if no current changed since they were
+        last sent.
         '''
-        self._send_command(self._generate_current_command())
+        command = self._generate_current_command()
+        if command:
+            self._send_command(command)
 
     def _generate_current_command(self):
         '''
         Returns a constructed GCode string that contains this driver's
-        axis-current settings, plus a small delay to wait for those settings
-        to take effect.
+        axis-current settings which changed since they were last sent, plus a
+        small delay to wait for those settings to take effect. Returns an
+        empty string if no current changed.
+
+        The settings only count as sent once Smoothieware acknowledged the
+        command including this string, see _start_current_update()
         '''
+        sent_current = self._sent_current or {}
         values = ['{}{}'.format(axis, value)
-                  for axis, value in sorted(self.current.items())]
+                  for axis, value in sorted(self.current.items())
+                  if sent_current.get(axis) != value]
+        if not values:
+            return ''
         current_cmd = '{} {}'.format(
             GCODES['SET_CURRENT'],
             ' '.join(values)
@@ -706,8 +744,22 @@ class SmoothieDriver_3_0_0:
             seconds=CURRENT_CHANGE_DELAY
         )
         log.debug("_generate_current_command: {}".format(command))
+        self._pending_current = self.current.copy()
         return command
 
+    def _start_current_update(self, command):
+        # Smoothieware's currents are unknown while a command setting them is
+        # in flight. Returns the currents to pass to _end_current_update()
+        # once the command was acknowledged
+        if GCODES['SET_CURRENT'] not in command:
+            return None
+        self._sent_current = None
+        return self._pending_current
+
+    def _end_current_update(self, current):
+        if current is not None:
+            self._sent_current = current
+
     def disengage_axis(self, axes):
         '''
         Disable the stepper-motor-driver's 36v output to motor
@@ -781,10 +833,14 @@ class SmoothieDriver_3_0_0:
         if not self.simulating:
             sleep(DEFAULT_STABILIZE_DELAY)
         log.debug("reset_from_error")
-        self._send_command(GCODES['RESET_FROM_ERROR'])
+        # the error may have interrupted a command setting currents, so
+        # resend all of them with the next command
+        self._sent_current = None
+        # a halted Smoothieware ignores anything before M999 on its line
+        self._send_command('{} {}'.format(
+            GCODES['RESET_FROM_ERROR'], self._take_buffered_command()))
         self.update_homed_flags()
 
-    # Potential place for command optimization (buffering, flushing, etc)
     def _send_command(self, command, timeout=DEFAULT_SMOOTHIE_TIMEOUT):
         """
         Submit a GCODE command to the robot, followed by M400 to block until
@@ -805,41 +861,169 @@ class SmoothieDriver_3_0_0:
         :param timeout: the time to wait before returning (indefinite wait if
             this is set to none
         """
+        command = self._with_buffered_command(command)
         if self.simulating:
+            self._end_current_update(self._start_current_update(command))
             return
 
-        command_line = command + ' ' + SMOOTHIE_COMMAND_TERMINATOR
+        self._wait_for_stream()
+
+        current = self._start_current_update(command)
+        command_line = command.strip() + ' ' + SMOOTHIE_COMMAND_TERMINATOR
         ret_code = self._recursive_write_and_return(
             command_line, timeout, DEFAULT_COMMAND_RETRIES)
 
         ret_code = self._remove_unwanted_characters(command_line, ret_code)
+        self._check_response(command, ret_code)
+        self._end_current_update(current)
+
+        return ret_code.strip()
+
+    async def _send_command_async(
+            self, command, timeout=DEFAULT_SMOOTHIE_TIMEOUT, loop=None):
+        """
+        Non-blocking `_send_command()`, awaiting Smoothieware's response on
+        the event loop. Waiting for streamed moves and recovering from an
+        error block on the serial port, so they run in the loop's default
+        executor
+        """
+        loop = loop or asyncio.get_event_loop()
+        command, separate = self._split_buffered_command(command)
+        if separate:
+            await self._send_command_async(separate, loop=loop)
+        if self.simulating:
+            self._end_current_update(self._start_current_update(command))
+            return
+
+        if self._streamed:
+            await loop.run_in_executor(None, self._wait_for_stream)
+
+        current = self._start_current_update(command)
+        command_line = command.strip() + ' ' + SMOOTHIE_COMMAND_TERMINATOR
+        ret_code = await self._write_and_return_async(
+            command_line, timeout, loop)
 
-        # Smoothieware returns error state if a switch was hit while moving
-        if (ERROR_KEYWORD in ret_code.lower()) or \
-                (ALARM_KEYWORD in ret_code.lower()):
+        ret_code = self._remove_unwanted_characters(command_line, ret_code)
+        if _is_error_response(ret_code):
+            await loop.run_in_executor(
+                None, self._check_response, command, ret_code)
+        self._end_current_update(current)
+
+        return ret_code.strip()
+
+    async def _write_and_return_async(self, cmd, timeout, loop):
+        # non-blocking _recursive_write_and_return()
+        retries = DEFAULT_COMMAND_RETRIES
+        while True:
+            try:
+                return await serial_communication.write_and_return_async(
+                    cmd,
+                    SMOOTHIE_ACK,
+                    self._connection,
+                    timeout=timeout,
+                    loop=loop)
+            except serial_communication.SerialNoResponse:
+                retries -= 1
+                if retries <= 0:
+                    raise
+                await asyncio.sleep(DEFAULT_STABILIZE_DELAY)
+                if self._connection:
+                    self._connection.close()
+                    self._connection.open()
+
+    def _with_buffered_command(self, command):
+        command, separate = self._split_buffered_command(command)
+        if separate:
+            self._send_command(separate)
+        return command
+
+    def _split_buffered_command(self, command):
+        # merges the buffered speed settings into `command`, returning it
+        # and a line to send first if they can't share its line
+        buffered = self._take_buffered_command()
+        if not buffered:
+            return command, ''
+        if command.strip()[:1] not in ('', 'G', 'M'):
+            # console commands (eg 'version') must be alone on their line
+            return command, buffered
+        return '{} {}'.format(buffered, command.strip()), ''
+
+    def _check_response(self, command, ret_code):
+        if _is_error_response(ret_code):
+            # Smoothieware drops its queue on errors, nothing to wait for
+            self._clear_stream()
             self._reset_from_error()
             error_axis = ret_code.strip()[-1]
             if GCODES['HOME'] not in command and error_axis in 'XYZABC':
                 self.home(error_axis)
             raise SmoothieError(ret_code)
 
-        return ret_code.strip()
+    def _stream_command(self, command, duration):
+        '''
+        Sends a move without M400 and without waiting for it to complete,
+        once fewer than STREAMING_WINDOW streamed lines are waiting for
+        their 'ok'. `duration` is the move's estimated time, which is added
+        to the timeout for draining the stream. See set_streaming()
+        '''
+        command = self._with_buffered_command(command)
+        if self.simulating:
+            return
+
+        if not self._streamed:
+            serial_communication.clear_buffer(self._connection)
+        while self._unacked_lines >= STREAMING_WINDOW:
+            self._read_stream_ack()
+
+        # an error in a streamed move resets the currents, see _check_response
+        current = self._start_current_update(command)
+        serial_communication.write(command.strip() + '\r\n', self._connection)
+        self._end_current_update(current)
+        self._unacked_lines += 1
+        self._streamed_duration += duration
+        self._streamed = True
+
+    def _stream_timeout(self):
+        # no streamed move can take longer than all of them together
+        return self._move_timeout(self._streamed_duration)
+
+    def _read_stream_ack(self):
+        try:
+            ret_code = serial_communication.read_until(
+                SMOOTHIE_STREAM_ACK,
+                self._connection,
+                timeout=self._stream_timeout())
+        except serial_communication.SerialNoResponse:
+            self._clear_stream()
+            raise
+        self._unacked_lines -= 1
+        self._check_response('', ret_code)
+
+    def _wait_for_stream(self):
+        '''
+        Reads the 'ok' of every streamed move, then blocks with M400 until
+        Smoothieware has finished executing them
+        '''
+        if not self._streamed:
+            return
+        self._streamed = False
+        while self._unacked_lines:
+            self._read_stream_ack()
+        timeout = self._stream_timeout()
+        self._streamed_duration = 0.0
+        self._send_command(GCODES['WAIT'], timeout=timeout)
+
+    def _clear_stream(self):
+        self._streamed = False
+        self._unacked_lines = 0
+        self._streamed_duration = 0.0
 
     def _remove_unwanted_characters(self, command, response):
         # smoothieware can enter a weird state, where it repeats back
         # the sent command at the beginning of its response.
-        # Check for this echo, and strips the command from the response
-        remove_from_response = [
-            c.strip() for c in command.strip().split(' ') if c.strip()]
-
-        # also removing any inadvertant newline/return characters
-        # this is ok because all data we need from Smoothie is returned on
-        # the first line in the response
-        remove_from_response += ['\r', '\n']
-        modified_response = str(response)
-
-        for cmd in remove_from_response:
-            modified_response = modified_response.replace(cmd, '')
+        # Also removes any inadvertant newline/return characters, this is ok
+        # because all data we need from Smoothie is returned on the first
+        # line in the response
+        modified_response = response_parsers.remove_echo(command, response)
 
         if modified_response != response:
             log.debug('Removed characters from response: {}'.format(
@@ -944,6 +1128,7 @@ class SmoothieDriver_3_0_0:
 
     def _setup(self):
         log.debug("_setup")
+        self._sent_current = None
         try:
             self._wait_for_ack()
         except serial_communication.SerialNoResponse:
@@ -1049,24 +1234,56 @@ class SmoothieDriver_3_0_0:
             1) Smoothieware boots or resets, 2) if a HALT gcode or signal
             is sent, or 3) a homing/limitswitch error occured.
         '''
-        from numpy import isclose
-
         self.run_flag.wait()
 
-        def valid_movement(coords, axis):
-            return not (
-                (axis in DISABLE_AXES) or
-                (coords is None) or
-                isclose(coords, self.position[axis])
-            )
+        segments, targets = self._plan_move(target)
+        if segments:
+            self._move_segments(
+                target.keys(),
+                segments,
+                home_flagged_axes,
+                self.estimate_move_duration(targets))
+            self._update_position(target)
 
-        def create_coords_list(coords_dict):
-            return [
-                axis + str(round(coords, GCODE_ROUNDING_PRECISION))
-                for axis, coords in sorted(coords_dict.items())
-                if valid_movement(coords, axis)
-            ]
+    async def move_async(self, target, home_flagged_axes=False, loop=None):
+        '''
+        Non-blocking `move()`: awaits Smoothieware finishing the move on
+        the event loop instead of blocking a thread on the serial port.
+
+        Homing flagged axes, recovering from errors and waiting for
+        streamed moves only happen occasionally, and run in the loop's
+        default executor
+        '''
+        loop = loop or asyncio.get_event_loop()
+        while not self.run_flag.is_set():
+            await asyncio.sleep(DEFAULT_STABILIZE_DELAY)
+
+        segments, targets = self._plan_move(target)
+        if not segments:
+            return
 
+        axes = target.keys()
+        if home_flagged_axes:
+            await loop.run_in_executor(
+                None, self.home_flagged_axes, ''.join(axes))
+        duration = self.estimate_move_duration(targets)
+        command = self._start_move(axes, segments, home_flagged_axes=False)
+        try:
+            self.advance_clock(duration)
+            await self._send_command_async(
+                command, timeout=self._move_timeout(duration), loop=loop)
+        finally:
+            plunger_axis_moved = ''.join(set('BC') & set(axes))
+            if plunger_axis_moved:
+                self.dwell_axes(plunger_axis_moved)
+                command = self._generate_current_command()
+                if command:
+                    await self._send_command_async(command, loop=loop)
+        self._update_position(target)
+
+    def _plan_move(self, target):
+        # gcode segments moving to `target`, preceded by a segment past it
+        # to take up backlash when a plunger moves up, with their targets
         backlash_target = target.copy()
         backlash_target.update({
             axis: value + PLUNGER_BACKLASH_MM
@@ -1074,44 +1291,153 @@ class SmoothieDriver_3_0_0:
             if axis in 'BC' and self.position[axis] < value
         })
 
-        target_coords = create_coords_list(target)
-        backlash_coords = create_coords_list(backlash_target)
+        target_coords = self._create_coords_list(target, self.position)
+        backlash_coords = self._create_coords_list(
+            backlash_target, self.position)
+
+        if not target_coords:
+            return [], []
+        segments = [target_coords]
+        targets = [target]
+        if backlash_coords != target_coords:
+            segments.insert(0, backlash_coords)
+            targets.insert(0, backlash_target)
+        return segments, targets
 
-        if target_coords:
-            non_moving_axes = ''.join([
-                ax
-                for ax in AXES
-                if ax not in target.keys()
-            ])
+    def move_sequence(self, targets, home_flagged_axes=False):
+        '''
+        Move through each of `targets` in order, sending every segment
+        within a single gcode line so the sequence costs one serial round
+        trip instead of one per segment.
+
+        targets: list
+            list of dicts in the format accepted by `move()`. Segments that
+            would not move any axis are left out of the gcode
+
+        home_flagged_axes: boolean (default=False)
+            See `move()`
+
+        Plunger axes (B and C) need their backlash compensated per move, so
+        sequences touching them fall back to one `move()` per target
+        '''
+        if any(set('BC') & set(target) for target in targets):
+            for target in targets:
+                self.move(target, home_flagged_axes=home_flagged_axes)
+            return
+
+        self.run_flag.wait()
+
+        position = self.position
+        axes = set()
+        segments = []
+        for target in targets:
+            coords = self._create_coords_list(target, position)
+            if coords:
+                axes.update(target.keys())
+                segments.append(coords)
+                position.update({
+                    axis: value
+                    for axis, value in target.items() if value is not None
+                })
+
+        if segments:
+            self._move_segments(
+                axes,
+                segments,
+                home_flagged_axes,
+                self.estimate_move_duration(targets))
+            for target in targets:
+                self._update_position(target)
+
+    def _create_coords_list(self, target, position):
+        from numpy import isclose
+
+        def valid_movement(coords, axis):
+            return not (
+                (axis in DISABLE_AXES) or
+                (coords is None) or
+                isclose(coords, position[axis])
+            )
+
+        return [
+            axis + str(round(coords, GCODE_ROUNDING_PRECISION))
+            for axis, coords in sorted(target.items())
+            if valid_movement(coords, axis)
+        ]
+
+    def estimate_move_duration(self, targets, start=None):
+        '''
+        Returns the estimated time in seconds Smoothieware needs to move
+        from `start` (default: the current position) through each of
+        `targets`, at the current speed settings. See `motion`
+
+        targets: list
+            list of dicts in the format accepted by `move()`
+        '''
+        return motion.sequence_duration(
+            self.position if start is None else start,
+            targets,
+            speed=self._combined_speed,
+            max_speeds=self._max_speed_settings,
+            acceleration=self._acceleration)
+
+    def advance_clock(self, seconds):
+        '''
+        Adds `seconds` to `simulated_time` if simulating. Simulated moves,
+        homes and delays advance the clock by their estimated durations
+        '''
+        if self.simulating:
+            self.simulated_time += seconds
+
+    def _move_segments(self, axes, segments, home_flagged_axes, duration):
+        # like currents, max speeds may apply before the moves queued ahead
+        streamed = self._streaming and not (set('BC') & set(axes)) and \
+            not self._buffered_max_speed
+        try:
+            command = self._start_move(
+                axes, segments, home_flagged_axes, dwell=not streamed)
+            self.advance_clock(duration)
+            if streamed:
+                self._stream_command(command, duration)
+            else:
+                self._send_command(
+                    command, timeout=self._move_timeout(duration))
+        finally:
+            # dwell pipette motors because they get hot
+            plunger_axis_moved = ''.join(set('BC') & set(axes))
+            if plunger_axis_moved:
+                self.dwell_axes(plunger_axis_moved)
+                self._set_saved_current()
+
+    def _start_move(self, axes, segments, home_flagged_axes, dwell=True):
+        # sets up currents and homing for moving `axes`, and returns the
+        # gcode moving through `segments`. Homing comes first, as it sends
+        # currents of its own that the move's M907 is computed against
+        if home_flagged_axes:
+            self.home_flagged_axes(''.join(list(axes)))
+        non_moving_axes = ''.join([
+            ax
+            for ax in AXES
+            if ax not in axes
+        ])
+        if dwell:
             self.dwell_axes(non_moving_axes)
-            self.activate_axes(target.keys())
+        self.activate_axes(axes)
 
-            # include the current-setting gcodes within the moving gcode string
-            # to reduce latency, since we're setting current so much
-            command = self._generate_current_command()
+        # include the current-setting gcodes within the moving gcode
+        # string to reduce latency, since we're setting current so much
+        command = self._generate_current_command()
 
-            if backlash_coords != target_coords:
-                command += ' ' + GCODES['MOVE'] + ''.join(backlash_coords)
-            command += ' ' + GCODES['MOVE'] + ''.join(target_coords)
+        for coords in segments:
+            command += ' ' + GCODES['MOVE'] + ''.join(coords)
 
-            try:
-                for axis in target.keys():
-                    self.engaged_axes[axis] = True
-                if home_flagged_axes:
-                    self.home_flagged_axes(''.join(list(target.keys())))
-                log.debug("move: {}".format(command))
-                # TODO (andy) a movement's timeout should be calculated by
-                # how long the movement is expected to take. A default timeout
-                # of 30 seconds prevents any movements that take longer
-                self._send_command(command, timeout=DEFAULT_MOVEMENT_TIMEOUT)
-            finally:
-                # dwell pipette motors because they get hot
-                plunger_axis_moved = ''.join(set('BC') & set(target.keys()))
-                if plunger_axis_moved:
-                    self.dwell_axes(plunger_axis_moved)
-                    self._set_saved_current()
+        for axis in axes:
+            self.engaged_axes[axis] = True
+        log.debug("move: {}".format(command))
+        return command
 
-            self._update_position(target)
+    def _move_timeout(self, duration):
+        return duration * MOVEMENT_TIMEOUT_FACTOR + MOVEMENT_TIMEOUT_MARGIN
 
     def home(self, axis=AXES, disabled=DISABLE_AXES):
 
@@ -1150,6 +1476,11 @@ class SmoothieDriver_3_0_0:
         ])
         self.dwell_axes(non_moving_axes)
 
+        self.advance_clock(self.estimate_move_duration([{
+            ax: HOMED_POSITION[ax]
+            for ax in ''.join(home_sequence)
+        }]))
+
         for axes in home_sequence:
             if 'X' in axes:
                 self._home_x()
@@ -1287,6 +1618,7 @@ class SmoothieDriver_3_0_0:
             seconds=seconds
         )
         log.debug("delay: {}".format(command))
+        self.advance_clock(seconds)
         self._send_command(command, timeout=int(seconds) + 1)
 
     def probe_axis(self, axis, probing_distance) -> Dict[str, float]:
@@ -1373,6 +1705,8 @@ class SmoothieDriver_3_0_0:
         if self.simulating:
             pass
         else:
+            self._clear_stream()
+            self._sent_current = None
             gpio.set_low(gpio.OUTPUT_PINS['RESET'])
             gpio.set_high(gpio.OUTPUT_PINS['ISP'])
             sleep(0.25)
@@ -1401,6 +1735,8 @@ class SmoothieDriver_3_0_0:
         if self.simulating:
             pass
         else:
+            self._clear_stream()
+            self._sent_current = None
             gpio.set_low(gpio.OUTPUT_PINS['HALT'])
             sleep(0.25)
             gpio.set_high(gpio.OUTPUT_PINS['HALT'])
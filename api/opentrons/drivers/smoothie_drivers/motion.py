@@ -0,0 +1,86 @@
+"""
+Kinematic estimates of how long Smoothieware takes to execute moves.
+
+Each move is modelled as a straight line along all of its axes at once,
+accelerating to its nominal speed and decelerating to a stop (a
+trapezoidal velocity profile, or a triangular one for moves too short to
+reach that speed). The nominal speed is the combined speed, lowered so
+that no axis exceeds its maximum speed. Acceleration is limited the same
+way by the default and per-axis accelerations of `M204`.
+"""
+from math import sqrt
+
+
+def parse_acceleration(gcode):
+    '''
+    Parses an acceleration gcode like 'M204 S10000 X3000 Y2000' into the
+    default acceleration (S) and a dict of per-axis accelerations, in mm/s^2
+    '''
+    default = None
+    per_axis = {}
+    for word in gcode.split()[1:]:
+        value = float(word[1:])
+        if word[0].upper() == 'S':
+            default = value
+        else:
+            per_axis[word[0].upper()] = value
+    return default, per_axis
+
+
+def move_duration(start, target, speed, max_speeds, acceleration):
+    '''
+    Returns the estimated time in seconds to move from `start` to `target`
+
+    start, target: dict
+        axis to coordinate in mm, `None` coordinates in `target` don't move
+    speed: float
+        combined speed of the move in mm/sec
+    max_speeds: dict
+        maximum speed of each axis in mm/sec
+    acceleration: tuple
+        default and per-axis accelerations, see `parse_acceleration()`
+    '''
+    deltas = [
+        (axis, abs(value - start[axis]))
+        for axis, value in target.items()
+        if value is not None and value != start[axis]
+    ]
+    distance = sqrt(sum(delta * delta for _, delta in deltas))
+    if not distance:
+        return 0.0
+
+    default_acceleration, axis_acceleration = acceleration
+    nominal_speed = speed
+    nominal_acceleration = default_acceleration or float('inf')
+    for axis, delta in deltas:
+        scale = distance / delta
+        if axis in max_speeds:
+            nominal_speed = min(nominal_speed, max_speeds[axis] * scale)
+        if axis in axis_acceleration:
+            nominal_acceleration = min(
+                nominal_acceleration, axis_acceleration[axis] * scale)
+
+    if nominal_acceleration == float('inf'):
+        return distance / nominal_speed
+
+    ramp_distance = nominal_speed * nominal_speed / nominal_acceleration
+    if distance < ramp_distance:
+        # never reaches nominal speed
+        return 2 * sqrt(distance / nominal_acceleration)
+    return distance / nominal_speed + nominal_speed / nominal_acceleration
+
+
+def sequence_duration(start, targets, speed, max_speeds, acceleration):
+    '''
+    Returns the estimated time in seconds to move from `start` through
+    each of `targets` in order. See `move_duration()`
+    '''
+    position = dict(start)
+    duration = 0.0
+    for target in targets:
+        duration += move_duration(
+            position, target, speed, max_speeds, acceleration)
+        position.update({
+            axis: value for axis, value in target.items() if value is not None
+        })
+    return duration
@@ -0,0 +1,116 @@
+from time import time
+
+import numpy as np
+
+
+DEFAULT_HISTORY_SIZE = 1000
+
+
+class PositionHistory:
+    """
+    Fixed-capacity ring buffer of timestamped positions, so the memory used
+    to track where the robot has been stays constant however long it runs.
+
+    Samples are rows of (timestamp, <one column per axis>). Iterating yields
+    the buffered positions as dicts of axis to coordinate, oldest first.
+
+    If :spill_path: is set, samples are appended to that file as raw
+    float64 rows before the buffer overwrites them (and on :meth:`flush`),
+    for post-mortem analysis with :func:`load`.
+    """
+    def __init__(self, axes, size=DEFAULT_HISTORY_SIZE, spill_path=None):
+        assert size > 0, "size must be positive"
+        self._axes = axes
+        self._samples = np.zeros((size, len(axes) + 1))
+        self._count = 0
+        self._spilled = 0
+        self.spill_path = spill_path
+
+    @property
+    def axes(self):
+        return self._axes
+
+    @property
+    def size(self):
+        return len(self._samples)
+
+    def append(self, position, timestamp=None):
+        """
+        Records :position:, a dict of axis to coordinate, at :timestamp:
+        (default: now). Axes missing from :position: are recorded as NaN
+        """
+        if self.spill_path and self._count - self._spilled == self.size:
+            self.flush()
+
+        row = self._samples[self._count % self.size]
+        row[0] = time() if timestamp is None else timestamp
+        row[1:] = [position.get(axis, np.nan) for axis in self._axes]
+        self._count += 1
+
+    def clear(self):
+        self.flush()
+        self._count = 0
+        self._spilled = 0
+
+    def flush(self):
+        """
+        Appends samples not yet written to :spill_path:, if it is set
+        """
+        if not self.spill_path or self._spilled == self._count:
+            return
+        with open(self.spill_path, 'ab') as spill_file:
+            self._ordered(self._count - self._spilled).tofile(spill_file)
+        self._spilled = self._count
+
+    def recent(self, count=None):
+        """
+        Returns an array of the last :count: samples (default: all buffered
+        samples), oldest first. Column 0 holds timestamps and the other
+        columns coordinates in the order of :attr:`axes`
+        """
+        if count is None:
+            count = len(self)
+        return self._ordered(min(count, len(self))).copy()
+
+    def since(self, timestamp):
+        """
+        Returns an array of the buffered samples recorded at or after
+        :timestamp:, oldest first. See :meth:`recent`
+        """
+        samples = self._ordered(len(self))
+        return samples[samples[:, 0] >= timestamp].copy()
+
+    def last(self):
+        """
+        Returns the most recent position as a dict, or None if empty
+        """
+        if not self._count:
+            return None
+        return self._to_position(self._samples[(self._count - 1) % self.size])
+
+    def _ordered(self, count):
+        # the last :count: samples, oldest first, as a view when possible
+        end = self._count % self.size or self.size
+        if count <= end:
+            return self._samples[end - count:end]
+        return np.concatenate(
+            (self._samples[end - count:], self._samples[:end]))
+
+    def _to_position(self, row):
+        return dict(zip(self._axes, row[1:].tolist()))
+
+    def __len__(self):
+        return min(self._count, self.size)
+
+    def __iter__(self):
+        return (self._to_position(row) for row in self.recent())
+
+    def __repr__(self):
+        return '<PositionHistory {}/{} samples>'.format(len(self), self.size)
+
+
+def load(path, axes):
+    """
+    Reads samples spilled by a :class:`PositionHistory` tracking :axes:
+    """
+    return np.fromfile(path).reshape(-1, len(axes) + 1)
@@ -0,0 +1,340 @@
+"""
+Virtual Smoothieware board speaking the real serial protocol over a
+pseudo-terminal, so the driver's parsing, retry, ack and error handling
+can run end to end without hardware (POSIX only).
+
+Like Smoothieware, every line received is answered with the output of its
+gcodes followed by one 'ok'. Moves are queued and only `M400` waits for
+them, so pipelined commands behave as they would on a board. Motion takes
+its estimated duration (see `motion`) times `time_scale`, and every line
+costs an extra `latency` seconds.
+
+Run `python -m opentrons.drivers.smoothie_drivers.virtual_smoothie` to
+serve a board, then connect a driver to the port it prints.
+"""
+import logging
+import re
+from argparse import ArgumentParser
+from collections import deque
+from threading import Event
+from time import sleep, time
+
+from opentrons.drivers.pty_device import PtyDevice
+from opentrons.drivers.smoothie_drivers import motion
+from opentrons.drivers.smoothie_drivers.driver_3_0 import (
+    AXES, HOMED_POSITION)
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SPEED = 400  # mm/sec
+DEFAULT_MAX_SPEED = 600  # mm/sec
+DEFAULT_ACCELERATION = 3000  # mm/sec^2
+BUILD_VERSION = 'virtual-smoothie'
+REPORTED_AXES = 'XYZABC'
+RECEIVED_HISTORY = 1000  # most recent lines kept in `received`
+
+# a gcode followed by its arguments, eg 'G0X10.5Y2' or 'M370L6162'
+GCODE_RE = re.compile(r'([GM]\d+(?:\.\d+)?)([^GM]*)')
+ARGUMENT_RE = re.compile(r'([A-Z])\s*([-+]?\d*\.?\d*)')
+INSTRUMENT_RE = re.compile(r'([LR])([0-9a-fA-F]*)')
+
+
+class VirtualSmoothie:
+    """
+    Handles the lines of a :class:`PtyDevice` the way Smoothieware would
+
+    latency: float
+        seconds added before answering every line
+    time_scale: float
+        fraction of estimated real time that motion and dwells take, 0 to
+        finish them instantly, 1 for real time
+    homed_position: dict
+        coordinates of each axis' homing switch. Moving past them trips a
+        hard limit alarm
+    probe_position: dict
+        coordinates where `G38.2` touches the probe on each axis. Probes
+        which don't reach it fail with an alarm
+    instruments: dict
+        ids and models of the pipettes on each mount, eg
+        `{'L': {'id': 'P10SV0001', 'model': 'p10_single_v1'}}`
+
+    The last RECEIVED_HISTORY lines are kept in `received`
+    """
+    def __init__(self, latency=0, time_scale=0, homed_position=None,
+                 probe_position=None, instruments=None):
+        self.latency = latency
+        self.time_scale = time_scale
+        self.homed_position = dict(homed_position or HOMED_POSITION)
+        self.probe_position = dict(probe_position or {})
+        self.instruments = {
+            mount: dict(data) for mount, data in (instruments or {}).items()}
+
+        self.position = {axis: 0.0 for axis in AXES}
+        self.homed_flags = {axis: False for axis in AXES}
+        self.switches = {axis: False for axis in list(AXES) + ['Probe']}
+        self.currents = {axis: 0.0 for axis in AXES}
+        self.engaged = {axis: False for axis in AXES}
+        self.max_speeds = {axis: DEFAULT_MAX_SPEED for axis in AXES}
+        self.acceleration = (DEFAULT_ACCELERATION, {})
+        self.speed = DEFAULT_SPEED
+        self.relative = False
+        self.halted = False
+        self.received = deque(maxlen=RECEIVED_HISTORY)
+        self._busy_until = 0
+        self._failures = []
+        self._handlers = {
+            'G0': self._move,
+            'G1': self._move,
+            'G4': self._dwell,
+            'G28.2': self._home,
+            'G28.6': self._homing_status,
+            'G38.2': self._probe,
+            'G90': self._absolute,
+            'G91': self._relative,
+            'M18': self._disengage,
+            'M92': self._ignore,
+            'M114.2': self._report_position,
+            'M119': self._report_switches,
+            'M120': self._ignore,
+            'M121': self._ignore,
+            'M203.1': self._set_max_speed,
+            'M204': self._set_acceleration,
+            'M369': self._read_instrument('id'),
+            'M370': self._write_instrument('id'),
+            'M371': self._read_instrument('model'),
+            'M372': self._write_instrument('model'),
+            'M400': self._wait,
+            'M907': self._set_current,
+            'M999': self._reset_from_error,
+        }
+        # commands that are not gcodes, which must be alone on their line
+        self._console_handlers = {
+            'version': self._version,
+        }
+
+    def fail_next(self, message='error:Unsupported command'):
+        """
+        Answers the next non-empty line with :message: instead of running
+        it. Messages starting with 'ALARM' also halt the board
+        """
+        self._failures.append(message)
+
+    def __call__(self, line):
+        line = line.strip()
+        self.received.append(line)
+        if self.latency:
+            sleep(self.latency)
+
+        output = []
+        try:
+            if line and self._failures:
+                self._fail(self._failures.pop(0))
+            self._run(line, output)
+        except _Alarm as alarm:
+            self.halted = True
+            output.append(str(alarm))
+        except _Error as error:
+            output.append(str(error))
+        return ''.join(line + '\r\n' for line in output + ['ok'])
+
+    def _run(self, line, output):
+        console_handler = self._console_handlers.get(line.split(' ')[0])
+        if console_handler:
+            output.append(console_handler())
+            return
+        for gcode, arguments in GCODE_RE.findall(line):
+            result = self._handler(gcode)(arguments.strip())
+            if result:
+                output.append(result)
+
+    def _handler(self, gcode):
+        if self.halted and gcode != 'M999':
+            return self._halted
+        return self._handlers.get(gcode, self._unsupported)
+
+    def _fail(self, message):
+        if message.lower().startswith('alarm'):
+            raise _Alarm(message)
+        raise _Error(message)
+
+    # ----------- console commands --------------- #
+
+    def _version(self):
+        return 'Build version: {}, Build date: none, MCU: virtual'.format(
+            BUILD_VERSION)
+
+    # ----------- gcodes --------------- #
+
+    def _ignore(self, arguments):
+        pass
+
+    def _halted(self, arguments):
+        # a halted board ignores the rest of the line until M999
+        raise _Error('!!')
+
+    def _unsupported(self, arguments):
+        raise _Error('error:Unsupported command')
+
+    def _move(self, arguments):
+        target = {}
+        for axis, value in _parse_arguments(arguments):
+            if axis == 'F':
+                self.speed = value / 60  # mm/min
+            elif axis in self.position:
+                target[axis] = value
+                if self.relative:
+                    target[axis] += self.position[axis]
+        for axis, value in sorted(target.items()):
+            if value > self.homed_position[axis]:
+                self._travel(dict(target, **{axis: self.homed_position[axis]}))
+                self.homed_flags[axis] = False
+                raise _Alarm('ALARM: Hard limit +{}'.format(axis))
+        self._travel(target)
+
+    def _travel(self, target):
+        self._queue(motion.move_duration(
+            self.position, target, self.speed, self.max_speeds,
+            self.acceleration))
+        self.position.update(target)
+        for axis in target:
+            self.engaged[axis] = True
+
+    def _dwell(self, arguments):
+        self._wait('')
+        seconds = dict(_parse_arguments(arguments)).get('P', 0)
+        self._queue(seconds)
+        self._wait('')
+
+    def _home(self, arguments):
+        axes = [
+            axis for axis, _ in _parse_arguments(arguments)
+            if axis in self.position] or list(AXES)
+        self._wait('')
+        self._travel({axis: self.homed_position[axis] for axis in axes})
+        self._wait('')
+        self.homed_flags.update({axis: True for axis in axes})
+
+    def _homing_status(self, arguments):
+        return ' '.join(
+            '{}:{}'.format(axis, int(self.homed_flags[axis]))
+            for axis in REPORTED_AXES)
+
+    def _probe(self, arguments):
+        self._wait('')
+        for axis, distance in _parse_arguments(arguments):
+            if axis not in self.position:
+                continue
+            contact = self.probe_position.get(axis)
+            start = self.position[axis]
+            end = start + distance
+            if contact is None or \
+                    not min(start, end) <= contact <= max(start, end):
+                self._travel({axis: end})
+                raise _Alarm('ALARM: Probe fail')
+            self._travel({axis: contact})
+            self._wait('')
+            return '[PRB:{}:1]'.format(','.join(
+                '{:.4f}'.format(self.position[ax]) for ax in REPORTED_AXES))
+
+    def _absolute(self, arguments):
+        self.relative = False
+
+    def _relative(self, arguments):
+        self.relative = True
+
+    def _disengage(self, arguments):
+        axes = ''.join(axis for axis, _ in _parse_arguments(arguments))
+        for axis in axes or AXES:
+            if axis in self.engaged:
+                self.engaged[axis] = False
+
+    def _report_position(self, arguments):
+        return 'ok MCS: ' + ' '.join(
+            '{}:{:.4f}'.format(axis, self.position[axis])
+            for axis in REPORTED_AXES)
+
+    def _report_switches(self, arguments):
+        switches = [
+            '{}_max:{}'.format(axis, int(self.switches[axis]))
+            for axis in REPORTED_AXES]
+        switches.append('Probe: {}'.format(int(self.switches['Probe'])))
+        return ' '.join(switches)
+
+    def _set_max_speed(self, arguments):
+        self.max_speeds.update(_parse_arguments(arguments))
+
+    def _set_acceleration(self, arguments):
+        self.acceleration = motion.parse_acceleration('M204 ' + arguments)
+
+    def _set_current(self, arguments):
+        self.currents.update(_parse_arguments(arguments))
+
+    def _read_instrument(self, key):
+        def read(arguments):
+            mount = INSTRUMENT_RE.match(arguments).group(1)
+            data = self.instruments.get(mount, {}).get(key)
+            if data is None:
+                return 'error:no instrument on {}'.format(mount)
+            return '{}:{}'.format(mount, data.encode().hex())
+        return read
+
+    def _write_instrument(self, key):
+        def write(arguments):
+            mount, data = INSTRUMENT_RE.match(arguments).groups()
+            instrument = self.instruments.setdefault(mount, {})
+            instrument[key] = bytes.fromhex(data).decode()
+        return write
+
+    def _wait(self, arguments):
+        remaining = self._busy_until - time()
+        if remaining > 0:
+            sleep(remaining)
+
+    def _reset_from_error(self, arguments):
+        self.halted = False
+
+    def _queue(self, seconds):
+        # motion runs after whatever was queued before it
+        if self.time_scale and seconds:
+            start = max(self._busy_until, time())
+            self._busy_until = start + seconds * self.time_scale
+
+
+class _Error(Exception):
+    # stops running the rest of a line, answering with the message
+    pass
+
+
+class _Alarm(_Error):
+    # an _Error which also halts the board
+    pass
+
+
+def _parse_arguments(arguments):
+    return [
+        (axis, float(value) if value not in ('', '.', '-', '+') else 0.0)
+        for axis, value in ARGUMENT_RE.findall(arguments.upper())
+    ]
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument(
+        '--latency', type=float, default=0,
+        help='seconds added before answering every line')
+    parser.add_argument(
+        '--time-scale', type=float, default=0,
+        help='fraction of real time that motion takes')
+    args = parser.parse_args()
+    smoothie = VirtualSmoothie(
+        latency=args.latency, time_scale=args.time_scale)
+    with PtyDevice(smoothie) as device:
+        print('Virtual Smoothie on {}'.format(device.port), flush=True)
+        try:
+            Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,4 @@
+import asyncio
 from os import environ
 import logging
 from threading import Event, Thread
@@ -6,6 +7,8 @@ from time import sleep
 from serial.serialutil import SerialException
 
 from opentrons.drivers import serial_communication
+from opentrons.drivers.response_parsers import (
+    ParseError, parse_device_info, parse_temperature)
 from opentrons.drivers.serial_communication import SerialNoResponse
 
 '''
@@ -49,111 +52,6 @@ class TempDeckError(Exception):
     pass
 
 
-class ParseError(Exception):
-    pass
-
-
-def _parse_string_value_from_substring(substring) -> str:
-    '''
-    Returns the ascii value in the expected string "N:aa11bb22", where "N" is
-    the key, and "aa11bb22" is string value to be returned
-    '''
-    try:
-        value = substring.split(':')[1]
-        return str(value)
-    except (ValueError, IndexError, TypeError, AttributeError):
-        log.exception('Unexpected arg to _parse_string_value_from_substring:')
-        raise ParseError(
-            'Unexpected arg to _parse_string_value_from_substring: {}'.format(
-                substring))
-
-
-def _parse_number_from_substring(substring) -> float:
-    '''
-    Returns the number in the expected string "N:12.3", where "N" is the
-    key, and "12.3" is a floating point value
-
-    For the temp-deck's temperature response, one expected input is something
-    like "T:none", where "none" should return a None value
-    '''
-    try:
-        value = substring.split(':')[1]
-        if value.strip().lower() == 'none':
-            return None
-        return round(float(value), GCODE_ROUNDING_PRECISION)
-    except (ValueError, IndexError, TypeError, AttributeError):
-        log.exception('Unexpected argument to _parse_number_from_substring:')
-        raise ParseError(
-            'Unexpected argument to _parse_number_from_substring: {}'.format(
-                substring))
-
-
-def _parse_key_from_substring(substring) -> str:
-    '''
-    Returns the axis in the expected string "N:12.3", where "N" is the
-    key, and "12.3" is a floating point value
-    '''
-    try:
-        return substring.split(':')[0]
-    except (ValueError, IndexError, TypeError, AttributeError):
-        log.exception('Unexpected argument to _parse_key_from_substring:')
-        raise ParseError(
-            'Unexpected argument to _parse_key_from_substring: {}'.format(
-                substring))
-
-
-def _parse_temperature_response(temperature_string) -> dict:
-    '''
-    Example input: "T:none C:25"
-    '''
-    err_msg = 'Unexpected argument to _parse_temperature_response: {}'.format(
-        temperature_string)
-    if not temperature_string or \
-            not isinstance(temperature_string, str):
-        raise ParseError(err_msg)
-    parsed_values = temperature_string.strip().split(' ')
-    if len(parsed_values) < 2:
-        log.error(err_msg)
-        raise ParseError(err_msg)
-
-    data = {
-        _parse_key_from_substring(s): _parse_number_from_substring(s)
-        for s in parsed_values[:2]
-    }
-    if 'C' not in data or 'T' not in data:
-        raise ParseError(err_msg)
-    data = {
-        'current': data['C'],
-        'target': data['T']
-    }
-    return data
-
-
-def _parse_device_information(device_info_string) -> dict:
-    '''
-        Parse the temp-deck's device information response.
-
-        Example response from temp-deck: "serial:aa11 model:bb22 version:cc33"
-    '''
-    error_msg = 'Unexpected argument to _parse_device_information: {}'.format(
-        device_info_string)
-    if not device_info_string or \
-            not isinstance(device_info_string, str):
-        raise ParseError(error_msg)
-    parsed_values = device_info_string.strip().split(' ')
-    if len(parsed_values) < 3:
-        log.error(error_msg)
-        raise ParseError(error_msg)
-    res = {
-        _parse_key_from_substring(s): _parse_string_value_from_substring(s)
-        for s in parsed_values[:3]
-    }
-    for key in ['model', 'version', 'serial']:
-        if key not in res:
-            raise ParseError(error_msg)
-    return res
-
-
 class TempDeck:
     def __init__(self, config={}):
         self.run_flag = Event()
@@ -226,6 +124,28 @@ class TempDeck:
                 return str(e)
         return ''
 
+    async def update_temperature_async(self, loop=None) -> str:
+        '''
+        Reads the current and target temperatures without blocking, for
+        polling the module from an event loop instead of a thread
+        '''
+        retries = DEFAULT_COMMAND_RETRIES
+        try:
+            while True:
+                res = await self._send_command_async(
+                    GCODES['GET_TEMP'], loop=loop)
+                try:
+                    self._temperature.update(parse_temperature(res))
+                    break
+                except ParseError as e:
+                    retries -= 1
+                    if retries <= 0:
+                        raise TempDeckError(e)
+                    await asyncio.sleep(DEFAULT_STABILIZE_DELAY)
+        except (TempDeckError, SerialException, SerialNoResponse) as e:
+            return str(e)
+        return ''
+
     @property
     def target(self) -> int:
         return self._temperature.get('target')
@@ -317,7 +237,32 @@ class TempDeck:
         command_line = command + ' ' + TEMP_DECK_COMMAND_TERMINATOR
         ret_code = self._recursive_write_and_return(
             command_line, timeout, DEFAULT_COMMAND_RETRIES)
+        return self._check_response(ret_code)
 
+    async def _send_command_async(
+            self, command, timeout=DEFAULT_TEMP_DECK_TIMEOUT, loop=None):
+        command_line = command + ' ' + TEMP_DECK_COMMAND_TERMINATOR
+        retries = DEFAULT_COMMAND_RETRIES
+        while True:
+            try:
+                ret_code = await serial_communication.write_and_return_async(
+                    command_line,
+                    TEMP_DECK_ACK,
+                    self._connection,
+                    timeout,
+                    loop=loop)
+                break
+            except SerialNoResponse:
+                retries -= 1
+                if retries <= 0:
+                    raise
+                await asyncio.sleep(DEFAULT_STABILIZE_DELAY)
+                if self._connection:
+                    self._connection.close()
+                    self._connection.open()
+        return self._check_response(ret_code)
+
+    def _check_response(self, ret_code):
         # Smoothieware returns error state if a switch was hit while moving
         if (ERROR_KEYWORD in ret_code.lower()) or \
                 (ALARM_KEYWORD in ret_code.lower()):
@@ -348,7 +293,7 @@ class TempDeck:
     def _recursive_update_temperature(self, retries) -> dict:
         try:
             res = self._send_command(GCODES['GET_TEMP'])
-            res = _parse_temperature_response(res)
+            res = parse_temperature(res)
             self._temperature.update(res)
             return
         except ParseError as e:
@@ -361,7 +306,7 @@ class TempDeck:
     def _recursive_get_info(self, retries) -> dict:
         try:
             device_info = self._send_command(GCODES['DEVICE_INFO'])
-            return _parse_device_information(device_info)
+            return parse_device_info(device_info)
         except ParseError as e:
             retries -= 1
             if retries <= 0:
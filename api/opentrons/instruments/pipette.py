@@ -11,6 +11,7 @@ from opentrons.containers.placeable import (
     Container, Placeable, WellSeries
 )
 from opentrons.helpers import helpers
+from opentrons.robot.mover import move_sequence
 from opentrons.trackers import pose_tracker
 
 log = logging.getLogger(__name__)
@@ -285,9 +286,11 @@ class Pipette:
         location : :any:`Placeable` or tuple(:any:`Placeable`, :any:`Vector`)
             The destination to arrive at
 
-        strategy : "arc" or "direct"
+        strategy : "arc", "arc_batched" or "direct"
             "arc" strategies (default) will pick the head up on Z axis, then
             over to the XY destination, then finally down to the Z destination.
+            "arc_batched" follows the same path, sending it to the robot as a
+            single command
             "direct" strategies will simply move in a straight line from
             the current position
 
@@ -1309,6 +1312,8 @@ class Pipette:
         self.robot.pause()
         if not self.robot.is_simulating():
             _sleep(seconds)
+        else:
+            self.robot.advance_clock(seconds)
         self.robot.resume()
 
         return self
@@ -1826,6 +1831,33 @@ class Pipette:
 
         return pose_tree
 
+    def _move_sequence(self, pose_tree, segments):
+        """
+        Moves through each of :segments: (dicts of x, y and z keyword
+        arguments of :meth:`_move`) sending them all as one driver command
+        """
+        position = list(pose_tracker.absolute(pose_tree, self))
+        dx, dy, dz = pose_tracker.change_base(
+            pose_tree,
+            src=self,
+            dst=self.mount)
+
+        moves = []
+        for segment in segments:
+            position = [
+                current if segment.get(axis) is None else segment[axis]
+                for axis, current in zip('xyz', position)
+            ]
+            _x, _y, _z = position[0] - dx, position[1] - dy, position[2] - dz
+
+            if segment.get('x') is not None or segment.get('y') is not None:
+                moves.append((self.robot.gantry, {'x': _x, 'y': _y}))
+
+            if segment.get('z') is not None:
+                moves.append((self.instrument_mover, {'z': _z}))
+
+        return move_sequence(pose_tree, moves)
+
     def _jog(self, pose_tree, axis, distance):
         assert axis in 'xyz', "Axis must be 'x', 'y', or 'z'"
         if axis in 'xy':
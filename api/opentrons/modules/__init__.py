@@ -24,7 +24,12 @@ def load(name, slot):
         if robot.is_simulating():
             labware_instance = labware.load(name, slot)
             module_class = SUPPORTED_MODULES.get(name)
-            module_instance = module_class(lw=labware_instance)
+            if module_class is TempDeck:
+                # simulated temperature ramps advance the robot's clock
+                module_instance = TempDeck(
+                    lw=labware_instance, clock=robot.advance_clock)
+            else:
+                module_instance = module_class(lw=labware_instance)
         else:
             # TODO: BC 2018-08-01 this currently loads the first module of
             # that type that is on the robot, in the future we should add
@@ -4,6 +4,17 @@ from opentrons import commands
 
 TEMP_POLL_INTERVAL_SECS = 1
 
+# Default rates (degree Celsius per second) a simulated TempDeck heats and
+# cools at, used to estimate how long protocols wait for temperatures. They
+# are rough full-range averages (about 20 min from room temperature to 95C,
+# 8 min down to 4C), not a specification: ramps slow down close to the
+# target and depend on the labware, so pass measured rates to TempDeck when
+# the estimate matters
+SIMULATED_HEATING_RATE = 0.058
+SIMULATED_COOLING_RATE = 0.042
+# a simulated TempDeck starts out at room temperature
+SIMULATED_START_TEMP = 25
+
 
 class MissingDevicePortError(Exception):
     pass
@@ -16,12 +27,27 @@ class TempDeck:
     """
     Under development. API subject to change without a version bump
     """
-    def __init__(self, lw=None, port=None):
+    def __init__(self, lw=None, port=None, clock=None,
+                 heating_rate=SIMULATED_HEATING_RATE,
+                 cooling_rate=SIMULATED_COOLING_RATE):
+        """
+        clock
+            Callable taking a number of seconds, which simulated waits for
+            temperatures advance the simulated time with (for example
+            `Robot.advance_clock`). Simulated waits take no time without it
+        heating_rate, cooling_rate
+            Degree Celsius per second the simulated deck ramps at
+        """
         self.labware = lw
         self._port = port
         self._driver = None
         self._device_info = None
         self._poll_stop_event = None
+        self._clock = clock
+        self._heating_rate = heating_rate
+        self._cooling_rate = cooling_rate
+        self._simulated_temp = SIMULATED_START_TEMP
+        self._simulated_target = None
 
     @commands.publish.both(command=commands.tempdeck_set_temp)
     def set_temperature(self, celsius):
@@ -33,12 +59,16 @@ class TempDeck:
         """
         if self._driver and self._driver.is_connected():
             self._driver.set_temperature(celsius)
+        else:
+            self._simulated_target = celsius
 
     @commands.publish.both(command=commands.tempdeck_deactivate)
     def deactivate(self):
         """ Stop heating/cooling and turn off the fan """
         if self._driver and self._driver.is_connected():
             self._driver.disengage()
+        else:
+            self._simulated_target = None
 
     def wait_for_temp(self):
         """
@@ -47,6 +77,12 @@ class TempDeck:
         if self._driver and self._driver.is_connected():
             while self.status != 'holding at target':
                 pass
+        elif self._simulated_target is not None:
+            change = self._simulated_target - self._simulated_temp
+            rate = self._heating_rate if change > 0 else self._cooling_rate
+            if self._clock:
+                self._clock(abs(change) / rate)
+            self._simulated_temp = self._simulated_target
 
     # TODO: there should be a separate decoupled set of classes that construct
     # the http api response entity given the model instance.
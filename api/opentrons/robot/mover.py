@@ -37,6 +37,18 @@ class Mover:
             within this Mover's axis_mapping is homed before moving, if it has
             not yet done so. See driver docstring for details
         """
+        driver_target, point = self.plan_move(pose_tree, x=x, y=y, z=z)
+        self._driver.move(driver_target, home_flagged_axes=home_flagged_axes)
+
+        # Update pose with the new value. Since stepper motors are open loop
+        # there is no need to to query diver for position
+        return update(pose_tree, self, point)
+
+    def plan_move(self, pose_tree, x=None, y=None, z=None):
+        """
+        Returns the driver target and the new pose of this Mover for a move
+        to x, y and z, without sending anything to the driver
+        """
         def defaults(_x, _y, _z):
             _x = _x if x is not None else 0
             _y = _y if y is not None else 0
@@ -61,11 +73,8 @@ class Mover:
         if 'z' in self._axis_mapping:
             assert z is not None, "Value must be set for each axis mapped"
             driver_target[self._axis_mapping['z']] = dst_z
-        self._driver.move(driver_target, home_flagged_axes=home_flagged_axes)
 
-        # Update pose with the new value. Since stepper motors are open loop
-        # there is no need to to query diver for position
-        return update(pose_tree, self, Point(*defaults(dst_x, dst_y, dst_z)))
+        return driver_target, Point(*defaults(dst_x, dst_y, dst_z))
 
     def home(self, pose_tree):
         self._driver.home(axis=''.join(self._axis_mapping.values()))
@@ -150,3 +159,29 @@ class Mover:
         )
 
         return update(pose_tree, self, point)
+
+
+def move_sequence(pose_tree, moves, home_flagged_axes=True):
+    """
+    Moves through each of :moves: in order, sending all of them to the
+    driver at once so the whole sequence is a single serial round trip.
+
+    moves: list of (:class:`Mover`, dict) tuples, the dict holding the
+    x, y and z keyword arguments of :meth:`Mover.move`. Every Mover
+    must share the same driver
+    """
+    if not moves:
+        return pose_tree
+
+    driver = moves[0][0]._driver
+    planned = [
+        (mover,) + mover.plan_move(pose_tree, **coords)
+        for mover, coords in moves
+    ]
+    driver.move_sequence(
+        [driver_target for _, driver_target, _ in planned],
+        home_flagged_axes=home_flagged_axes)
+
+    for mover, _, point in planned:
+        pose_tree = update(pose_tree, mover, point)
+    return pose_tree
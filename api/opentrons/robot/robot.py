@@ -1,6 +1,5 @@
 import os
 import logging
-from functools import lru_cache
 
 import opentrons.util.calibration_functions as calib
 from numpy import add, subtract
@@ -8,6 +7,7 @@ from opentrons import commands, containers, drivers
 from opentrons.instruments import pipette_config
 from opentrons.broker import subscribe
 from opentrons.containers import Container
+from opentrons.containers.placeable import WellGeometry
 from opentrons.data_storage import database, old_container_loading,\
     database_migration
 from opentrons.drivers.smoothie_drivers import driver_3_0
@@ -193,7 +193,7 @@ class Robot(object):
         self.axis_homed = {
             'x': False, 'y': False, 'z': False, 'a': False, 'b': False}
 
-        self.clear_commands()
+        self._commands.clear()
 
         # update the position of each Mover
         self._driver.update_position()
@@ -493,10 +493,13 @@ class Robot(object):
             Instrument to move relative to. If ``None``, move relative to the
             center of a gantry.
 
-        strategy : {'arc', 'direct'}
+        strategy : {'arc', 'arc_batched', 'direct'}
             ``arc`` : move to the point using arc trajectory
             avoiding obstacles.
 
+            ``arc_batched`` : same trajectory as ``arc``, with all of its
+            segments sent to the driver in a single command.
+
             ``direct`` : move to the point in a straight line.
         """
 
@@ -533,6 +536,10 @@ class Robot(object):
                     self.poses,
                     **coord)
 
+        elif strategy == 'arc_batched':
+            arc_coords = self._create_arc(instrument, target, placeable)
+            self.poses = instrument._move_sequence(self.poses, arc_coords)
+
         elif strategy == 'direct':
             position = {'x': target[0], 'y': target[1], 'z': target[2]}
             self.poses = instrument._move(
@@ -710,7 +717,6 @@ class Robot(object):
             if self._is_available_slot(location, share, slot, name):
                 location.add(container, label or name)
             self.add_container_to_pose_tracker(location, container)
-            self.max_deck_height.cache_clear()
         return container
 
     def add_container_to_pose_tracker(self, location, container: Container):
@@ -724,21 +730,20 @@ class Robot(object):
             container.parent,
             pose_tracker.Point(*container._coordinates))
 
-        for well in container:
-            center_x, center_y, center_z = well.top()[1]
-            offset_x, offset_y, offset_z = well._coordinates
-            if not fflags.split_labware_definitions():
-                center_z = 0
-            self.poses = pose_tracker.add(
-                self.poses,
-                well,
-                container,
-                pose_tracker.Point(
-                    center_x + offset_x,
-                    center_y + offset_y,
-                    center_z + offset_z
-                )
-            )
+        wells = container.get_children_list()
+        # modules are plain Placeables and keep no geometry table
+        geometry = container.geometry() or \
+            WellGeometry(container.children_by_reference)
+        rows = geometry.rows(wells)
+        points = geometry.offsets[rows] + geometry.tops[rows]
+        if not fflags.split_labware_definitions():
+            points[:, 2] = geometry.offsets[rows, 2]
+        self.poses = pose_tracker.add_many(
+            self.poses,
+            wells,
+            container,
+            points
+        )
 
     @commands.publish.both(command=commands.pause)
     def pause(self):
@@ -817,26 +822,55 @@ class Robot(object):
             return False
         return self._driver.simulating
 
+    def simulated_time(self):
+        """
+        Estimated seconds that the commands run while simulating would take
+        on a robot. Compare readings taken before and after a simulation to
+        estimate its run time
+        """
+        return self._driver.simulated_time
+
+    def advance_clock(self, seconds):
+        """
+        Adds :seconds: to :meth:`simulated_time` while simulating, for waits
+        that do not go through the driver
+        """
+        self._driver.advance_clock(seconds)
+
     @commands.publish.before(command=commands.comment)
     def comment(self, msg):
         pass
 
     def commands(self):
+        """
+        Descriptions of the commands run since the log was first used,
+        either by this method or by :meth:`clear_commands`
+        """
+        self._log_commands()
         return self._commands
 
     def clear_commands(self):
         self._commands.clear()
+        self._log_commands()
+
+    def _log_commands(self):
+        """
+        Starts logging commands, the first time the log is used. Until then
+        nothing subscribes on the robot's behalf, and scripts that never
+        read the log don't pay for publishing every command
+        """
         if self._unsubscribe_commands:
-            self._unsubscribe_commands()
+            return
 
         def on_command(message):
             payload = message.get('payload')
-            text = payload.get('text')
-            if text is None:
+            if 'text' not in payload:
                 return
 
+            # rendered now, so the log neither keeps the command's
+            # arguments alive nor changes when they are renamed or moved
             if message['$'] == 'before':
-                self._commands.append(text.format(**payload))
+                self._commands.append(payload['text'])
 
         self._unsubscribe_commands = subscribe(
             commands.types.COMMAND, on_command)
@@ -878,10 +912,9 @@ class Robot(object):
             save
         )
 
-        self.max_deck_height.cache_clear()
-
-    @lru_cache()
     def max_deck_height(self):
+        # pose tracker keeps max Z of each subtree up to date as labware
+        # is added or calibrated, so this does not need caching here
         return pose_tracker.max_z(self.poses, self._deck)
 
     def max_placeable_height_on_deck(self, placeable):
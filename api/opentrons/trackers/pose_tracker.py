@@ -1,13 +1,28 @@
-import functools
-import itertools
-from collections import namedtuple, UserDict
-from typing import Dict, List
+from collections import namedtuple
+from collections.abc import Mapping
+from typing import List
 
 import numpy as np
 from numpy.linalg import inv
 
 ROOT = 'root'
 
+# Initial number of rows allocated for a new pose tree. Storage doubles
+# whenever it runs out, so inserts stay amortized O(1)
+DEFAULT_CAPACITY = 64
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses')
+
+# Kinds of transforms, ordered so that the kind of a product of transforms
+# is the max of the kinds of its factors
+TRANSLATION = 0  # identity linear part
+RIGID = 1        # orthonormal linear part
+AFFINE = 2       # anything else, inverted with LU decomposition
+
+_IDENTITY = np.identity(4)
+_IDENTITY.setflags(write=False)
+_TWICE_IDENTITY = 2 * _IDENTITY
+
 
 class Point(namedtuple('Point', 'x y z')):
     def __str__(self):
@@ -15,13 +30,9 @@ class Point(namedtuple('Point', 'x y z')):
 
 
 def translate(point) -> np.ndarray:
-    x, y, z = point
-    return np.array([
-        [1.0, 0.0, 0.0,   x],
-        [0.0, 1.0, 0.0,   y],
-        [0.0, 0.0, 1.0,   z],
-        [0.0, 0.0, 0.0, 1.0]
-    ])
+    res = _IDENTITY.copy()
+    res[:3, 3] = point
+    return res
 
 
 def extract_transform(matrix) -> np.ndarray:
@@ -34,10 +45,38 @@ def extract_transform(matrix) -> np.ndarray:
     ])
 
 
-def inverse(matrix) -> np.ndarray:
+def kind_of(matrix) -> int:
+    """ Classify :matrix: as TRANSLATION, RIGID or AFFINE """
+    if matrix is _IDENTITY:
+        return TRANSLATION
+    if not (matrix[3] == _IDENTITY[3]).all():
+        return AFFINE
+    linear = matrix[:3, :3]
+    if (linear == _IDENTITY[:3, :3]).all():
+        return TRANSLATION
+    if np.allclose(linear.dot(linear.T), _IDENTITY[:3, :3]):
+        return RIGID
+    return AFFINE
+
+
+def invert(matrix, kind) -> np.ndarray:
+    """ Invert :matrix: of a known :kind: """
+    if kind == TRANSLATION:
+        # I + T inverts to I - T
+        return _TWICE_IDENTITY - matrix
+    if kind == RIGID:
+        res = _IDENTITY.copy()
+        rotation = matrix[:3, :3].T
+        res[:3, :3] = rotation
+        res[:3, 3] = -rotation.dot(matrix[:3, 3])
+        return res
     return inv(matrix)
 
 
+def inverse(matrix) -> np.ndarray:
+    return invert(matrix, kind_of(matrix))
+
+
 class Node(namedtuple('Node', 'parent children transform')):
     def add(self, child):
         return self._replace(children=self.children + [child])
@@ -58,74 +97,496 @@ class Node(namedtuple('Node', 'parent children transform')):
             (transform1 == transform2).all()
 
 
+class PoseTree(Mapping):
+    """
+    Mutable pose tree backed by contiguous arrays.
+
+    Every tracked object owns a row: its parent row lives in `_parents`
+    and its 4x4 transform in `_transforms`. Rows of removed objects are
+    recycled, so inserts, updates and removals never copy the whole tree.
+
+    The tree is a read-only :class:`Mapping` of object to :class:`Node` so
+    code written against the old dict-of-nodes representation keeps
+    working; mutation goes through the module level :func:`add`,
+    :func:`update` and :func:`remove` functions, which modify the tree in
+    place and return it.
+
+    Callers that need immutable semantics can take a :meth:`snapshot`: the
+    snapshot shares storage with the original until either one is
+    modified, at which point the modified one copies the arrays.
+
+    Products of transforms between each node and the top of the tree (and
+    their inverses) are memoized per row. Updating a node's transform only
+    invalidates the memoized products of its own subtree.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self._index = {}
+        self._objects = []
+        self._children = []
+        self._free = []
+        self._parents = np.full(capacity, -1, dtype=np.intp)
+        self._transforms = np.zeros((capacity, 4, 4))
+        self._kinds = np.zeros(capacity, dtype=np.int8)
+        # Memoized products, see _world. `_up` is the product of
+        # transforms from a node up to (excluding) the top of the tree,
+        # `_down` is the same product in top-down order
+        self._valid = np.zeros(capacity, dtype=bool)
+        self._up = np.zeros((capacity, 4, 4))
+        self._up_inv = np.zeros((capacity, 4, 4))
+        self._down = np.zeros((capacity, 4, 4))
+        self._down_inv = np.zeros((capacity, 4, 4))
+        self._world_kinds = np.zeros(capacity, dtype=np.int8)
+        # Highest Z of any descendant in node's coordinate system, see
+        # _subtree_max_z. Invalidated for ancestors of a modified node
+        self._max_z_valid = np.zeros(capacity, dtype=bool)
+        self._max_z = np.zeros(capacity)
+        self._hits = 0
+        self._misses = 0
+        self._shared = False
+
+    def __getitem__(self, obj) -> Node:
+        row = self._index[obj]
+        parent = self._parents[row]
+        return Node(
+            parent=None if parent < 0 else self._objects[parent],
+            children=list(self._children[row]),
+            transform=self._transforms[row].copy())
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, obj):
+        return obj in self._index
+
+    def add(self, obj, parent=ROOT, point=Point(0, 0, 0),
+            transform=_IDENTITY):
+        """ Chainable shortcut for module level :func:`add` """
+        return add(self, obj, parent, point, transform)
+
+    def parent(self, obj):
+        row = self._parents[self._index[obj]]
+        return None if row < 0 else self._objects[row]
+
+    def children(self, obj) -> list:
+        """ Children of :obj: in insertion order. Do not modify """
+        return self._children[self._index[obj]]
+
+    def child_count(self, obj) -> int:
+        return len(self._children[self._index[obj]])
+
+    def descendants(self, obj, level=0):
+        """
+        Yields (descendant, depth) tuples of a pre-order DFS traversal of
+        the subtree of :obj:, children of :obj: have depth :level:
+        """
+        index, children = self._index, self._children
+        stack = [(child, level) for child in reversed(self.children(obj))]
+        while stack:
+            obj, level = stack.pop()
+            yield obj, level
+            below = children[index[obj]]
+            if below:
+                level += 1
+                stack.extend((child, level) for child in reversed(below))
+
+    def ascend(self, start, finish=ROOT):
+        """ Yields :start: and its ancestors up to :finish: """
+        while start is not finish:
+            yield start
+            start = self.parent(start)
+        yield finish
+
+    def transform(self, obj) -> np.ndarray:
+        """ Transform of :obj: relative to its parent. Do not modify """
+        return self._transforms[self._index[obj]]
+
+    def insert(self, obj, parent, transform, kind=AFFINE):
+        parent_row = -1 if parent is None else self._index[parent]
+        assert obj not in self._index, 'object is already being tracked'
+
+        self._own()
+        row = self._allocate(obj, parent_row)
+        self._transforms[row] = transform
+        self._kinds[row] = kind
+        self._invalidate_max_z(parent_row)
+
+    def insert_many(self, objs, parent, transforms, kind=AFFINE):
+        """
+        Insert all of :objs: under :parent:, :transforms: is a stack of
+        their transforms
+        """
+        parent_row = -1 if parent is None else self._index[parent]
+        assert len(set(objs)) == len(objs) and \
+            not any(obj in self._index for obj in objs), \
+            'object is already being tracked'
+
+        self._own()
+        rows = [self._allocate(obj, parent_row) for obj in objs]
+        self._transforms[rows] = transforms
+        self._kinds[rows] = kind
+        self._invalidate_max_z(parent_row)
+
+    def set_transform(self, obj, transform, kind=AFFINE):
+        row = self._index[obj]
+        self._own()
+        self._transforms[row] = transform
+        self._kinds[row] = kind
+        self._invalidate_max_z(self._parents[row])
+
+        stack = [row]
+        while stack:
+            row = stack.pop()
+            if self._valid[row]:
+                self._valid[row] = False
+                stack.extend(
+                    self._index[child] for child in self._children[row])
+
+    def delete(self, obj):
+        """ Stop tracking :obj: and all of its descendants """
+        row = self._index[obj]
+        self._own()
+
+        parent = self._parents[row]
+        if parent >= 0:
+            self._children[parent].remove(obj)
+        self._invalidate_max_z(parent)
+
+        stack = [row]
+        while stack:
+            row = stack.pop()
+            stack.extend(self._index[child] for child in self._children[row])
+            del self._index[self._objects[row]]
+            self._objects[row] = None
+            self._children[row] = None
+            self._parents[row] = -1
+            self._valid[row] = False
+            self._max_z_valid[row] = False
+            self._free.append(row)
+
+    def relative_many(self, srcs, dst) -> np.ndarray:
+        """
+        Returns a stack of matrices transforming points in each of :srcs:
+        coordinate systems to :dst: coordinate system
+        """
+        dst = self._index[dst]
+        srcs = np.fromiter(
+            (self._index[src] for src in srcs), dtype=np.intp)
+
+        ancestors = []
+        row = dst
+        while row >= 0:
+            ancestors.append(row)
+            row = self._parents[row]
+
+        # Lowest common ancestor of each src and dst, one level at a time
+        roots = srcs.copy()
+        pending = ~np.in1d(roots, ancestors)
+        while pending.any():
+            roots[pending] = self._parents[roots[pending]]
+            if (roots < 0).any():
+                raise KeyError('No common ancestor')
+            pending = ~np.in1d(roots, ancestors)
+
+        self._world(dst)
+        stale = srcs[~self._valid[srcs]]
+        self._hits += len(srcs) - len(stale)
+        for row in stale:
+            self._world(row)
+
+        # Top of the tree has identity products, so this is the same
+        # product of up and down paths that relative() computes
+        up = np.matmul(self._up[roots], self._up_inv[srcs])
+        down = np.matmul(self._down_inv[roots], self._down[dst])
+        return np.matmul(down, up)
+
+    def relative(self, src, dst) -> np.ndarray:
+        """
+        Returns the matrix transforming a point in :src: coordinate system
+        to :dst: coordinate system
+        """
+        src, dst = self._index[src], self._index[dst]
+
+        # Lowest common ancestor of src and dst
+        ancestors = set()
+        row = src
+        while row >= 0:
+            ancestors.add(row)
+            row = self._parents[row]
+        root = dst
+        while root not in ancestors:
+            root = self._parents[root]
+            if root < 0:
+                raise KeyError('No common ancestor')
+
+        self._world(src)
+        self._world(dst)
+        # Point in common root's coordinate system
+        if root == src:
+            res = np.identity(4)
+        elif self._parents[root] < 0:
+            res = self._up_inv[src]
+        else:
+            res = self._up[root].dot(self._up_inv[src])
+
+        # Point in destination's coordinate system
+        if root == dst:
+            return res
+        elif self._parents[root] < 0:
+            return self._down[dst].dot(res)
+        else:
+            return self._down_inv[root].dot(self._down[dst]).dot(res)
+
+    def max_z(self, obj) -> float:
+        """
+        Returns the highest Z of any descendant of :obj: in :obj: coordinate
+        system, or -inf if :obj: has no descendants
+        """
+        return self._subtree_max_z(self._index[obj])
+
+    def _subtree_max_z(self, row):
+        # Post-order over the invalidated part of the subtree, so that
+        # every node is computed from its children's memoized values. A
+        # valid node always has a valid subtree, which lets invalidation
+        # stop at the first invalid ancestor
+        stack = [(row, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if self._max_z_valid[node]:
+                continue
+            children = [self._index[obj] for obj in self._children[node]]
+            if not expanded:
+                stack.append((node, True))
+                stack.extend(
+                    (child, False) for child in children
+                    if not self._max_z_valid[child])
+                continue
+
+            res = -np.inf
+            if children:
+                translated = self._kinds[children] == TRANSLATION
+                # descendants of a translated child are only shifted by
+                # the child's origin
+                z = -self._transforms[children, 2, 3] + \
+                    np.maximum(0.0, self._max_z[children])
+                if translated.any():
+                    res = z[translated].max()
+                for child in np.array(children)[~translated]:
+                    child = self._objects[child]
+                    subtree = [child] + [
+                        obj for obj, _ in self.descendants(child)]
+                    res = max(res, self.relative_many(
+                        subtree, self._objects[node])[:, 2, 3].max())
+
+            self._max_z[node] = res
+            self._max_z_valid[node] = True
+
+        return self._max_z[row]
+
+    def _invalidate_max_z(self, row):
+        while row >= 0 and self._max_z_valid[row]:
+            self._max_z_valid[row] = False
+            row = self._parents[row]
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(hits=self._hits, misses=self._misses)
+
+    def _world(self, row):
+        # Make sure memoized products for row and its ancestors are valid
+        if self._valid[row]:
+            self._hits += 1
+            return
+
+        path = []
+        while row >= 0 and not self._valid[row]:
+            path.append(row)
+            row = self._parents[row]
+        self._misses += len(path)
+
+        for row in reversed(path):
+            parent = self._parents[row]
+            if parent < 0:
+                # top of the tree is excluded from the products
+                self._up[row] = self._up_inv[row] = _IDENTITY
+                self._down[row] = self._down_inv[row] = _IDENTITY
+                self._world_kinds[row] = TRANSLATION
+            else:
+                transform = self._transforms[row]
+                kind = max(self._kinds[row], self._world_kinds[parent])
+                self._up[row] = transform.dot(self._up[parent])
+                self._up_inv[row] = invert(self._up[row], kind)
+                if kind == TRANSLATION:
+                    # translations commute, so both orders are the same
+                    self._down[row] = self._up[row]
+                    self._down_inv[row] = self._up_inv[row]
+                else:
+                    self._down[row] = self._down[parent].dot(transform)
+                    self._down_inv[row] = invert(self._down[row], kind)
+                self._world_kinds[row] = kind
+            self._valid[row] = True
+
+    def snapshot(self) -> 'PoseTree':
+        """
+        Returns an independent copy of the tree. Storage is shared
+        (copy-on-write) until either tree is modified
+        """
+        clone = PoseTree.__new__(PoseTree)
+        clone.__dict__.update(self.__dict__)
+        self._shared = clone._shared = True
+        return clone
+
+    def copy(self) -> 'PoseTree':
+        return self.snapshot()
+
+    def _own(self):
+        # Take exclusive ownership of the storage before the first write
+        # following a snapshot
+        if not self._shared:
+            return
+        self._index = dict(self._index)
+        self._objects = list(self._objects)
+        self._children = [
+            None if children is None else list(children)
+            for children in self._children]
+        self._free = list(self._free)
+        for name in self._arrays:
+            setattr(self, name, getattr(self, name).copy())
+        self._shared = False
+
+    _arrays = (
+        '_parents', '_transforms', '_kinds', '_valid',
+        '_up', '_up_inv', '_down', '_down_inv', '_world_kinds',
+        '_max_z_valid', '_max_z')
+
+    def _allocate(self, obj, parent_row):
+        if self._free:
+            row = self._free.pop()
+            self._objects[row] = obj
+            self._children[row] = []
+        else:
+            row = len(self._objects)
+            if row == len(self._parents):
+                self._grow()
+            self._objects.append(obj)
+            self._children.append([])
+
+        self._index[obj] = row
+        self._parents[row] = parent_row
+        self._valid[row] = False
+        if parent_row >= 0:
+            self._children[parent_row].append(obj)
+        return row
+
+    def _grow(self):
+        size = len(self._parents)
+        for name in self._arrays:
+            old = getattr(self, name)
+            new = np.zeros((size * 2, *old.shape[1:]), dtype=old.dtype)
+            new[:size] = old
+            setattr(self, name, new)
+        self._parents[size:] = -1
+
+
 def init():
-    return add({}, ROOT, parent=None)
+    return add(PoseTree(), ROOT, parent=None)
 
 
 def add(
-        state: Dict[object, Node],
+        state: PoseTree,
         obj,
         parent=ROOT,
         point=Point(0, 0, 0),
-        transform=np.identity(4)) -> Dict[object, Node]:
+        transform=_IDENTITY) -> PoseTree:
 
     if isinstance(transform, list):
         transform = np.array(transform)
 
-    state = bind(state)
-
-    if parent is not None:
-        state[parent] = state[parent].add(obj)
+    state.insert(
+        obj,
+        parent,
+        transform.dot(invert(translate(point), TRANSLATION)),
+        kind_of(transform))
+    return state
 
-    assert obj not in state, 'object is already being tracked'
 
-    state[obj] = Node(
-        parent=parent,
-        children=[],
-        transform=transform.dot(inv(translate(point)))
-    )
+def add_many(
+        state: PoseTree,
+        objs,
+        parent=ROOT,
+        points=None,
+        transform=_IDENTITY) -> PoseTree:
+    """
+    Add all of :objs: as children of :parent:, equivalent to calling
+    :func:`add` for each object and its point in :points:
+    """
+    if isinstance(transform, list):
+        transform = np.array(transform)
 
+    transforms = np.tile(_IDENTITY, (len(objs), 1, 1))
+    if points is not None:
+        transforms[:, :3, 3] = np.negative(points)
+    state.insert_many(
+        objs,
+        parent,
+        np.matmul(transform, transforms),
+        kind_of(transform))
     return state
 
 
-def remove(state, obj):
-    state = state.copy()
-    nodes = descendants(state, obj) + [(obj, 0)]
-
-    # remove object references from their parent's children
-    for child, *_ in nodes:
-        parent = state[child].parent
-        if parent in state:
-            state[parent] = state[parent].remove(child)
-        del state[child]
+def remove(state: PoseTree, obj) -> PoseTree:
+    state.delete(obj)
     return state
 
 
-def update(state, obj, point: Point, transform=np.identity(4)):
-    state = state.copy()
-    state[obj] = state[obj].update(
-        transform.dot(inv(translate(point)))
-    )
+def update(state: PoseTree, obj, point: Point, transform=_IDENTITY):
+    state.set_transform(
+        obj,
+        transform.dot(invert(translate(point), TRANSLATION)),
+        kind_of(transform))
     return state
 
 
+def snapshot(state: PoseTree) -> PoseTree:
+    """
+    Returns a copy of :state: that is not affected by later
+    :func:`add`, :func:`update` or :func:`remove` calls on :state:
+    """
+    return state.snapshot()
+
+
+def cache_info(state: PoseTree) -> CacheInfo:
+    """
+    Returns hits and misses of the memoized transforms in :state:, misses
+    count every node whose transforms had to be recomputed
+    """
+    return state.cache_info()
+
+
+def iter_descendants(state, obj, level=0):
+    """ Lazy version of :func:`descendants` """
+    return state.descendants(obj, level)
+
+
 def descendants(state, obj, level=0):
     """ Returns a flattened list tuples of DFS traversal of subtree
     from object that contains descendant object and it's depth """
-    return sum([
-        [(child, level)] + descendants(state, child, level + 1)
-        for child in state[obj].children
-    ], [])
+    return list(state.descendants(obj, level))
 
 
 def has_children(state, obj):
-    return True if len(descendants(state, obj)) > 0 else False
+    return state.child_count(obj) > 0
+
+
+def iter_ascend(state, start, finish=ROOT):
+    """ Lazy version of :func:`ascend` """
+    return state.ascend(start, finish)
 
 
 def ascend(state, start, finish=ROOT) -> List[Node]:
-    if start is finish:
-        return [finish]
-    return [start] + ascend(state, start=state[start].parent, finish=finish)
+    return list(state.ascend(start, finish))
 
 
 def change_base(state, point=Point(0, 0, 0), src=ROOT, dst=ROOT):
@@ -133,29 +594,21 @@ def change_base(state, point=Point(0, 0, 0), src=ROOT, dst=ROOT):
     Transforms point from source coordinate system to destination.
     Point(0, 0, 0) means the origin of the source.
     """
-    def fold(objects):
-        return functools.reduce(
-            lambda a, b: a.dot(b),
-            [state[key].transform for key in objects],
-            np.identity(4)
-        )
-
-    up, down = ascend(state, src), list(reversed(ascend(state, dst)))
-
-    # Find common prefix. Last item is common root
-    root = [n1 for n1, n2 in zip(reversed(up), down) if n1 is n2].pop()
-
-    # Nodes up to root, EXCLUDING root
-    up = list(itertools.takewhile(lambda node: node is not root, up))
-
-    # Nodes down from root, EXCLUDING root
-    down = list(itertools.dropwhile(lambda node: node is not root, down))[1:]
+    return state.relative(src, dst).dot((*point, 1))[:-1]
 
-    # Point in root's coordinate system
-    point_in_root = inv(fold(up)).dot((*point, 1))
 
-    # Return point in destination's coordinate system
-    return fold(down).dot(point_in_root)[:-1]
+def change_base_many(state, points=None, srcs=(), dst=ROOT) -> np.ndarray:
+    """
+    Batched :func:`change_base`: transforms each point from the coordinate
+    system of the corresponding object in :srcs: to :dst:. If :points: is
+    None origins of :srcs: are transformed. Returns an N x 3 array
+    """
+    matrices = state.relative_many(srcs, dst)
+    if points is None:
+        return matrices[:, :3, 3].copy()
+    points = np.asarray(points, dtype=float)
+    return np.einsum(
+        'nij,nj->ni', matrices[:, :3, :3], points) + matrices[:, :3, 3]
 
 
 def absolute(state, obj):
@@ -166,34 +619,31 @@ def absolute(state, obj):
 
 
 def max_z(state, root):
-    test = [
-        (obj, Point(*change_base(state, src=obj, dst=root)).z)
-        for obj, _ in descendants(state, root)
-    ]
-
-    # from pprint import pprint
-    # pprint(test, indent=2)
-    m = max([i[1] for i in test])
-    return m
+    """
+    Returns the highest Z of any descendant of :root: in :root:
+    coordinate system. Memoized per subtree, so repeated calls are O(1)
+    until a node under :root: is added, removed or moved
+    """
+    res = state.max_z(root)
+    if res == -np.inf:
+        raise ValueError('{} has no descendants'.format(root))
+    return res
 
 
 def stringify(state, root=None):
     if root is None:
         root = ascend(state, next(iter(state)))[-1]
 
-    info = [
-        (obj, level, change_base(state, src=obj, dst=root))
-        for obj, level in [(root, 0)] + descendants(state, root, level=1)]
+    info = [(root, 0)] + descendants(state, root, level=1)
+    worlds = change_base_many(state, srcs=[obj for obj, _ in info], dst=root)
 
     return '\n'.join([
         ' ' * level + '{} {}'.format(str(obj), world)
-        for obj, level, world in info
+        for (obj, level), world in zip(info, worlds)
     ])
 
 
 def bind(state):
-    state = UserDict(state.copy())
-    # add syntax sugar for chaining add operations
-    state.add = functools.partial(add, state)
-
+    # PoseTree already supports chaining add operations. Kept for
+    # compatibility with callers written against the dict-based tree
     return state
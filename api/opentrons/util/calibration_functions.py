@@ -49,6 +49,7 @@ def calibrate_container_with_delta(
     if ff.split_labware_definitions():
         for well in container.wells():
             well._coordinates = well._coordinates + delta
+        container.invalidate_geometry()
     else:
         container._coordinates = container._coordinates + delta
 
@@ -1,6 +1,7 @@
 import math
 
 import json
+import numpy as np
 
 
 from builtins import property as _property, tuple as _tuple
@@ -77,7 +78,17 @@ class VectorEncoder(json.JSONEncoder):
             return str(obj)
 
 
+def _value(x, y, z):
+    # VectorValue(x, y, z) without the extra __new__ call
+    return _tuple.__new__(value_type, (x, y, z))
+
+
 class Vector(object):
+    """
+    Immutable x, y, z coordinates, stored as a single :VectorValue:
+    """
+    __slots__ = ('coordinates',)
+
     zero_vector = None
 
     @classmethod
@@ -90,14 +101,14 @@ class Vector(object):
 
     @classmethod
     def coordinates_from_dict(cls, dictionary):
-        kwargs = {}
-        for axis in 'xyz':
-            kwargs[axis] = dictionary.get(axis, 0)
-        return value_type(**kwargs)
+        return _value(
+            dictionary.get('x', 0),
+            dictionary.get('y', 0),
+            dictionary.get('z', 0))
 
     @classmethod
     def coordinates_from_iterable(cls, iterable):
-        return value_type(
+        return _value(
             iterable[0],
             iterable[1],
             iterable[2])
@@ -112,22 +123,19 @@ class Vector(object):
         return hasattr(arg, "__iter__") or hasattr(arg, "__getitem__")
 
     def length(self):
-        return math.sqrt(
-            pow(self.coordinates.x, 2) +
-            pow(self.coordinates.y, 2) +
-            pow(self.coordinates.z, 2)
-        )
+        x, y, z = self.coordinates
+        return math.sqrt(x * x + y * y + z * z)
 
     def __init__(self, *args, **kwargs):
-        # self.coordinates = self.zero_coordinates()
-
         args_len = len(args)
-        if args_len == 1:
+        if args_len == 3:
+            self.coordinates = _tuple.__new__(value_type, args)
+        elif args_len == 1:
             arg = args[0]
-            if isinstance(arg, dict):
-                self.coordinates = Vector.coordinates_from_dict(arg)
-            elif isinstance(arg, Vector):
+            if isinstance(arg, Vector):
                 self.coordinates = arg.coordinates
+            elif isinstance(arg, dict):
+                self.coordinates = Vector.coordinates_from_dict(arg)
             elif self.is_iterable(arg):
                 self.coordinates = Vector.coordinates_from_iterable(arg)
             else:
@@ -135,75 +143,151 @@ class Vector(object):
                     ("One argument supplied "
                      "expected to be dict or iterable, received {}")
                     .format(type(arg)))
-        elif args_len == 3:
-            self.coordinates = value_type(*args)
         else:
             raise ValueError("Expected either a dict/iterable or x, y, z")
 
-    def __eq__(self, other):
+    @classmethod
+    def _make(cls, x, y, z):
+        # skips argument checks in __init__
+        vector = object.__new__(cls)
+        vector.coordinates = _tuple.__new__(value_type, (x, y, z))
+        return vector
+
+    def _other(self, other):
+        # coordinates of the other operand, the way __eq__ accepts it
         if isinstance(other, Vector):
-            return all(
-                [isclose(a, b, rel_tol=1e-5)
-                 for a, b in zip(self, other)]
-            )
+            return other.coordinates
         elif isinstance(other, dict):
-            return self == Vector(other)
+            return Vector.coordinates_from_dict(other)
         elif self.is_iterable(other):
-            return self == Vector(other)
+            return Vector.coordinates_from_iterable(other)
         else:
             raise ValueError("Expected operand to be dict, iterable or vector")
 
+    def __eq__(self, other):
+        ax, ay, az = self.coordinates
+        bx, by, bz = self._other(other)
+        return abs(ax - bx) < 1e-5 and \
+            abs(ay - by) < 1e-5 and \
+            abs(az - bz) < 1e-5
+
     def __add__(self, other):
-        other = other
-        return Vector(
-            self.coordinates.x + other[0],
-            self.coordinates.y + other[1],
-            self.coordinates.z + other[2]
-        )
+        if isinstance(other, Vector):
+            other = other.coordinates
+        x, y, z = self.coordinates
+        return Vector._make(x + other[0], y + other[1], z + other[2])
 
     def __sub__(self, other):
-        other = other
-        return Vector(
-            [a - b for a, b in zip(self, other)])
+        if isinstance(other, Vector):
+            other = other.coordinates
+        x, y, z = self.coordinates
+        return Vector._make(x - other[0], y - other[1], z - other[2])
 
     def __truediv__(self, other):
+        x, y, z = self.coordinates
         if isinstance(other, Vector):
-            return Vector(
-                [a / b for a, b in zip(self, other)])
+            ox, oy, oz = other.coordinates
+            return Vector._make(x / ox, y / oy, z / oz)
 
         scalar = float(other)
-        return self / Vector(scalar, scalar, scalar)
+        return Vector._make(x / scalar, y / scalar, z / scalar)
 
     def __mul__(self, other):
+        x, y, z = self.coordinates
         if isinstance(other, Vector):
-            return Vector(
-                [a * b for a, b in zip(self, other)])
+            ox, oy, oz = other.coordinates
+            return Vector._make(x * ox, y * oy, z * oz)
 
         scalar = float(other)
-        return self * Vector(scalar, scalar, scalar)
+        return Vector._make(x * scalar, y * scalar, z * scalar)
 
     def __str__(self):
-        return "(x={:.2f}, y={:.2f}, z={:.2f})".format(
-            self.coordinates.x,
-            self.coordinates.y,
-            self.coordinates.z,
-        )
+        return "(x={:.2f}, y={:.2f}, z={:.2f})".format(*self.coordinates)
 
     def __repr__(self):
         return str(self)
 
     def __getitem__(self, index):
-        res = None
-        if isinstance(index, int):
-            res = self.coordinates[index]
+        if isinstance(index, int) or isinstance(index, slice):
+            return self.coordinates[index]
         elif isinstance(index, str):
-            res = getattr(self.coordinates, index)
-        elif isinstance(index, slice):
-            res = self.coordinates[index]
+            return getattr(self.coordinates, index)
         else:
             raise IndexError('Expected slice or string as an index')
 
-        return res
+    def __iter__(self):
+        return iter(self.coordinates)
+
+
+class VectorArray(object):
+    """
+    Many :Vector:s as one N x 3 NumPy array, for math over whole
+    containers at once
+
+    Supports +, -, * and / with another :VectorArray: or list of vectors
+    of the same length, a single :Vector: or (x, y, z) tuple applied to
+    every row, or a scalar
+    """
+    __slots__ = ('array',)
+
+    def __init__(self, vectors=()):
+        if isinstance(vectors, VectorArray):
+            vectors = vectors.array
+        elif not isinstance(vectors, np.ndarray):
+            vectors = [tuple(vector) for vector in vectors]
+        self.array = np.array(vectors, dtype=float).reshape(-1, 3)
+
+    @classmethod
+    def _wrap(cls, array):
+        vectors = object.__new__(cls)
+        vectors.array = array
+        return vectors
+
+    def _other(self, other):
+        if isinstance(other, VectorArray):
+            return other.array
+        elif isinstance(other, Vector):
+            return other.coordinates
+        elif isinstance(other, list):
+            return VectorArray(other).array
+        return other
+
+    def __len__(self):
+        return len(self.array)
 
     def __iter__(self):
-        return iter(self.to_tuple())
+        return (Vector._make(*row) for row in self.array.tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return VectorArray._wrap(self.array[index])
+        return Vector._make(*self.array[index].tolist())
+
+    def __eq__(self, other):
+        other = self._other(other)
+        return bool(np.all(np.abs(self.array - other) < 1e-5))
+
+    def __add__(self, other):
+        return VectorArray._wrap(self.array + self._other(other))
+
+    def __sub__(self, other):
+        return VectorArray._wrap(self.array - self._other(other))
+
+    def __mul__(self, other):
+        return VectorArray._wrap(self.array * self._other(other))
+
+    def __truediv__(self, other):
+        return VectorArray._wrap(self.array / self._other(other))
+
+    def __repr__(self):
+        return '<VectorArray: {}>'.format(
+            ', '.join(str(vector) for vector in self))
+
+    def lengths(self):
+        """
+        Returns the length of every vector as a NumPy array
+        """
+        return np.sqrt((self.array * self.array).sum(axis=1))
+
+    def to_list(self):
+        return list(self)
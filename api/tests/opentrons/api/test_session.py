@@ -3,7 +3,7 @@ import pytest
 
 from opentrons.broker import publish
 from opentrons.api import Session
-from opentrons.api.session import _accumulate, _get_labware, _dedupe
+from opentrons.api.session import _collect_labware, _get_labware, _group
 from tests.opentrons.conftest import state
 from functools import partial
 
@@ -159,15 +159,15 @@ def test_get_instruments_and_containers(labware_setup, virtual_smoothie_env):
     p100, p1000 = instruments
 
     instruments, containers, modules, interactions = \
-        _accumulate([_get_labware(command) for command in commands])
+        _collect_labware(commands)
 
     session = Session(name='', text='')
-    # We are calling dedupe directly for testing purposes.
-    # Normally it is called from within a session
-    session._instruments.extend(_dedupe(instruments))
-    session._containers.extend(_dedupe(containers))
-    session._modules.extend(_dedupe(modules))
-    session._interactions.extend(_dedupe(interactions))
+    # We are collecting labware directly for testing purposes.
+    # Normally it is collected from within a session
+    session._instruments.extend(instruments)
+    session._containers.extend(containers)
+    session._modules.extend(modules)
+    session._interactions.extend(interactions)
 
     instruments = session.get_instruments()
     containers = session.get_containers()
@@ -191,19 +191,9 @@ def test_get_instruments_and_containers(labware_setup, virtual_smoothie_env):
     assert modules == []
 
 
-def test_accumulate():
-    res = \
-        _accumulate([
-            (['a'], ['d'], ['g', 'h']),
-            (['b', 'c'], ['e', 'f'], ['i'])
-        ])
-
-    assert res == (['a', 'b', 'c'], ['d', 'e', 'f'], ['g', 'h', 'i'])
-    assert _accumulate([]) == ([], [], [], [])
-
-
-def test_dedupe():
-    assert ''.join(_dedupe('aaaaabbbbcbbbbcccaa')) == 'abc'
+def test_group():
+    assert _group([('a', 1), ('b', 2), ('a', 3)]) == {'a': [1, 3], 'b': [2]}
+    assert _group([]) == {}
 
 
 def test_get_labware(labware_setup):
@@ -222,22 +212,12 @@ def test_get_labware(labware_setup):
          [],
          [(p1000, plates[0]), (p1000, plates[1])])
 
-    instruments, containers, modules, interactions = \
-        _accumulate([_get_labware(command) for command in commands])
-
-    assert \
-        [
-            list(_dedupe(instruments)),
-            list(_dedupe(containers)),
-            list(_dedupe(modules)),
-            list(_dedupe(interactions))
-        ] == \
-        [
-            [p100, p1000],
-            [plates[0], plates[1]],
-            [],
-            [(p100, plates[0]), (p1000, plates[0]), (p1000, plates[1])]
-        ]
+    assert _collect_labware(commands * 2) == (
+        [p100, p1000],
+        [plates[0], plates[1]],
+        [],
+        [(p100, plates[0]), (p1000, plates[0]), (p1000, plates[1])])
+    assert _collect_labware([]) == ([], [], [], [])
 
 
 async def test_session_model_functional(session_manager, protocol):
@@ -283,3 +263,69 @@ async def test_session_create_error(main_router):
     with pytest.raises(TimeoutError):
         # No state change is expected
         await main_router.wait_until(lambda _: True)
+
+
+def test_estimated_duration(virtual_smoothie_env):
+    text = '\n'.join([
+        'from opentrons import instruments, labware, robot',
+        'tiprack = labware.load("tiprack-200ul", "1")',
+        'plate = labware.load("96-flat", "2")',
+        'p300 = instruments.P300_Single(mount="right", tip_racks=[tiprack])',
+        'p300.pick_up_tip()',
+        'p300.aspirate(100, plate[0])',
+        'p300.delay(seconds=30)',
+        'robot.comment("halfway")',
+        'p300.dispense(100, plate[1])',
+    ])
+    session = Session('estimate', text)
+
+    commands = {}
+
+    def traverse(tree):
+        for command in tree:
+            commands[command['description'].split()[0]] = command['id']
+            traverse(command['children'])
+    traverse(session.commands)
+
+    durations = session.command_durations
+    assert len(durations) == len(commands)
+    assert durations[commands['Delaying']] == pytest.approx(30)
+    assert durations[commands['halfway']] == 0
+    for name in ['Picking', 'Aspirating', 'Dispensing']:
+        assert 0 < durations[commands[name]] < 30
+    assert session.estimated_duration >= sum(durations)
+
+
+def test_superseded_snapshots():
+    from opentrons.api.routers import _superseded
+
+    def snapshot(state, command_id):
+        last_command = None if command_id is None else \
+            {'id': command_id, 'handledAt': 0}
+        return {
+            'topic': Session.TOPIC,
+            'payload': {
+                'state': state, 'startTime': 0, 'lastCommand': last_command}}
+
+    assert _superseded(snapshot('running', None), snapshot('running', 0))
+    assert _superseded(snapshot('running', 1), snapshot('running', 2))
+    assert not _superseded(snapshot('running', 2), snapshot('running', 1))
+    assert not _superseded(snapshot('running', 1), snapshot('paused', 2))
+    assert not _superseded(
+        {'topic': 'calibration', 'payload': {}}, snapshot('running', 1))
+
+
+def test_droppable_notifications():
+    from opentrons.api.routers import _droppable
+
+    running = {
+        'topic': Session.TOPIC,
+        'payload': {'state': 'running', 'startTime': 0, 'lastCommand': None}}
+    finished = {
+        'topic': Session.TOPIC,
+        'payload': {**running['payload'], 'state': 'finished'}}
+
+    assert _droppable(running)
+    assert not _droppable(finished)
+    assert not _droppable({'topic': Session.TOPIC, 'payload': object()})
+    assert not _droppable({'topic': 'calibration', 'payload': {}})
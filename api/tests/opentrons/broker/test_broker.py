@@ -1,4 +1,4 @@
-from opentrons.broker import subscribe
+from opentrons.broker import broker, subscribe, has_subscribers
 from opentrons import commands
 
 
@@ -62,3 +62,75 @@ def test_add_listener():
     A(0, 2)
 
     assert calls == expected, 'No calls expected after unsubscribe()'
+
+
+def test_command_args():
+    def instrument_command(instrument, volume=10, location=None):
+        return {
+            'name': 'command',
+            'payload': {
+                'instrument': instrument,
+                'volume': volume,
+                'location': location
+            }
+        }
+
+    class Instrument:
+        @commands.publish.before(command=instrument_command)
+        def aspirate(self, volume=None, location=None, rate=1.0):
+            pass
+
+    messages = []
+    unsubscribe = subscribe('command', messages.append)
+
+    instrument = Instrument()
+    instrument.aspirate()
+    instrument.aspirate(50, location='A1')
+    instrument.aspirate(location='B2', volume=20)
+
+    unsubscribe()
+
+    assert [message['payload'] for message in messages] == [
+        {'instrument': instrument, 'volume': None, 'location': None},
+        {'instrument': instrument, 'volume': 50, 'location': 'A1'},
+        {'instrument': instrument, 'volume': 20, 'location': 'B2'}]
+
+
+def test_has_subscribers():
+    calls = []
+
+    def handler(message):
+        calls.append(message)
+        # unsubscribing while the message is being published is safe
+        unsubscribe()
+
+    assert not has_subscribers('topic')
+    unsubscribe = subscribe('topic', handler)
+    assert has_subscribers('topic')
+
+    broker.publish('topic', 1)
+    broker.publish('topic', 2)
+    assert calls == [1]
+    assert not has_subscribers('topic')
+
+
+def test_no_command_subscribers(monkeypatch):
+    built = []
+
+    def counting_command(arg1, meta=None, arg2='', arg3=''):
+        built.append(arg1)
+        return my_command(arg1, meta, arg2, arg3)
+
+    @commands.publish.both(command=counting_command, meta='{arg1}')
+    def D(arg1):
+        return arg1
+
+    # the robot's command log is always subscribed, set it aside
+    monkeypatch.setattr(broker, 'subscriptions', {})
+    assert D(1) == 1
+    assert built == []
+
+    unsubscribe = subscribe('command', lambda message: None)
+    assert D(2) == 2
+    assert built == [2]
+    unsubscribe()
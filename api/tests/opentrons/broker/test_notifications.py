@@ -0,0 +1,118 @@
+import asyncio
+import threading
+
+import pytest
+
+from opentrons.broker import Notifications
+from opentrons.broker.broker import DROP
+
+
+@pytest.fixture
+def event_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def _receive(loop, notifications, count):
+    async def receive():
+        return [await notifications.__anext__() for _ in range(count)]
+    return loop.run_until_complete(receive())
+
+
+def test_batched_delivery(event_loop):
+    notifications = Notifications(loop=event_loop)
+
+    thread = threading.Thread(
+        target=lambda: [notifications.on_notify(i) for i in range(100)])
+    thread.start()
+    thread.join()
+
+    assert notifications.queue.qsize() == 0
+    assert _receive(event_loop, notifications, 100) == list(range(100))
+    assert not notifications._pending
+
+
+def test_coalesce(event_loop):
+    def superseded(previous, message):
+        return previous[0] == message[0]
+
+    notifications = Notifications(loop=event_loop, coalesce=superseded)
+    for message in ['a1', 'a2', 'b1', 'a3', 'a4']:
+        notifications.on_notify(message)
+
+    assert _receive(event_loop, notifications, 3) == ['a2', 'b1', 'a4']
+
+
+def test_drop(event_loop):
+    notifications = Notifications(loop=event_loop, maxsize=2, overflow=DROP)
+    for i in range(5):
+        notifications.on_notify(i)
+
+    assert _receive(event_loop, notifications, 2) == [3, 4]
+
+
+def test_drop_only_droppable(event_loop):
+    notifications = Notifications(
+        loop=event_loop, maxsize=2, overflow=DROP,
+        droppable=lambda message: message.startswith('running'))
+    for message in ['running1', 'calibrated', 'running2', 'running3',
+                    'finished', 'stopped']:
+        notifications.on_notify(message)
+
+    # nothing is left to drop for 'stopped', which goes over maxsize
+    assert _receive(event_loop, notifications, 3) == [
+        'calibrated', 'finished', 'stopped']
+
+
+def test_block(event_loop):
+    notifications = Notifications(loop=event_loop, maxsize=2)
+    published = []
+
+    def publish():
+        for i in range(10):
+            notifications.on_notify(i)
+            published.append(i)
+
+    thread = threading.Thread(target=publish)
+    thread.start()
+    thread.join(0.2)
+    # the publisher waits for the consumer once 2 messages are pending
+    assert thread.is_alive()
+    assert published == [0, 1]
+
+    assert _receive(event_loop, notifications, 10) == list(range(10))
+    thread.join()
+    assert published == list(range(10))
+
+
+def test_block_several_publishers(event_loop):
+    notifications = Notifications(loop=event_loop, maxsize=1)
+
+    def publish(name):
+        for i in range(5):
+            notifications.on_notify((name, i))
+
+    threads = [
+        threading.Thread(target=publish, args=(name,))
+        for name in 'abc']
+    for thread in threads:
+        thread.start()
+
+    async def receive():
+        return [await notifications.__anext__() for _ in range(15)]
+
+    # a publisher left waiting would leave a message short
+    received = event_loop.run_until_complete(
+        asyncio.wait_for(receive(), 5, loop=event_loop))
+    for thread in threads:
+        thread.join(1)
+        assert not thread.is_alive()
+    assert notifications._waiting == 0
+    for name in 'abc':
+        assert [i for n, i in received if n == name] == list(range(5))
+
+
+def test_overflow_policy(event_loop):
+    with pytest.raises(ValueError):
+        Notifications(loop=event_loop, overflow='spill')
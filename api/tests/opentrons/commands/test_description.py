@@ -1,4 +1,5 @@
 import pytest
+from opentrons import commands
 from opentrons.commands import stringify_location
 
 
@@ -22,3 +23,28 @@ def test_all(containers):
         'wells A1...H1 in "11"'
     assert stringify_location(containers['11'].rows('A', 'B')) == \
         'wells A1...B12 in "11"'
+
+
+def test_lazy_text(containers, monkeypatch):
+    rendered = []
+
+    def counting_stringify(location):
+        rendered.append(location)
+        return stringify_location(location)
+
+    monkeypatch.setattr(commands.commands, 'stringify_location',
+                        counting_stringify)
+
+    payload = commands.aspirate(
+        instrument=None, volume=10, location=containers['1'][0], rate=1.0
+    )['payload']
+    assert rendered == []
+    assert 'text' in payload
+
+    assert payload['text'] == \
+        'Aspirating 10 uL from well A1 in "1" at 1.0 speed'
+    assert payload.get('text') == payload['text']
+    assert len(rendered) == 1
+
+    assert commands.delay(seconds=5, minutes=1)['payload']['text'] == \
+        'Delaying for 1m 5s'
@@ -1,5 +1,11 @@
+import copy
+import gc
+import pickle
+import pytest
 from math import pi
-from opentrons.containers.placeable import Deck, Slot
+from opentrons.containers import placeable
+from opentrons.containers.placeable import Deck, Slot, Well
+from opentrons.data_storage import database
 from opentrons.config import feature_flags as ff
 
 from tests.opentrons import generate_plate
@@ -49,3 +55,130 @@ def test_well_from_center():
     assert plate['B2'].from_center(r=1.0, theta=pi / 2, h=5.0) == (5, 10, 60)
     assert plate['B2'].top()[1] == (5, 5, 20)
     assert plate['B2'].bottom()[1] == (5, 5, 0)
+
+
+def test_compact_wells():
+    plate = generate_plate(
+        wells=4,
+        cols=2,
+        spacing=(10, 10),
+        offset=(0, 0),
+        radius=5,
+        height=20
+    )
+    a1, b2 = plate['A1'], plate['B2']
+
+    assert not hasattr(a1, '__dict__')
+    assert not a1.has_children()
+    assert a1.children_by_name is b2.children_by_name
+
+    assert a1.properties is b2.properties
+    assert a1.properties['width'] == 10
+    with pytest.raises(TypeError):
+        a1.properties['height'] = 5
+
+
+def test_compact_wells_copy():
+    plate = database.load_container('96-flat')
+
+    for copied in (copy.deepcopy(plate), pickle.loads(pickle.dumps(plate))):
+        a1, b2 = copied['A1'], copied['B2']
+        assert a1.properties == plate['A1'].properties
+        assert a1.properties is b2.properties
+        assert a1.children_by_name is b2.children_by_name
+        assert not a1.has_children()
+        assert [w.get_name() for w in copied] == \
+            [w.get_name() for w in plate]
+
+
+def test_well_properties_released():
+    properties = {'depth': 1.25, 'diameter': 3.75, 'total-liquid-volume': 9}
+    wells = [Well(properties=properties) for _ in range(2)]
+    key = tuple(sorted(wells[0].properties.items()))
+    assert placeable._well_properties[key] is wells[1].properties
+
+    del wells
+    gc.collect()
+    assert key not in placeable._well_properties
+
+
+def test_well_geometry_table():
+    deck = Deck()
+    slot = Slot()
+    plate = generate_plate(
+        wells=4,
+        cols=2,
+        spacing=(10, 10),
+        offset=(1, 2),
+        radius=5,
+        height=20
+    )
+    deck.add(slot, 'A1', (0, 0, 0))
+    slot.add(plate)
+    well = plate['B2']
+
+    geometry = plate.geometry()
+    assert geometry is plate.geometry()
+    row = geometry.index[well]
+    assert tuple(geometry.centers[row]) == (5, 5, 10)
+    assert tuple(geometry.tops[row]) == (5, 5, 20)
+    assert tuple(geometry.bottoms[row]) == (5, 5, 0)
+    assert tuple(geometry.offsets[row]) == (11, 12, 0)
+    assert well.top(reference=plate)[1] == (16, 17, 20)
+
+    # moving a well requires invalidating the table
+    well._coordinates = well._coordinates + (1, 1, 1)
+    plate.invalidate_geometry()
+    assert well.top(reference=plate)[1] == (17, 18, 21)
+
+    # adding a child invalidates it
+    plate.add(Well(properties={'radius': 1}), 'C1', (0, 0, 0))
+    assert plate.geometry() is not geometry
+    assert plate['C1'].top()[1] == (1, 1, 0)
+
+
+def test_indexed_children(monkeypatch):
+    monkeypatch.setattr(ff, 'split_labware_definitions', lambda: True)
+    plate = generate_plate(
+        wells=4,
+        cols=2,
+        spacing=(10, 10),
+        offset=(0, 0),
+        radius=5
+    )
+    assert [w.get_name() for w in plate] == ['A1', 'B1', 'A2', 'B2']
+    assert plate[1] is plate['B1']
+    assert plate.get_index_from_name('A2') == 2
+    assert next(plate['B1']) is plate['A2']
+    with pytest.raises(ValueError):
+        plate.get_index_from_name('C1')
+
+    # reordering and adding children invalidate the cached order
+    plate.ordering = [['B1', 'A1'], ['B2', 'A2']]
+    assert plate[0] is plate['B1']
+    plate.ordering[1].append('C1')
+    plate.add(Well(properties={'radius': 1}), 'C1', (0, 0, 0))
+    assert len(plate) == 5
+    assert plate[-1] is plate['C1']
+    assert plate.wells('A2', to='C1').get_children_list() == \
+        [plate['A2'], plate['C1']]
+
+
+def test_well_series_indexed_children():
+    plate = generate_plate(
+        wells=4,
+        cols=2,
+        spacing=(10, 10),
+        offset=(0, 0),
+        radius=5
+    )
+    series = plate.wells('A1', length=3)
+    assert series.get_children() is series.get_children()
+    assert series[2] is plate[2]
+    assert series.get_index_from_name(plate[1].get_name()) == 1
+    with pytest.raises(ValueError):
+        series.get_index_from_name(plate[3].get_name())
+
+    rows = plate.rows
+    assert rows.get_index_from_name('B') == 1
+    assert rows[1] is rows['B']
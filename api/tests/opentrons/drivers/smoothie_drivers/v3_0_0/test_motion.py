@@ -0,0 +1,46 @@
+import pytest
+
+from opentrons.drivers.smoothie_drivers import motion
+
+ACCELERATION = motion.parse_acceleration('M204 S10000 X3000 Y2000 Z1500')
+MAX_SPEEDS = {'X': 600, 'Y': 400, 'Z': 125}
+START = {'X': 0, 'Y': 0, 'Z': 0}
+
+
+def test_parse_acceleration():
+    assert ACCELERATION == (10000, {'X': 3000, 'Y': 2000, 'Z': 1500})
+
+
+def test_move_duration():
+    def duration(target, speed=400):
+        return motion.move_duration(
+            START, target, speed, MAX_SPEEDS, ACCELERATION)
+
+    assert duration({'X': 0, 'Y': None}) == 0
+
+    # trapezoid: 300mm at 400mm/s, ramping at 3000mm/s^2
+    assert duration({'X': 300}) == pytest.approx(300 / 400 + 400 / 3000)
+
+    # triangle: too short to reach full speed
+    assert duration({'X': 10}) == pytest.approx(2 * (10 / 3000) ** 0.5)
+
+    # limited by the maximum speed of Z
+    assert duration({'Z': 250}) == pytest.approx(250 / 125 + 125 / 1500)
+
+    # diagonal moves are limited by the slowest axis, scaled to the path
+    scale = 2 ** 0.5
+    assert duration({'X': 300, 'Y': 300}) == pytest.approx(
+        300 * scale / 400 + 400 / (2000 * scale))
+
+
+def test_sequence_duration():
+    targets = [{'Z': 100}, {'X': 300, 'Y': None}, {'Z': 0}]
+    expected = sum(
+        motion.move_duration(start, target, 400, MAX_SPEEDS, ACCELERATION)
+        for start, target in [
+            (START, {'Z': 100}),
+            ({'X': 0, 'Y': 0, 'Z': 100}, {'X': 300}),
+            ({'X': 300, 'Y': 0, 'Z': 100}, {'Z': 0})])
+    assert motion.sequence_duration(
+        START, targets, 400, MAX_SPEEDS, ACCELERATION) == \
+        pytest.approx(expected)
@@ -0,0 +1,70 @@
+import numpy as np
+
+from opentrons.drivers.smoothie_drivers import position_history
+from opentrons.drivers.smoothie_drivers.position_history import (
+    PositionHistory
+)
+
+
+def _position(value):
+    return {'X': value, 'Y': value * 2, 'Z': value * 3}
+
+
+def test_ring_buffer():
+    history = PositionHistory('XYZ', size=4)
+    assert len(history) == 0
+    assert history.last() is None
+
+    for i in range(3):
+        history.append(_position(i), timestamp=i)
+    assert len(history) == 3
+    assert list(history) == [_position(i) for i in range(3)]
+
+    for i in range(3, 10):
+        history.append(_position(i), timestamp=i)
+    # only the most recent samples are kept, memory does not grow
+    assert len(history) == 4
+    assert history.recent().nbytes == 4 * 4 * 8
+    assert list(history) == [_position(i) for i in range(6, 10)]
+    assert history.last() == _position(9)
+
+    assert history.recent(2).tolist() == [[8, 8, 16, 24], [9, 9, 18, 27]]
+    assert history.since(7)[:, 0].tolist() == [7, 8, 9]
+
+    history.append({'X': 1}, timestamp=10)
+    assert np.isnan(history.recent(1)[0, 2:]).all()
+
+    history.clear()
+    assert len(history) == 0
+    assert list(history) == []
+
+
+def test_spill_to_disk(tmpdir):
+    path = str(tmpdir.join('positions.bin'))
+    history = PositionHistory('XYZ', size=3, spill_path=path)
+    for i in range(10):
+        history.append(_position(i), timestamp=i)
+    assert len(history) == 3
+
+    history.flush()
+    samples = position_history.load(path, 'XYZ')
+    assert samples[:, 0].tolist() == list(range(10))
+    assert samples[:, 1:].tolist() == [
+        [i, i * 2, i * 3] for i in range(10)]
+
+    # flushing twice does not duplicate samples
+    history.flush()
+    assert len(position_history.load(path, 'XYZ')) == 10
+
+
+def test_driver_history(smoothie):
+    smoothie.log.clear()
+    smoothie.move({'X': 1, 'Y': 2})
+    smoothie.move({'Z': 3})
+    assert len(smoothie.log) == 2
+    assert smoothie.log.last() == smoothie.position
+    assert [p['X'] for p in smoothie.log] == [1, 1]
+
+    for i in range(smoothie.log.size + 10):
+        smoothie.move({'X': i % 2 + 1})
+    assert len(smoothie.log) == smoothie.log.size
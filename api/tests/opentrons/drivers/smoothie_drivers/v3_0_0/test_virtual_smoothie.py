@@ -0,0 +1,132 @@
+import time
+
+import pytest
+
+from opentrons.drivers.pty_device import PtyDevice
+from opentrons.drivers.smoothie_drivers.driver_3_0 import (
+    HOMED_POSITION, SmoothieDriver_3_0_0, SmoothieError)
+from opentrons.drivers.smoothie_drivers.virtual_smoothie import (
+    VirtualSmoothie)
+from opentrons.robot import robot_configs
+
+
+@pytest.fixture
+def virtual_smoothie():
+    return VirtualSmoothie(
+        instruments={'L': {'id': 'P10SV0001', 'model': 'p10_single_v1'}},
+        probe_position={'Z': 100})
+
+
+@pytest.fixture
+def driver(virtual_smoothie, monkeypatch):
+    monkeypatch.setenv('ENABLE_VIRTUAL_SMOOTHIE', 'false')
+    with PtyDevice(virtual_smoothie) as device:
+        driver = SmoothieDriver_3_0_0(robot_configs.load())
+        driver.connect(port=device.port)
+        yield driver
+        driver.disconnect()
+
+
+def test_protocol(virtual_smoothie):
+    assert virtual_smoothie('G28.6') == 'X:0 Y:0 Z:0 A:0 B:0 C:0\r\nok\r\n'
+    assert virtual_smoothie('G28.2X') == 'ok\r\n'
+    assert virtual_smoothie('G28.6') == 'X:1 Y:0 Z:0 A:0 B:0 C:0\r\nok\r\n'
+
+    assert virtual_smoothie('G91 G0X-18Y2 G90 M400') == 'ok\r\n'
+    assert virtual_smoothie('M114.2') == \
+        'ok MCS: X:400.0000 Y:2.0000 Z:0.0000 A:0.0000 B:0.0000 ' \
+        'C:0.0000\r\nok\r\n'
+
+    assert virtual_smoothie('M907 A0.1 B0.5 G4P0.005') == 'ok\r\n'
+    assert virtual_smoothie.currents['B'] == 0.5
+
+    virtual_smoothie.switches['A'] = True
+    assert virtual_smoothie('M119') == \
+        'X_max:0 Y_max:0 Z_max:0 A_max:1 B_max:0 C_max:0 Probe: 0\r\nok\r\n'
+
+    assert virtual_smoothie('M371L') == 'L:{}\r\nok\r\n'.format(
+        b'p10_single_v1'.hex())
+    assert virtual_smoothie('M372R{}'.format(b'p50_v1'.hex())) == 'ok\r\n'
+    assert virtual_smoothie.instruments['R']['model'] == 'p50_v1'
+
+    assert virtual_smoothie('M555') == 'error:Unsupported command\r\nok\r\n'
+
+
+def test_alarms(virtual_smoothie):
+    assert virtual_smoothie('G0X1000') == 'ALARM: Hard limit +X\r\nok\r\n'
+    assert virtual_smoothie.position['X'] == HOMED_POSITION['X']
+    assert virtual_smoothie('G0Y10') == '!!\r\nok\r\n'
+    assert virtual_smoothie('M999') == 'ok\r\n'
+    assert virtual_smoothie('G0Y10') == 'ok\r\n'
+
+    assert virtual_smoothie('G38.2 F420Z-10') == 'ALARM: Probe fail\r\nok\r\n'
+    virtual_smoothie('M999')
+
+    virtual_smoothie.fail_next('error:checksum')
+    assert virtual_smoothie('') == 'ok\r\n'
+    assert virtual_smoothie('G0X10') == 'error:checksum\r\nok\r\n'
+    assert virtual_smoothie.position['X'] == HOMED_POSITION['X']
+
+
+def test_received_history(monkeypatch):
+    from opentrons.drivers.smoothie_drivers import virtual_smoothie as vs
+    monkeypatch.setattr(vs, 'RECEIVED_HISTORY', 3)
+    board = vs.VirtualSmoothie()
+    for i in range(5):
+        board('G0X{}'.format(i))
+    assert list(board.received) == ['G0X2', 'G0X3', 'G0X4']
+
+
+def test_timing():
+    virtual_smoothie = VirtualSmoothie(time_scale=0.1)
+    virtual_smoothie('M204 S10000 X3000')
+
+    start = time.time()
+    virtual_smoothie('G0F24000 X300')  # 0.88s
+    queued = time.time()
+    virtual_smoothie('M400')
+    done = time.time()
+
+    assert queued - start < 0.02
+    assert done - start == pytest.approx(0.088, abs=0.02)
+
+
+def test_driver(driver, virtual_smoothie):
+    assert not driver.simulating
+    assert driver.get_fw_version() == 'virtual-smoothie'
+
+    driver.home()
+    assert driver.homed_flags == {axis: True for axis in 'XYZABC'}
+    assert virtual_smoothie.position['X'] == HOMED_POSITION['X']
+
+    driver.move({'X': 100, 'Y': 100, 'B': 10})
+    driver.update_position()
+    assert driver.position['X'] == 100
+    assert driver.position['B'] == 10
+
+    assert driver.read_pipette_id('left') == {'pipette_id': 'P10SV0001'}
+    assert not virtual_smoothie.engaged['B']  # disengaged to read pipettes
+    assert driver.read_pipette_model('left') == 'p10_single_v1'
+    assert driver.read_pipette_model('right') is None
+
+    driver.probe_axis('Z', -150)
+    assert driver.position['Z'] == 100
+
+
+def test_driver_errors(driver, virtual_smoothie):
+    driver.home()
+
+    # the driver recovers and homes the axis that hit its limit switch
+    virtual_smoothie.received.clear()
+    with pytest.raises(SmoothieError, match='Hard limit'):
+        driver.move({'X': 500})
+    assert not virtual_smoothie.halted
+    assert driver.position['X'] == HOMED_POSITION['X']
+    assert 'M999' in virtual_smoothie.received[2]
+    assert any('G28.2X' in line for line in virtual_smoothie.received)
+
+    virtual_smoothie.fail_next('error:Unsupported command')
+    with pytest.raises(SmoothieError):
+        driver.move({'Y': 50})
+    driver.move({'Y': 50})
+    assert virtual_smoothie.position['Y'] == 50
@@ -147,15 +147,22 @@ def test_dwell_and_activate_axes(smoothie, monkeypatch):
     smoothie._set_saved_current()
     expected = [
         ['M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4P0.005 M400'],
-        ['M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005 M400'],
-        ['M907 A0.1 B0.5 C0.5 X1.25 Y1.25 Z0.1 G4P0.005 M400'],
-        ['M907 A0.1 B0.5 C0.05 X0.3 Y1.25 Z0.1 G4P0.005 M400'],
-        ['M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005 M400']
+        # only currents that changed are sent
+        ['M907 X0.3 G4P0.005 M400'],
+        ['M907 B0.5 C0.5 X1.25 Y1.25 G4P0.005 M400'],
+        ['M907 C0.05 X0.3 G4P0.005 M400'],
+        ['M907 B0.05 Y0.3 G4P0.005 M400']
     ]
     # from pprint import pprint
     # pprint(command_log)
     fuzzy_assert(result=command_log, expected=expected)
 
+    # nothing is sent when no current changed
+    command_log.clear()
+    smoothie.dwell_axes('XYZABC')
+    smoothie._set_saved_current()
+    assert command_log == []
+
 
 def test_disable_motor(smoothie, monkeypatch):
     from opentrons.drivers import serial_communication
@@ -210,22 +217,16 @@ def test_plunger_commands(smoothie, monkeypatch):
 
     smoothie.home()
     expected = [
-        ['M907 A0.8 B0.5 C0.5 X0.3 Y0.3 Z0.8 G4P0.005 G28.2.+[ABCZ].+ M400'],
-        ['M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005 M400'],
-        ['M203.1 Y50 M400'],
-        ['M907 A0.1 B0.05 C0.05 X0.3 Y0.8 Z0.1 G4P0.005 G91 G0Y-28 G0Y10 G90 M400'],  # NOQA
-        ['M203.1 X80 M400'],
-        ['M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4P0.005 G28.2X M400'],
-        ['M203.1 A125 B50 C50 X600 Y400 Z125 M400'],
-        ['M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005 M400'],
-        ['M203.1 Y80 M400'],
-        ['M907 A0.1 B0.05 C0.05 X0.3 Y1.25 Z0.1 G4P0.005 G28.2Y M400'],
-        ['M203.1 Y8 M400'],
-        ['G91 G0Y-3 G90 M400'],
+        ['M907 A0.8 B0.5 C0.5 Z0.8 G4P0.005 G28.2.+[ABCZ].+ M400'],
+        ['M907 A0.1 B0.05 C0.05 Z0.1 G4P0.005 M400'],
+        ['M203.1 Y50 M907 Y0.8 G4P0.005 G91 G0Y-28 G0Y10 G90 M400'],
+        ['M203.1 X80 M907 X1.25 Y0.3 G4P0.005 G28.2X M400'],
+        ['M203.1 A125 B50 C50 X600 Y400 Z125 M907 X0.3 G4P0.005 M400'],
+        ['M203.1 Y80 M907 Y1.25 G4P0.005 G28.2Y M400'],
+        ['M203.1 Y8 G91 G0Y-3 G90 M400'],
         ['G28.2Y M400'],
         ['G91 G0Y-3 G90 M400'],
-        ['M203.1 A125 B50 C50 X600 Y400 Z125 M400'],
-        ['M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005 M400'],
+        ['M203.1 A125 B50 C50 X600 Y400 Z125 M907 Y0.3 G4P0.005 M400'],
         ['M114.2 M400']
     ]
     # from pprint import pprint
@@ -235,7 +236,7 @@ def test_plunger_commands(smoothie, monkeypatch):
 
     smoothie.move({'X': 0, 'Y': 1.123456, 'Z': 2, 'A': 3})
     expected = [
-        ['M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4P0.005 G0.+ M400']
+        ['M907 A0.8 X1.25 Y1.25 Z0.8 G4P0.005 G0.+ M400']
     ]
     # from pprint import pprint
     # pprint(command_log)
@@ -244,8 +245,8 @@ def test_plunger_commands(smoothie, monkeypatch):
 
     smoothie.move({'B': 2})
     expected = [
-        ['M907 A0.1 B0.5 C0.05 X0.3 Y0.3 Z0.1 G4P0.005 G0B2 M400'],
-        ['M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005 M400']
+        ['M907 A0.1 B0.5 X0.3 Y0.3 Z0.1 G4P0.005 G0B2 M400'],
+        ['M907 B0.05 G4P0.005 M400']
     ]
     # from pprint import pprint
     # pprint(command_log)
@@ -263,7 +264,7 @@ def test_plunger_commands(smoothie, monkeypatch):
         # Set active axes high
         ['M907 A0.8 B0.5 C0.5 X1.25 Y1.25 Z0.8 G4P0.005 G0.+[BC].+ M400'],
         # Set plunger current low
-        ['M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4P0.005 M400'],
+        ['M907 B0.05 C0.05 G4P0.005 M400'],
     ]
     # from pprint import pprint
     # pprint(command_log)
@@ -301,11 +302,11 @@ def test_set_active_current(smoothie, monkeypatch):
     smoothie.home('BC')
     expected = [
         ['M907 A2 B2 C2 X2 Y2 Z2 G4P0.005 G0A0B0C0X0Y0Z0 M400'],  # move all
-        ['M907 A2 B0 C0 X2 Y2 Z2 G4P0.005 M400'],  # disable BC axes
+        ['M907 B0 C0 G4P0.005 M400'],  # disable BC axes
         ['M907 A0 B2 C2 X0 Y0 Z0 G4P0.005 G0B1.3C1.3 G0B1C1 M400'],  # move BC
-        ['M907 A0 B0 C0 X0 Y0 Z0 G4P0.005 M400'],  # disable BC axes
-        ['M907 A0 B0.42 C0.42 X0 Y0 Z0 G4P0.005 G28.2BC M400'],  # home BC
-        ['M907 A0 B0 C0 X0 Y0 Z0 G4P0.005 M400'],  # dwell all axes after home
+        ['M907 B0 C0 G4P0.005 M400'],  # disable BC axes
+        ['M907 B0.42 C0.42 G4P0.005 G28.2BC M400'],  # home BC
+        ['M907 B0 C0 G4P0.005 M400'],  # dwell all axes after home
         ['M114.2 M400']  # update the position
     ]
     # from pprint import pprint
@@ -313,6 +314,43 @@ def test_set_active_current(smoothie, monkeypatch):
     fuzzy_assert(result=command_log, expected=expected)
 
 
+def test_current_unknown_after_failed_send(smoothie, monkeypatch):
+    from opentrons.drivers import serial_communication
+    from opentrons.drivers.smoothie_drivers import driver_3_0
+    smoothie._setup()
+    smoothie.home()
+    smoothie.simulating = False
+    command_log = []
+
+    def write_with_log(command, ack, connection, timeout):
+        command_log.append(command.strip())
+        return driver_3_0.SMOOTHIE_ACK
+
+    def no_response(command, ack, connection, timeout):
+        raise serial_communication.SerialNoResponse()
+
+    monkeypatch.setattr(serial_communication, 'write_and_return', no_response)
+    monkeypatch.setattr(driver_3_0, 'DEFAULT_STABILIZE_DELAY', 0)
+    with pytest.raises(serial_communication.SerialNoResponse):
+        smoothie.move({'X': 10})
+    assert smoothie._sent_current is None
+
+    # every current is sent again, the failed M907 may not have arrived
+    monkeypatch.setattr(
+        serial_communication, 'write_and_return', write_with_log)
+    smoothie.move({'X': 10})
+    expected = [
+        ['M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4P0.005 G0X10 M400'],
+    ]
+    fuzzy_assert(result=command_log, expected=expected)
+
+    monkeypatch.setattr(driver_3_0, 'sleep', lambda seconds: None)
+    monkeypatch.setattr(driver_3_0.gpio, 'set_low', lambda pin: None)
+    monkeypatch.setattr(driver_3_0.gpio, 'set_high', lambda pin: None)
+    smoothie._smoothie_hard_halt()
+    assert smoothie._sent_current is None
+
+
 def test_active_dwelling_current_push_pop(smoothie):
     assert smoothie._active_current_settings != \
         smoothie._dwelling_current_settings
@@ -414,6 +452,8 @@ def test_drop_tip_current(model):
     # Instrument in `model` is configured to right mount, which is the A axis
     # on the Smoothie (see `Robot._actuators`)
     expected = [
+        {'C': 0.456},   # home the unhomed plunger before moving
+        {'C': 0.05},    # dwell after homing
         {'C': 0.456},   # make to 'drop_tip' position
         {'C': 0.05},    # dwell
         {'C': 0.123},   # move to 'bottom' position
@@ -633,16 +673,16 @@ def test_clear_limit_switch(virtual_smoothie_env, model, monkeypatch):
 
     assert [c.strip() for c in cmd_list] == [
         # attempt to move and fail
-        'M907 A0.1 B0.05 C0.5 X0.3 Y0.3 Z0.1 G4P0.005 G0C100.3 G0C100 M400',
+        'M907 C0.5 G4P0.005 G0C100.3 G0C100 M400',
         # recover from failure
         'M999 M400',
-        # set current for homing the failed axis (C)
+        # set all currents, since the failure may have interrupted setting
+        # them, for homing the failed axis (C)
         'M907 A0.1 B0.05 C0.5 X0.3 Y0.3 Z0.1 G4P0.005 G28.2C M400',
         # set current back to idling after home
-        'M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005 M400',
+        'M907 C0.05 G4P0.005 M400',
         # update position
-        'M114.2 M400',
-        'M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005 M400'
+        'M114.2 M400'
     ]
 
 
@@ -714,10 +754,12 @@ def test_speed_change(model, monkeypatch):
     pipette.set_speed(aspirate=20, dispense=40)
     pipette.aspirate()
     pipette.dispense()
+    robot._driver.flush()
     expected = [
-        ['G0F1200 M400'],  # pipette's default aspirate speed in mm/min
-        ['G0F24000 M400'],
-        ['G0F2400 M400'],  # pipette's default dispense speed in mm/min
+        # speeds are sent on the same line as the plunger moves
+        ['G0F1200 M907 C0.5 G4P0.005 G0C.+ M400'],  # aspirate, in mm/min
+        # restoring the default speed is replaced by the dispense speed
+        ['G0F2400 M907 C0.5 G4P0.005 G0C.+ M400'],  # dispense, in mm/min
         ['G0F24000 M400']
     ]
     # from pprint import pprint
@@ -745,15 +787,16 @@ def test_max_speed_change(model, monkeypatch):
     robot.head_speed(555)
     robot.head_speed(x=1, y=2, z=3, a=4, b=5, c=6)
     robot.head_speed(123, x=7)
+    # nothing is sent until the next command, or a flush
+    assert command_log == []
+    robot._driver.flush()
     robot._driver.push_speed()
     robot._driver.set_speed(321)
     robot._driver.pop_speed()
+    robot._driver.flush()
+    robot._driver.flush()
     expected = [
-        ['G0F{} M400'.format(555 * 60)],
-        ['M203.1 A4 B5 C6 X1 Y2 Z3 M400'],
-        ['M203.1 X7 M400'],
-        ['G0F{} M400'.format(123 * 60)],
-        ['G0F{} M400'.format(321 * 60)],
+        ['M203.1 A4 B5 C6 X7 Y2 Z3 G0F{} M400'.format(123 * 60)],
         ['G0F{} M400'.format(123 * 60)]
     ]
     # from pprint import pprint
@@ -816,7 +859,10 @@ def test_unstick_axes(model):
 
     def send_command_mock(self, command, timeout=None):
         nonlocal current_log
+        command = self._with_buffered_command(command)
         current_log.append(command)
+        # as a successful send would, note the currents Smoothieware got
+        self._end_current_update(self._start_current_update(command))
         if 'M119' in command:
             smoothie_switch_res = 'X_max:0 Y_max:0 Z_max:0 A_max:0 B_max:0 C_max:0'  # NOQA
             smoothie_switch_res += ' _pins '
@@ -827,12 +873,12 @@ def test_unstick_axes(model):
     driver._send_command = types.MethodType(send_command_mock, driver)
 
     driver.unstick_axes('BC')
+    driver.flush()
 
     expected = [
-        'M203.1 B1 C1',  # slow them down
-        'M119',  # get the switch status
+        'M203.1 B1 C1 M119',  # slow them down, get the switch status
         'M907 A0.1 B0.5 C0.5 X0.3 Y0.3 Z0.1 G4P0.005 G0B-1C-1',  # move
-        'M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005',  # set plunger current
+        'M907 B0.05 C0.05 G4P0.005',  # set plunger current
         'M203.1 A125 B50 C50 X600 Y400 Z125'  # return to normal speed
     ]
     # from pprint import pprint
@@ -841,11 +887,11 @@ def test_unstick_axes(model):
 
     current_log = []
     driver.unstick_axes('XYZA')
+    driver.flush()
 
     expected = [
-        'M203.1 A1 X1 Y1 Z1',  # slow them down
-        'M119',  # get the switch status
-        'M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4P0.005 G0A-1X-1Y-1Z-1',
+        'M203.1 A1 X1 Y1 Z1 M119',  # slow them down, get the switch status
+        'M907 A0.8 X1.25 Y1.25 Z0.8 G4P0.005 G0A-1X-1Y-1Z-1',
         'M203.1 A125 B50 C50 X600 Y400 Z125'  # return to normal speed
     ]
     # from pprint import pprint
@@ -854,7 +900,10 @@ def test_unstick_axes(model):
 
     def send_command_mock(self, command, timeout=None):
         nonlocal current_log
+        command = self._with_buffered_command(command)
         current_log.append(command)
+        # as a successful send would, note the currents Smoothieware got
+        self._end_current_update(self._start_current_update(command))
         if 'M119' in command:
             smoothie_switch_res = 'X_max:0 Y_max:0 Z_max:0 A_max:0 B_max:0 C_max:1'  # NOQA
             smoothie_switch_res += ' _pins '
@@ -866,14 +915,14 @@ def test_unstick_axes(model):
 
     current_log = []
     driver.unstick_axes('BC')
+    driver.flush()
 
     expected = [
-        'M203.1 B1 C1',  # set max-speeds
-        'M119',  # get switch status
-        'M907 A0.1 B0.5 C0.05 X0.3 Y0.3 Z0.1 G4P0.005 G0B-2',  # MOVE B
-        'M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005',  # low current B
-        'M907 A0.1 B0.05 C0.5 X0.3 Y0.3 Z0.1 G4P0.005 G28.2C',  # HOME C
-        'M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005',  # low current C
+        'M203.1 B1 C1 M119',  # set max-speeds, get switch status
+        'M907 A0.1 B0.5 X0.3 Y0.3 Z0.1 G4P0.005 G0B-2',  # MOVE B
+        'M907 B0.05 G4P0.005',  # low current B
+        'M907 C0.5 G4P0.005 G28.2C',  # HOME C
+        'M907 C0.05 G4P0.005',  # low current C
         'M203.1 A125 B50 C50 X600 Y400 Z125'  # reset max-speeds
     ]
     # from pprint import pprint
@@ -882,7 +931,10 @@ def test_unstick_axes(model):
 
     def send_command_mock(self, command, timeout=None):
         nonlocal current_log
+        command = self._with_buffered_command(command)
         current_log.append(command)
+        # as a successful send would, note the currents Smoothieware got
+        self._end_current_update(self._start_current_update(command))
         if 'M119' in command:
             smoothie_switch_res = 'X_max:0 Y_max:0 Z_max:0 A_max:0 B_max:1 C_max:1'  # NOQA
             smoothie_switch_res += ' _pins '
@@ -894,14 +946,237 @@ def test_unstick_axes(model):
 
     current_log = []
     driver.unstick_axes('BC')
+    driver.flush()
 
     expected = [
-        'M203.1 B1 C1',  # set max-speeds
-        'M119',  # get switch status
-        'M907 A0.1 B0.5 C0.5 X0.3 Y0.3 Z0.1 G4P0.005 G28.2BC',  # HOME BC
-        'M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005',  # low current BC
+        'M203.1 B1 C1 M119',  # set max-speeds, get switch status
+        'M907 B0.5 C0.5 G4P0.005 G28.2BC',  # HOME BC
+        'M907 B0.05 C0.05 G4P0.005',  # low current BC
         'M203.1 A125 B50 C50 X600 Y400 Z125'  # reset max-speeds
     ]
     # from pprint import pprint
     # pprint(current_log)
     assert current_log == expected
+
+
+def test_streaming_moves(smoothie, monkeypatch):
+    from opentrons.drivers import serial_communication
+    from opentrons.drivers.smoothie_drivers import driver_3_0
+    smoothie._setup()
+    smoothie.home()
+    smoothie.simulating = False
+
+    command_log = []
+    acks = []
+
+    def write_with_log(command, ack, connection, timeout):
+        command_log.append(command.strip())
+        return driver_3_0.SMOOTHIE_ACK
+
+    def write_no_return(command, connection):
+        command_log.append('stream ' + command.strip())
+
+    def read_ack(ack, connection, timeout):
+        acks.append(ack)
+        return ''
+
+    monkeypatch.setattr(
+        serial_communication, 'write_and_return', write_with_log)
+    monkeypatch.setattr(serial_communication, 'write', write_no_return)
+    monkeypatch.setattr(serial_communication, 'read_until', read_ack)
+    monkeypatch.setattr(
+        serial_communication, 'clear_buffer', lambda connection: None)
+
+    smoothie.set_streaming(True)
+    assert smoothie.streaming
+    smoothie.move({'X': 10, 'Y': 10, 'Z': 10, 'A': 10})
+    for i in range(5):
+        smoothie.move({'Z': 20 + i})
+        smoothie.move({'X': 20 + i, 'Y': 20 + i})
+    expected = [
+        # currents only change for the first move
+        ['stream M907 A0.8 X1.25 Y1.25 Z0.8 G4P0.005 G0A10X10Y10Z10'],
+        ['stream G0Z20'],
+        ['stream G0X20Y20'],
+    ]
+    fuzzy_assert(result=command_log[:3], expected=expected)
+    assert len(command_log) == 11
+    assert all(command.startswith('stream') for command in command_log)
+    # the window bounds how many lines wait for their ok
+    assert len(acks) == 11 - driver_3_0.STREAMING_WINDOW
+
+    # plunger moves wait for every streamed move first
+    command_log.clear()
+    smoothie.move({'B': 2})
+    expected = [
+        ['M400 M400'],
+        ['M907 A0.1 B0.5 X0.3 Y0.3 Z0.1 G4P0.005 G0B2 M400'],
+        ['M907 B0.05 G4P0.005 M400']
+    ]
+    fuzzy_assert(result=command_log, expected=expected)
+    assert len(acks) == 11
+
+    command_log.clear()
+    smoothie.move({'X': 30})
+    smoothie.set_streaming(False)
+    smoothie.move({'X': 40})
+    expected = [
+        ['stream M907 X1.25 G4P0.005 G0X30'],
+        ['M400 M400'],
+        # currents are unchanged, so neither M907 nor its dwell is sent
+        ['G0X40 M400']
+    ]
+    fuzzy_assert(result=command_log, expected=expected)
+    assert command_log[-1] == 'G0X40 M400'
+
+
+def test_streaming_error(smoothie, monkeypatch):
+    from opentrons.drivers import serial_communication
+    from opentrons.drivers.smoothie_drivers import driver_3_0
+    smoothie._setup()
+    smoothie.home()
+    smoothie.simulating = False
+
+    monkeypatch.setattr(
+        serial_communication, 'write_and_return',
+        lambda command, ack, connection, timeout: driver_3_0.SMOOTHIE_ACK)
+    monkeypatch.setattr(
+        serial_communication, 'write', lambda command, connection: None)
+    monkeypatch.setattr(
+        serial_communication, 'read_until',
+        lambda ack, connection, timeout: 'ALARM: Hard limit -X')
+    monkeypatch.setattr(
+        serial_communication, 'clear_buffer', lambda connection: None)
+    monkeypatch.setattr(
+        driver_3_0, '_parse_position_response', lambda arg: smoothie.position)
+
+    smoothie.set_streaming(True)
+    smoothie.move({'X': 10})
+    with pytest.raises(driver_3_0.SmoothieError):
+        smoothie.update_position()
+    assert smoothie._unacked_lines == 0
+
+
+def test_streaming_timeout(smoothie, monkeypatch):
+    from opentrons.drivers import serial_communication
+    from opentrons.drivers.smoothie_drivers import driver_3_0
+    smoothie._setup()
+    smoothie.home()
+    smoothie.simulating = False
+
+    timeouts = []
+
+    def write_with_log(command, ack, connection, timeout):
+        timeouts.append((command.strip(), timeout))
+        return driver_3_0.SMOOTHIE_ACK
+
+    monkeypatch.setattr(
+        serial_communication, 'write_and_return', write_with_log)
+    monkeypatch.setattr(
+        serial_communication, 'write', lambda command, connection: None)
+    monkeypatch.setattr(
+        serial_communication, 'read_until',
+        lambda ack, connection, timeout: '')
+    monkeypatch.setattr(
+        serial_communication, 'clear_buffer', lambda connection: None)
+
+    smoothie.set_streaming(True)
+    smoothie.set_speed(20)
+    targets = [{'X': 300, 'Y': 300}, {'X': 10, 'Y': 10}] * 4
+    duration = smoothie.estimate_move_duration(targets)
+    for target in targets:
+        smoothie.move(target)
+    smoothie.set_streaming(False)
+
+    # the M400 draining the stream waits as long as every streamed move
+    assert timeouts[-1][0] == 'M400 M400'
+    assert timeouts[-1][1] == pytest.approx(smoothie._move_timeout(duration))
+    assert timeouts[-1][1] > driver_3_0.DEFAULT_MOVEMENT_TIMEOUT
+    assert smoothie._streamed_duration == 0
+
+
+def test_move_sequence(smoothie, monkeypatch):
+    from opentrons.drivers import serial_communication
+    from opentrons.drivers.smoothie_drivers import driver_3_0
+    smoothie._setup()
+    smoothie.home()
+    smoothie.simulating = False
+
+    command_log = []
+
+    def write_with_log(command, ack, connection, timeout):
+        command_log.append(command.strip())
+        return driver_3_0.SMOOTHIE_ACK
+
+    monkeypatch.setattr(
+        serial_communication, 'write_and_return', write_with_log)
+
+    smoothie.move_sequence([
+        {'Z': smoothie.position['Z']},
+        {'X': 10, 'Y': 20},
+        {'Z': 30},
+        {'Z': 30}
+    ])
+    expected = [
+        # no-op segments are left out
+        ['M907 X1.25 Y1.25 Z0.8 G4P0.005 G0X10Y20 G0Z30 M400'],
+    ]
+    fuzzy_assert(result=command_log, expected=expected)
+    assert smoothie.position['X'] == 10
+    assert smoothie.position['Y'] == 20
+    assert smoothie.position['Z'] == 30
+
+    command_log.clear()
+    smoothie.move_sequence([{'X': 10}, {'Y': 20}])
+    assert command_log == []
+
+
+def test_movement_timeouts(smoothie, monkeypatch):
+    from opentrons.drivers import serial_communication
+    from opentrons.drivers.smoothie_drivers import driver_3_0
+    smoothie._setup()
+    smoothie.home()
+    smoothie.simulating = False
+
+    timeouts = []
+
+    def write_with_log(command, ack, connection, timeout):
+        timeouts.append(timeout)
+        return driver_3_0.SMOOTHIE_ACK
+
+    monkeypatch.setattr(
+        serial_communication, 'write_and_return', write_with_log)
+
+    # short moves time out quickly
+    target = {'X': smoothie.position['X'] - 10}
+    duration = smoothie.estimate_move_duration([target])
+    assert 0 < duration < 1
+    smoothie.move(target)
+    assert timeouts[-1] == pytest.approx(
+        duration * driver_3_0.MOVEMENT_TIMEOUT_FACTOR +
+        driver_3_0.MOVEMENT_TIMEOUT_MARGIN)
+    assert timeouts[-1] < driver_3_0.DEFAULT_MOVEMENT_TIMEOUT
+
+    # slow moves are given longer than the default timeout
+    smoothie.set_axis_max_speed({'x': 5})
+    assert smoothie.estimate_move_duration([{'X': 100}]) > \
+        driver_3_0.DEFAULT_MOVEMENT_TIMEOUT
+    smoothie.move({'X': 100})
+    assert timeouts[-1] > driver_3_0.DEFAULT_MOVEMENT_TIMEOUT
+
+
+def test_simulated_time(smoothie):
+    smoothie.home()
+    start = smoothie.simulated_time
+    assert start > 0
+
+    target = {'X': 100, 'Y': 100}
+    duration = smoothie.estimate_move_duration([target])
+    smoothie.move(target)
+    smoothie.delay(5)
+    assert smoothie.simulated_time - start == pytest.approx(duration + 5)
+
+    smoothie.simulating = False
+    smoothie.advance_clock(5)
+    assert smoothie.simulated_time - start == pytest.approx(duration + 5)
+    smoothie.simulating = True
@@ -0,0 +1,98 @@
+import random
+
+import pytest
+
+from opentrons.drivers import response_parsers as parsers
+from opentrons.drivers.response_parsers import ParseError
+
+# replies recorded from Smoothieware, Temp-Deck and Mag-Deck firmware
+RECORDED = [
+    (parsers.parse_position,
+     'ok MCS: X:418.0000 Y:353.0000 Z:218.0000 A:218.0000 B:19.0000 '
+     'C:19.0000',
+     {'X': 418, 'Y': 353, 'Z': 218, 'A': 218, 'B': 19, 'C': 19}),
+    (parsers.parse_position,
+     'ok M114.2 X:10 Y:20: Z:30 A:40 B:50 C:-0.12345',
+     {'X': 10, 'Y': 20, 'Z': 30, 'A': 40, 'B': 50, 'C': -0.123}),
+    (parsers.parse_homing_status,
+     'X:1 Y:0 Z:0 A:0 B:0 C:1',
+     {'X': True, 'Y': False, 'Z': False, 'A': False, 'B': False, 'C': True}),
+    (parsers.parse_switches,
+     'X_max:0 Y_max:0 Z_max:0 A_max:1 B_max:0 C_max:0 pins- (XL)2.01:0 '
+     '(YL)2.01:0 (ZL)2.01:0 (AL)2.01:0 (BL)2.01:0 (CL)2.01:0 Probe: 1\r\n',
+     {'X': False, 'Y': False, 'Z': False, 'A': True, 'B': False, 'C': False,
+      'Probe': True}),
+    (parsers.parse_temperature,
+     'T:none C:25',
+     {'current': 25, 'target': None}),
+    (parsers.parse_temperature,
+     'T:4.0 C:12.3456',
+     {'current': 12.346, 'target': 4}),
+    (parsers.parse_device_info,
+     'serial:TD180102A13 model:temp_deck_v1 version:edge-1a2b3c',
+     {'serial': 'TD180102A13', 'model': 'temp_deck_v1',
+      'version': 'edge-1a2b3c'}),
+    (parsers.parse_distance, 'height:30.5', 30.5),
+    (parsers.parse_distance, 'Z:12.34', 12.34),
+]
+
+MALFORMED = [
+    (parsers.parse_position, 'ok M114.2 X:10 Y:20: Z:30A:40 B:50 C:60'),
+    (parsers.parse_position,
+     'ok MCS: X:0.0000 Y:MISTAKE Z:0.0000 A:0.0000 B:0.0000 C:0.0000'),
+    (parsers.parse_position, 'ok'),
+    (parsers.parse_homing_status, 'X:1 Y:0 Z:0 A:0 B:0'),
+    (parsers.parse_switches, 'X_max:0 Y_max:0 Z_max:0 Probe: 0'),
+    (parsers.parse_temperature, 'T:none'),
+    (parsers.parse_temperature, 'T:hot C:25'),
+    (parsers.parse_device_info, 'serial:aa11 model:bb22'),
+    (parsers.parse_distance, 'height:'),
+    (parsers.parse_distance, None),
+    (parsers.parse_switches, ''),
+]
+
+
+@pytest.mark.parametrize('parser,response,expected', RECORDED)
+def test_recorded_responses(parser, response, expected):
+    assert parser(response) == expected
+
+
+@pytest.mark.parametrize('parser,response', MALFORMED)
+def test_malformed_responses(parser, response):
+    with pytest.raises(ParseError):
+        parser(response)
+
+
+def test_fuzz():
+    rng = random.Random(1234)
+    alphabet = 'XYZABCT:._- 0123456789none\r\n'
+
+    def mutate(response):
+        chars = list(response)
+        for _ in range(rng.randint(1, 4)):
+            i = rng.randrange(len(chars) + 1)
+            op = rng.random()
+            if op < 0.3 and i < len(chars):
+                del chars[i]
+            elif op < 0.6 and i < len(chars):
+                chars[i] = rng.choice(alphabet)
+            else:
+                chars.insert(i, rng.choice(alphabet))
+        return ''.join(chars)
+
+    for _ in range(2000):
+        parser, response, expected = rng.choice(RECORDED)
+        try:
+            res = parser(mutate(response))
+        except ParseError:
+            continue
+        # anything accepted parses to the same shape as the original
+        assert type(res) is type(expected)
+        if isinstance(res, dict):
+            assert res.keys() == expected.keys()
+
+
+def test_remove_echo():
+    assert parsers.remove_echo('M119 M400', 'X_max:0\r\n') == 'X_max:0'
+    assert parsers.remove_echo(
+        'G28.6 M400', 'G28.6 M400 X:1 Y:0\r\n') == '  X:1 Y:0'
@@ -0,0 +1,265 @@
+import asyncio
+import time
+from threading import Lock, Thread
+
+import pytest
+
+from opentrons.drivers import serial_communication
+from opentrons.drivers.pty_device import PtyDevice
+
+
+def _responder(responses=None):
+    # answers every line with 'ok', prefixed by responses[command] if any
+    received = []
+
+    def handler(line):
+        received.append(line.strip())
+        return (responses or {}).get(line.strip(), '') + 'ok\r\n'
+    return handler, received
+
+
+@pytest.fixture
+def event_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def test_write_and_return_async(event_loop):
+    handler, received = _responder({'M105': 'T:none C:25\r\n'})
+    with PtyDevice(handler) as device:
+        connection = serial_communication.connect(port=device.port)
+        try:
+            res = event_loop.run_until_complete(
+                serial_communication.write_and_return_async(
+                    'M105 \r\n\r\n', 'ok\r\nok\r\n', connection,
+                    loop=event_loop))
+        finally:
+            connection.close()
+
+    assert res == 'T:none C:25'
+    assert received == ['M105', '']
+
+
+def test_read_until_async_does_not_block(event_loop):
+    def handler(line):
+        time.sleep(0.2)
+        return 'ok\r\nok\r\n'
+
+    ticks = 0
+
+    async def count_ticks():
+        nonlocal ticks
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    async def home_while_counting(connection):
+        await asyncio.gather(
+            serial_communication.write_and_return_async(
+                'G28.2 \r\n', 'ok\r\nok\r\n', connection,
+                loop=event_loop),
+            count_ticks())
+
+    with PtyDevice(handler) as device:
+        connection = serial_communication.connect(port=device.port)
+        try:
+            event_loop.run_until_complete(home_while_counting(connection))
+        finally:
+            connection.close()
+
+    assert ticks == 5
+
+
+def test_read_until_async_timeout(event_loop):
+    with PtyDevice(lambda line: '') as device:
+        connection = serial_communication.connect(port=device.port)
+        try:
+            with pytest.raises(serial_communication.SerialNoResponse):
+                event_loop.run_until_complete(
+                    serial_communication.write_and_return_async(
+                        'M105 \r\n', 'ok\r\nok\r\n', connection,
+                        timeout=0.1, loop=event_loop))
+        finally:
+            connection.close()
+
+
+def test_read_until_async_leaves_rest(event_loop):
+    # both responses arrive together, the second stays on the port
+    handler, received = _responder({'M105': 'a\r\nok\r\nok\r\nb\r\n'})
+    with PtyDevice(handler) as device:
+        connection = serial_communication.connect(port=device.port)
+        try:
+            first = event_loop.run_until_complete(
+                serial_communication.write_and_return_async(
+                    'M105 \r\n', 'ok\r\nok\r\n', connection,
+                    loop=event_loop))
+            second = event_loop.run_until_complete(
+                serial_communication.read_until_async(
+                    'ok\r\n', connection, timeout=1, loop=event_loop))
+        finally:
+            connection.close()
+
+    assert first == 'a'
+    assert second == 'b'
+
+
+def test_port_shared_by_threads_and_coroutines(event_loop):
+    def handler(line):
+        time.sleep(0.01)
+        return line.upper() + '\r\nok\r\n'
+
+    responses = []
+
+    def blocking_commands(connection, name):
+        for i in range(5):
+            command = '{}{}'.format(name, i)
+            res = serial_communication.write_and_return(
+                command + '\r\n', 'ok\r\n', connection, timeout=1)
+            responses.append((command.upper(), res))
+
+    async def async_commands(connection):
+        for i in range(5):
+            command = 'async{}'.format(i)
+            res = await serial_communication.write_and_return_async(
+                command + '\r\n', 'ok\r\n', connection, timeout=1,
+                loop=event_loop)
+            responses.append((command.upper(), res))
+
+    with PtyDevice(handler) as device:
+        connection = serial_communication.connect(port=device.port)
+        threads = [
+            Thread(target=blocking_commands, args=(connection, name))
+            for name in ('poll', 'move')]
+        try:
+            for thread in threads:
+                thread.start()
+            event_loop.run_until_complete(async_commands(connection))
+        finally:
+            for thread in threads:
+                thread.join()
+            connection.close()
+
+    assert len(responses) == 15
+    assert all(command == res for command, res in responses)
+
+
+def test_acquire_async_waits_for_busy_lock(event_loop):
+    lock = Lock()
+    lock.acquire()
+
+    waiting = asyncio.ensure_future(
+        serial_communication._acquire_async(lock, loop=event_loop),
+        loop=event_loop)
+    event_loop.run_until_complete(asyncio.sleep(0.05, loop=event_loop))
+    assert not waiting.done()
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        event_loop.run_until_complete(waiting)
+    lock.release()
+
+    # the cancelled waiter gives the lock back once its executor thread
+    # took it, so the next one gets it
+    event_loop.run_until_complete(asyncio.wait_for(
+        serial_communication._acquire_async(lock, loop=event_loop),
+        1, loop=event_loop))
+    assert lock.locked()
+    lock.release()
+
+
+def test_temp_deck_update_temperature_async(event_loop):
+    from opentrons.drivers.temp_deck import TempDeck
+
+    handler, received = _responder({'M105': 'T:40 C:31.5\r\n'})
+    with PtyDevice(handler) as device:
+        temp_deck = TempDeck()
+        temp_deck._connection = serial_communication.connect(
+            port=device.port)
+        try:
+            res = event_loop.run_until_complete(
+                temp_deck.update_temperature_async(loop=event_loop))
+        finally:
+            temp_deck.disconnect()
+
+    assert res == ''
+    assert received[0] == 'M105'
+    assert temp_deck.temperature == 31.5
+    assert temp_deck.target == 40
+
+
+def test_mag_deck_move_async(event_loop):
+    from opentrons.drivers.mag_deck import MagDeck
+
+    handler, received = _responder({'G0 Z10.0': 'error: limit\r\n'})
+    with PtyDevice(handler) as device:
+        mag_deck = MagDeck()
+        mag_deck._connection = serial_communication.connect(port=device.port)
+        try:
+            ok = event_loop.run_until_complete(
+                mag_deck.move_async(12.3456, loop=event_loop))
+            error = event_loop.run_until_complete(
+                mag_deck.move_async(10, loop=event_loop))
+        finally:
+            mag_deck.disconnect()
+
+    assert ok == ''
+    assert 'error' in error
+    assert received[0] == 'G0 Z12.346'
+
+
+def test_smoothie_move_async(smoothie, event_loop):
+    handler, received = _responder({
+        'M114.2 M400': 'ok MCS: X:1.0 Y:2.0 Z:3.0 A:4.0 B:5.0 C:6.0\r\n'})
+    with PtyDevice(handler) as device:
+        smoothie.simulating = False
+        smoothie._connection = serial_communication.connect(
+            port=device.port)
+        try:
+            event_loop.run_until_complete(smoothie.move_async(
+                {'X': 100, 'Y': 200}, loop=event_loop))
+            assert smoothie.position['X'] == 100
+            assert smoothie.position['Y'] == 200
+
+            received.clear()
+            event_loop.run_until_complete(
+                smoothie.move_async({'B': 10}, loop=event_loop))
+            # the plunger move, then its motor dwells once it's done
+            assert received[0].startswith('M907')
+            assert 'G0B10' in received[0]
+            assert received[2].startswith('M907')
+
+            event_loop.run_until_complete(
+                smoothie.update_position_async(loop=event_loop))
+        finally:
+            smoothie._connection.close()
+            smoothie._connection = None
+            smoothie.simulating = True
+
+    assert smoothie.position['X'] == 1.0
+    assert smoothie.position['C'] == 6.0
+
+
+def test_smoothie_async_error_recovery(smoothie, event_loop):
+    from opentrons.drivers.smoothie_drivers import driver_3_0
+    from opentrons.drivers.smoothie_drivers.virtual_smoothie import (
+        VirtualSmoothie)
+
+    board = VirtualSmoothie()
+    with PtyDevice(board) as device:
+        smoothie.simulating = False
+        smoothie._connection = serial_communication.connect(
+            port=device.port)
+        try:
+            with pytest.raises(driver_3_0.SmoothieError):
+                event_loop.run_until_complete(smoothie.move_async(
+                    {'X': driver_3_0.HOMED_POSITION['X'] + 100},
+                    loop=event_loop))
+        finally:
+            smoothie._connection.close()
+            smoothie._connection = None
+            smoothie.simulating = True
+
+    # recovery resets Smoothieware and homes the axis that hit its switch
+    assert not board.halted
+    assert board.homed_flags['X']
@@ -4,6 +4,7 @@ from opentrons import robot, labware, modules
 from opentrons.drivers.mag_deck import MagDeck as MagDeckDriver
 from opentrons.drivers.temp_deck import TempDeck as TempDeckDriver
 from opentrons.drivers import serial_communication
+from opentrons.modules import tempdeck
 
 
 @pytest.fixture
@@ -35,6 +36,39 @@ def test_load_container_onto_tempdeck():
     assert test_container.parent == md.labware
 
 
+def test_simulated_tempdeck_ramp(virtual_smoothie_env):
+    td = modules.load('tempdeck', '6')
+
+    start = robot.simulated_time()
+    td.set_temperature(4)
+    td.wait_for_temp()
+    assert robot.simulated_time() - start == pytest.approx(
+        (tempdeck.SIMULATED_START_TEMP - 4) / tempdeck.SIMULATED_COOLING_RATE)
+
+    start = robot.simulated_time()
+    td.set_temperature(95)
+    td.wait_for_temp()
+    td.wait_for_temp()
+    assert robot.simulated_time() - start == pytest.approx(
+        91 / tempdeck.SIMULATED_HEATING_RATE)
+
+
+def test_simulated_tempdeck_clock():
+    elapsed = []
+    td = tempdeck.TempDeck(
+        clock=elapsed.append, heating_rate=1, cooling_rate=0.5)
+    td.set_temperature(30)
+    td.wait_for_temp()
+    td.set_temperature(20)
+    td.wait_for_temp()
+    assert elapsed == [30 - tempdeck.SIMULATED_START_TEMP, 20]
+
+    # without a clock, waiting takes no simulated time
+    td = tempdeck.TempDeck()
+    td.set_temperature(30)
+    td.wait_for_temp()
+
+
 def test_simulating(virtual_smoothie_env, monkeypatch):
     connected = False
 
@@ -37,6 +37,7 @@ class PipetteTest(unittest.TestCase):
 
         self.p200.calibrate_plunger(top=0, bottom=10, blow_out=12, drop_tip=13)
         self.robot.home()
+        self.robot.clear_commands()
 
     def tearDown(self):
         del self.robot
@@ -0,0 +1,11 @@
+import os
+
+import pytest
+
+
+# Timing comparisons are slow and depend on the machine running them, so
+# tests marked as benchmarks only run with RUN_BENCHMARKS=true
+def pytest_runtest_setup(item):
+    if item.get_marker('benchmark') and \
+            os.environ.get('RUN_BENCHMARKS', '').lower() != 'true':
+        pytest.skip('benchmark, set RUN_BENCHMARKS=true to run it')
@@ -0,0 +1,38 @@
+import time
+
+import pytest
+
+from opentrons import Robot
+from opentrons.containers import load as containers_load
+from opentrons.instruments import pipette
+
+PAIRS = 10000
+# upper bound on what publishing may add to each command
+MAX_OVERHEAD = 0.001
+
+
+def _aspirate_dispense(aspirate, dispense, p200, well):
+    start = time.time()
+    for _ in range(PAIRS):
+        aspirate(p200, 100, well)
+        dispense(p200, 100, well)
+    return time.time() - start
+
+
+@pytest.mark.benchmark
+def test_command_publish_overhead():
+    robot = Robot()
+    robot.home()
+    plate = containers_load(robot, '96-flat', '2')
+    p200 = pipette.Pipette(
+        robot, mount='right', max_volume=200, ul_per_mm=18.5)
+    p200.tip_attached = True
+    p200.move_to(plate[0])
+
+    aspirate = pipette.Pipette.aspirate
+    dispense = pipette.Pipette.dispense
+    published = _aspirate_dispense(aspirate, dispense, p200, plate[0])
+    bare = _aspirate_dispense(
+        aspirate.__wrapped__, dispense.__wrapped__, p200, plate[0])
+
+    assert (published - bare) / (2 * PAIRS) < MAX_OVERHEAD
@@ -0,0 +1,38 @@
+import timeit
+
+import pytest
+
+from opentrons.data_storage import database
+
+
+def _children_list(plate):
+    # how Container used to list its children, for every access
+    return list(plate.children_by_reference.keys())
+
+
+def _copying_wells(plate, start, stop):
+    wrapped_wells = [w for i in range(3) for w in _children_list(plate)]
+    start = _children_list(plate).index(plate.get_child_by_name(start))
+    stop = _children_list(plate).index(plate.get_child_by_name(stop)) + 1
+    total_kids = len(_children_list(plate))
+    return wrapped_wells[start + total_kids:stop + total_kids]
+
+
+@pytest.mark.benchmark
+def test_384_plate_slicing():
+    plate = database.load_container('384-plate')
+    assert plate.wells('B3', to='P24').get_children_list() == \
+        _copying_wells(plate, 'B3', 'P24')
+
+    def copying():
+        [_children_list(plate)[i]
+         for i in range(len(_children_list(plate)))]
+        _copying_wells(plate, 'B3', 'B10')
+
+    def indexed():
+        [plate[i] for i in range(len(plate))]
+        plate.wells('B3', to='B10')
+
+    copying_time = min(timeit.repeat(copying, number=10, repeat=3))
+    indexed_time = min(timeit.repeat(indexed, number=10, repeat=3))
+    assert indexed_time < copying_time
@@ -0,0 +1,46 @@
+from opentrons import Robot
+from opentrons.containers import load as containers_load
+from opentrons.instruments import pipette
+from opentrons.trackers import pose_tracker
+
+
+def _transfer(monkeypatch, strategy):
+    robot = Robot()
+    robot.home()
+    tiprack = containers_load(robot, 'tiprack-200ul', '1')
+    plate = containers_load(robot, '96-flat', '2')
+    p200 = pipette.Pipette(
+        robot,
+        mount='right',
+        tip_racks=[tiprack],
+        max_volume=200,
+        ul_per_mm=18.5)
+
+    round_trips = []
+    send_command = robot._driver._send_command
+
+    def counting_send_command(command, *args, **kwargs):
+        round_trips.append(command)
+        return send_command(command, *args, **kwargs)
+
+    move_to = robot.move_to
+
+    def strategy_move_to(location, instrument, strategy='arc', **kwargs):
+        if strategy == 'arc':
+            strategy = arc_strategy
+        return move_to(location, instrument, strategy, **kwargs)
+
+    arc_strategy = strategy
+    monkeypatch.setattr(
+        robot._driver, '_send_command', counting_send_command)
+    monkeypatch.setattr(robot, 'move_to', strategy_move_to)
+
+    p200.transfer(50, plate[0], plate[1])
+    return len(round_trips), pose_tracker.absolute(robot.poses, p200)
+
+
+def test_arc_round_trips(monkeypatch):
+    arc_trips, arc_position = _transfer(monkeypatch, 'arc')
+    batched_trips, batched_position = _transfer(monkeypatch, 'arc_batched')
+    assert (arc_position == batched_position).all()
+    assert batched_trips < arc_trips
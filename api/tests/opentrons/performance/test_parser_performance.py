@@ -0,0 +1,34 @@
+import timeit
+
+import pytest
+
+from opentrons.drivers import response_parsers as parsers
+
+RESPONSES = [
+    (parsers.parse_position,
+     'ok MCS: X:418.0000 Y:353.0000 Z:218.0000 A:218.0000 B:19.0000 '
+     'C:19.0000'),
+    (parsers.parse_homing_status, 'X:1 Y:1 Z:1 A:1 B:1 C:1'),
+    (parsers.parse_switches,
+     'X_max:0 Y_max:0 Z_max:0 A_max:0 B_max:0 C_max:0 pins- (XL)2.01:0 '
+     '(YL)2.01:0 (ZL)2.01:0 (AL)2.01:0 (BL)2.01:0 (CL)2.01:0 Probe: 0'),
+    (parsers.parse_temperature, 'T:none C:25'),
+    (parsers.parse_distance, 'height:30.5'),
+]
+# upper bound on parsing a single response, in seconds
+MAX_PARSE_TIME = 0.0001
+
+
+@pytest.mark.benchmark
+def test_parser_speed():
+    for parser, response in RESPONSES:
+        duration = min(timeit.repeat(
+            lambda: parser(response), number=10000, repeat=3))
+        assert duration / 10000 < MAX_PARSE_TIME, parser.__name__
+
+    echo = min(timeit.repeat(
+        lambda: parsers.remove_echo(
+            'M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4P0.005 G0X100Y100 M400',
+            ''),
+        number=10000, repeat=3))
+    assert echo / 10000 < MAX_PARSE_TIME
@@ -1,9 +1,17 @@
+import timeit
 import unittest
 
+import pytest
+
 from opentrons import Robot
 from opentrons.containers import load as containers_load
 from opentrons.instruments import pipette
 
+# upper bounds, in seconds, on simulating the protocol below and on a single
+# well geometry lookup
+MAX_PROTOCOL_TIME = 10
+MAX_GEOMETRY_TIME = 0.001
+
 
 class PerformanceTest(unittest.TestCase):
     def setUp(self):
@@ -45,6 +53,8 @@ class PerformanceTest(unittest.TestCase):
             trash_container=trash,
             tip_racks=[tiprack],
             min_volume=0.5,
+            max_volume=200,
+            ul_per_mm=18.5,
             axis="b",
             channels=1
         )
@@ -66,3 +76,23 @@ class PerformanceTest(unittest.TestCase):
 
     def log(self, info):
         self.events.append(info)
+
+    @pytest.mark.benchmark
+    def test_protocol(self):
+        duration = timeit.timeit(self.protocol, number=1)
+        assert duration < MAX_PROTOCOL_TIME
+
+    @pytest.mark.benchmark
+    def test_well_geometry(self):
+        plate = containers_load(self.robot, '96-flat', 'B1', 'plate')
+        well = plate[10]
+
+        def top():
+            return well.top()
+
+        def from_center():
+            return well.from_center(x=1, y=0, z=1)
+
+        for func in (top, from_center):
+            duration = min(timeit.repeat(func, number=1000, repeat=3))
+            assert duration / 1000 < MAX_GEOMETRY_TIME, func.__name__
@@ -0,0 +1,24 @@
+import gc
+import tracemalloc
+
+from opentrons.data_storage import database
+
+
+def _container_size(name, count=3):
+    database.load_container(name)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    containers = [database.load_container(name) for _ in range(count)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(containers) == count
+    return (after - before) / count
+
+
+def test_container_memory():
+    sizes = {name: _container_size(name) for name in ('96-flat', '384-plate')}
+    # a 384 well plate holds four times the wells of a 96 well plate,
+    # per-container overhead should not dominate
+    assert sizes['384-plate'] < 5 * sizes['96-flat']
@@ -0,0 +1,75 @@
+import timeit
+
+import pytest
+from numpy import isclose
+
+from opentrons.trackers.pose_tracker import (
+    change_base, change_base_many, descendants, has_children
+)
+
+SLOTS = ['1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11']
+
+
+@pytest.mark.benchmark
+def test_change_base_many_full_deck(robot):
+    for slot in SLOTS:
+        robot.add_container('384-plate', slot)
+    wells = [
+        well for container in robot.get_containers() for well in container]
+
+    def one_by_one():
+        return [change_base(robot.poses, src=well) for well in wells]
+
+    def batch():
+        return change_base_many(robot.poses, srcs=wells)
+
+    assert isclose(batch(), one_by_one()).all()
+
+    loop_time = min(timeit.repeat(one_by_one, number=1, repeat=3))
+    batch_time = min(timeit.repeat(batch, number=1, repeat=3))
+    assert batch_time < loop_time
+
+
+def _recursive_descendants(state, obj, level=0):
+    # implementation pose_tracker.descendants used to have, for reference
+    return sum([
+        [(child, level)] + _recursive_descendants(state, child, level + 1)
+        for child in state.children(obj)
+    ], [])
+
+
+@pytest.mark.benchmark
+def test_descendants_traversal(robot):
+    robot.add_container('384-plate', '1')
+    for slot in SLOTS[1:] + ['12']:
+        robot.add_container('tiprack-200ul', slot, share=True)
+    deck = robot.deck
+
+    assert descendants(robot.poses, deck) == \
+        _recursive_descendants(robot.poses, deck)
+
+    def recursive():
+        _recursive_descendants(robot.poses, deck)
+
+    def iterative():
+        descendants(robot.poses, deck)
+
+    recursive_time = min(timeit.repeat(recursive, number=10, repeat=3))
+    iterative_time = min(timeit.repeat(iterative, number=10, repeat=3))
+    assert iterative_time < recursive_time
+
+    empty = robot.deck['11'].get_children_list()[0][0]
+    assert not has_children(robot.poses, empty)
+    assert has_children(robot.poses, deck)
+
+    def recursive_has_children():
+        return len(_recursive_descendants(robot.poses, deck)) > 0
+
+    def counted_has_children():
+        return has_children(robot.poses, deck)
+
+    recursive_time = min(timeit.repeat(
+        recursive_has_children, number=10, repeat=3))
+    counted_time = min(timeit.repeat(
+        counted_has_children, number=10, repeat=3))
+    assert counted_time < recursive_time
@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from opentrons.drivers.pty_device import PtyDevice
+from opentrons.drivers.smoothie_drivers.driver_3_0 import SmoothieDriver_3_0_0
+from opentrons.drivers.smoothie_drivers.virtual_smoothie import (
+    VirtualSmoothie)
+from opentrons.robot import robot_configs
+
+MOVES = 40
+
+
+def _moves_per_second(monkeypatch, streaming):
+    monkeypatch.setenv('ENABLE_VIRTUAL_SMOOTHIE', 'false')
+    # a few milliseconds per line, like Smoothieware's parser, with motion
+    # sped up 50 times to keep the benchmark short
+    smoothie = VirtualSmoothie(latency=0.005, time_scale=0.02)
+    with PtyDevice(smoothie) as device:
+        driver = SmoothieDriver_3_0_0(robot_configs.load())
+        driver.connect(port=device.port)
+        try:
+            driver.home()
+            driver.set_streaming(streaming)
+            start = time.time()
+            for i in range(MOVES):
+                driver.move({'X': 200 + 20 * (i % 2), 'Y': 200})
+            driver.set_streaming(False)
+            elapsed = time.time() - start
+        finally:
+            driver.disconnect()
+    assert smoothie.position['X'] == 220
+    return MOVES / elapsed
+
+
+@pytest.mark.benchmark
+def test_streaming_throughput(monkeypatch):
+    blocking = _moves_per_second(monkeypatch, streaming=False)
+    streamed = _moves_per_second(monkeypatch, streaming=True)
+    assert streamed > blocking
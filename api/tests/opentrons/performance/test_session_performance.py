@@ -0,0 +1,62 @@
+import time
+
+import pytest
+
+from opentrons import robot
+from opentrons.api import Session
+from opentrons.api.session import _collect_labware
+
+HEADER = '''
+from opentrons import containers, instruments
+
+plates = [containers.load('96-flat', slot) for slot in ['1', '2', '3']]
+tiprack = containers.load('tiprack-200ul', '4')
+p200 = instruments.P300_Single(mount='right', tip_racks=[tiprack])
+p200.pick_up_tip()
+'''
+
+
+def _generate_protocol(commands):
+    # a plate replication: each well of plate 1 copied to plates 2 and 3
+    lines = []
+    for i in range(commands // 2):
+        well = i % 96
+        lines.append('p200.aspirate(10, plates[0].wells({}))'.format(well))
+        lines.append('p200.dispense(10, plates[{}].wells({}))'.format(
+            1 + i % 2, well))
+    return HEADER + '\n'.join(lines)
+
+
+def _collect_time(commands):
+    start = time.time()
+    labware = _collect_labware(commands)
+    return time.time() - start, labware
+
+
+@pytest.mark.benchmark
+def test_session_labware(virtual_smoothie_env):
+    start = time.time()
+    session = Session(name='replicate.py', text=_generate_protocol(2000))
+    simulated = time.time() - start
+
+    start = time.time()
+    instruments = session.get_instruments()
+    containers = session.get_containers()
+    listed = time.time() - start
+    assert listed < simulated
+
+    assert [len(i.containers) for i in instruments] == [4]
+    assert [len(c.instruments) for c in containers] == [1, 1, 1, 1]
+
+    p200, = session._instruments
+    commands = [
+        {'instrument': p200, 'location': session._containers[i % 4][i % 96]}
+        for i in range(20000)]
+    few, labware = _collect_time(commands[:2000])
+    many, _ = _collect_time(commands)
+    assert labware[0] == [p200]
+    assert len(labware[1]) == 4
+    # linear in the number of commands: ten times the commands should take
+    # nowhere near a hundred times as long
+    assert many < 30 * few
+    robot.reset()
@@ -0,0 +1,52 @@
+import timeit
+
+import pytest
+
+from opentrons.util.vector import Vector, VectorArray
+
+OPERATIONS = [
+    'Vector(1, 2, 3)',
+    'Vector((1, 2, 3))',
+    'a + b',
+    'a + (1, 2, 3)',
+    'a - b',
+    'a * 2.0',
+    'a / 2.0',
+    'a * b',
+    'a == b',
+    'a == (1, 2, 3)',
+    "a['x']",
+    'a[0]',
+    'tuple(a)',
+    'a.length()',
+]
+# upper bound on a single operation, in seconds
+MAX_OPERATION_TIME = 0.0001
+
+
+@pytest.mark.benchmark
+def test_vector_operations():
+    namespace = {'Vector': Vector, 'a': Vector(1, 2, 3), 'b': Vector(4, 5, 6)}
+    for stmt in OPERATIONS:
+        duration = min(timeit.repeat(
+            stmt, number=10000, repeat=3, globals=namespace))
+        assert duration / 10000 < MAX_OPERATION_TIME, stmt
+
+
+@pytest.mark.benchmark
+def test_vector_array_batch():
+    offsets = [Vector(i, i * 2, 0) for i in range(384)]
+    centers = [Vector(1.5, 1.5, 5) for i in range(384)]
+    offset_array, center_array = VectorArray(offsets), VectorArray(centers)
+
+    def one_by_one():
+        return [o + c for o, c in zip(offsets, centers)]
+
+    def batch():
+        return offset_array + center_array
+
+    assert batch() == one_by_one()
+
+    loop_time = min(timeit.repeat(one_by_one, number=10, repeat=3))
+    batch_time = min(timeit.repeat(batch, number=10, repeat=3))
+    assert batch_time < loop_time
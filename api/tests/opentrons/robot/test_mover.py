@@ -68,3 +68,32 @@ def test_integration(robot):
     robot.home()
     pose = left._move(robot.poses, 1, 1, 1)
     assert isclose(change_base(pose, src=left), (1, 1, 1)).all()
+
+
+def test_move_sequence(smoothie):
+    from opentrons.robot.mover import move_sequence
+
+    gantry = Mover(
+        driver=smoothie,
+        axis_mapping={'x': 'X', 'y': 'Y'},
+        src=ROOT,
+        dst=ROOT)
+    left = Mover(
+        driver=smoothie,
+        axis_mapping={'z': 'Z'},
+        src=ROOT,
+        dst=ROOT)
+
+    state = init() \
+        .add(gantry) \
+        .add(left, gantry)
+
+    state = move_sequence(state, [
+        (left, {'z': 100}),
+        (gantry, {'x': 10, 'y': 20}),
+        (left, {'z': 30})
+    ])
+    assert isclose(change_base(state, src=left), (10, 20, 30)).all()
+    assert smoothie.position['X'] == 10
+    assert smoothie.position['Y'] == 20
+    assert smoothie.position['Z'] == 30
@@ -88,6 +88,50 @@ def test_comment(virtual_smoothie_env):
     assert robot.commands() == ['hello']
 
 
+def test_bare_robot_skips_command_payloads(monkeypatch):
+    from opentrons import Robot
+    from opentrons.broker import broker
+    from opentrons.commands import commands
+
+    bind = commands._bind_command_args
+    bound = []
+
+    def counting_bind(*args):
+        bound.append(args)
+        return bind(*args)
+
+    monkeypatch.setattr(broker, 'subscriptions', {})
+    monkeypatch.setattr(commands, '_bind_command_args', counting_bind)
+
+    bare = Robot()
+    bare.comment('hello')
+    assert not broker.has_subscribers(commands.types.COMMAND)
+    assert bound == []
+
+    assert bare.commands() == []
+    bare.comment('hello')
+    assert len(bound) == 1
+    assert bare.commands() == ['hello']
+
+
+def test_commands_rendered_when_run(virtual_smoothie_env):
+    from opentrons import commands
+    from opentrons.broker import broker
+    robot.reset()
+    plate = labware.load('96-flat', '1')
+
+    robot.clear_commands()
+    payload = commands.aspirate(
+        instrument=None, volume=10, location=plate[0], rate=1.0)
+    broker.publish(commands.types.COMMAND, {**payload, '$': 'before'})
+    # a later change to the command's arguments leaves the log as it was
+    payload['payload']['volume'] = 20
+    payload['payload']['text'] = 'changed'
+    assert robot.commands() == [
+        'Aspirating 10 uL from well A1 in "1" at 1.0 speed']
+    robot.reset()
+
+
 def test_create_arc(virtual_smoothie_env):
     from opentrons.robot.robot import TIP_CLEARANCE_DECK, TIP_CLEARANCE_LABWARE
     robot.reset()
@@ -1,9 +1,12 @@
 import pytest
 from opentrons.trackers.pose_tracker import (
     Point, Node, add, descendants, ascend, change_base, max_z,
-    update, remove, translate, init, ROOT, has_children
+    update, remove, translate, init, ROOT, has_children, snapshot,
+    cache_info, kind_of, invert, TRANSLATION, RIGID, AFFINE,
+    add_many, change_base_many
 )
-from numpy import isclose, array, ndarray
+from numpy import isclose, array, ndarray, identity
+from numpy.linalg import inv
 
 
 def scale(cx, cy, cz) -> ndarray:
@@ -84,6 +87,20 @@ def test_descendants(state):
     assert descendants(state, '1-1-1') == []
 
 
+def test_deep_tree():
+    state = init()
+    parent = ROOT
+    for i in range(5000):
+        state = add(state, i, parent=parent, point=Point(0, 0, 1))
+        parent = i
+
+    assert len(descendants(state, ROOT)) == 5000
+    assert descendants(state, 4997) == [(4998, 0), (4999, 1)]
+    assert ascend(state, 4999)[:3] == [4999, 4998, 4997]
+    assert len(ascend(state, 4999)) == 5001
+    assert max_z(state, ROOT) == 5000
+
+
 def test_has_children(state):
     assert not has_children(state, '2-2')
     assert has_children(state, '2')
@@ -130,6 +147,31 @@ def test_max_z(state):
     assert max_z(state, '1') == 23.0
 
 
+def test_max_z_maintained(state):
+    assert max_z(state, ROOT) == 26.0
+    assert max_z(state, '2') == -13.0
+
+    state = add(state, '2-2-1', parent='2-2', point=Point(0, 0, 50))
+    assert max_z(state, ROOT) == 26.0
+    assert max_z(state, '2') == 27.0
+
+    state = update(state, '2-2', Point(0, 0, 0))
+    assert max_z(state, ROOT) == 47.0
+    assert max_z(state, '2') == 50.0
+    assert max_z(state, '2-2') == 50.0
+
+    state = remove(state, '2-2-1')
+    assert max_z(state, ROOT) == 26.0
+
+    with pytest.raises(ValueError):
+        max_z(state, '2-2')
+
+    # subtree under a non-translation transform
+    state = add(state, '3', point=Point(0, 0, 5), transform=rotate(1.0))
+    state = add(state, '3-1', parent='3', point=Point(0, 0, 30))
+    assert isclose(max_z(state, ROOT), 35.0)
+
+
 def test_update(state):
     state = update(state, '1-1', Point(0, 0, 0))
     assert (change_base(state, src='1-1-1') == (1, 2, 3)).all()
@@ -150,3 +192,105 @@ def test_change_base():
         .add('1-1', parent='1', point=Point(1, 0, 0))
 
     assert isclose(change_base(state, src='1-1'), (0.5, 0, 0)).all()
+
+
+def test_snapshot(state):
+    frozen = snapshot(state)
+    state = update(state, '1', Point(0, 0, 0))
+    state = add(state, '1-3', parent='1', point=Point(5, 5, 5))
+    state = remove(state, '2')
+
+    assert (change_base(frozen, src='1') == (1, 2, 3)).all()
+    assert (change_base(state, src='1') == (0, 0, 0)).all()
+    assert '2' in frozen and '2' not in state
+    assert '1-3' in state and '1-3' not in frozen
+    assert frozen['1'].children == ['1-1', '1-2']
+
+    # snapshot is independent from the tree it was taken from
+    frozen = update(frozen, '1-1', Point(0, 0, 0))
+    assert (change_base(state, src='1-1') == (11, 12, 13)).all()
+
+
+def test_capacity_growth():
+    state = init()
+    for i in range(200):
+        state = add(state, i, point=Point(i, 0, 0))
+    for i in range(0, 200, 2):
+        state = remove(state, i)
+    for i in range(200, 300):
+        state = add(state, i, parent=199, point=Point(0, i, 0))
+
+    assert len(state) == 1 + 100 + 100
+    assert (change_base(state, src=199) == (199, 0, 0)).all()
+    assert (change_base(state, src=250) == (199, 250, 0)).all()
+    assert state[199].children == list(range(200, 300))
+
+
+def test_cached_transforms(state):
+    assert (
+        change_base(state, src='1-1-1', dst='1-2') == (-10, -10, -10)).all()
+    assert (change_base(state, src='2-1') == (-12, -14, -16)).all()
+    before = cache_info(state)
+
+    # only subtree of '1' is invalidated
+    state = update(state, '1', Point(0, 0, 0))
+    assert (change_base(state, src='2-1') == (-12, -14, -16)).all()
+    assert cache_info(state).misses == before.misses
+    assert (change_base(state, src='1-1-1') == (11, 12, 13)).all()
+    assert cache_info(state).misses == before.misses + 3
+    assert (
+        change_base(state, src='1-1-1', dst='1-2') == (-10, -10, -10)).all()
+    assert cache_info(state).hits > before.hits
+
+
+@pytest.mark.parametrize("matrix, kind", [
+    (translate(Point(1, -2, 3)), TRANSLATION),
+    (rotate(0.3).dot(translate(Point(4, 5, 6))), RIGID),
+    (scale(2, 1, 1).dot(translate(Point(4, 5, 6))), AFFINE),
+    (array([
+        [1.0, 0.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0],
+        [0.5, 0.0, 0.0, 1.0]]), AFFINE)
+])
+def test_invert(matrix, kind):
+    assert kind_of(matrix) == kind
+    assert isclose(invert(matrix, kind), inv(matrix)).all()
+    assert isclose(invert(matrix, kind).dot(matrix), identity(4)).all()
+
+
+def test_change_base_many(state):
+    objs = ['1', '1-1', '1-1-1', '2-2', ROOT]
+    points = [(1, 0, 0), (0, 2, 0), (0, 0, 3), (1, 1, 1), (0, 0, 0)]
+    for dst in [ROOT, '1', '1-1-1', '2-1']:
+        expected = [
+            change_base(state, point=point, src=obj, dst=dst)
+            for obj, point in zip(objs, points)]
+        assert isclose(
+            change_base_many(state, points, objs, dst), expected).all()
+        assert isclose(
+            change_base_many(state, srcs=objs, dst=dst),
+            [change_base(state, src=obj, dst=dst) for obj in objs]).all()
+
+
+def test_add_many():
+    points = [(i, 2 * i, 3 * i) for i in range(10)]
+    one_by_one = init().add('1', transform=rotate(0.5))
+    for i, point in enumerate(points):
+        one_by_one = add(
+            one_by_one, i, parent='1', point=point, transform=scale(1, 2, 1))
+    batch = add_many(
+        init().add('1', transform=rotate(0.5)),
+        list(range(10)),
+        parent='1',
+        points=points,
+        transform=scale(1, 2, 1))
+
+    assert {*batch} == {*one_by_one}
+    for obj in one_by_one:
+        assert isclose(batch[obj].transform, one_by_one[obj].transform).all()
+        assert batch[obj].children == one_by_one[obj].children
+
+    with pytest.raises(AssertionError):
+        add_many(batch, [10, 1], parent='1', points=[(0, 0, 0)] * 2)
+    assert 10 not in batch
@@ -1,6 +1,8 @@
 import unittest
 
-from opentrons.util.vector import (Vector, VectorEncoder, VectorValue)
+from opentrons.util.vector import (
+    Vector, VectorArray, VectorEncoder, VectorValue)
+import copy
 import json
 
 
@@ -81,3 +83,30 @@ class VectorTestCase(unittest.TestCase):
         s = json.dumps(v1, cls=VectorEncoder)
         v2 = json.loads(s)
         self.assertEqual(v1, v2)
+
+    def test_immutable_operands(self):
+        v1 = Vector(1, 2, 3)
+        v2 = Vector(v1)
+        res = v1 + (1, 1, 1)
+
+        self.assertEqual(res, Vector(2, 3, 4))
+        self.assertEqual(v1, Vector(1, 2, 3))
+        self.assertIs(v2.coordinates, v1.coordinates)
+        self.assertIsInstance(res.coordinates, VectorValue)
+        self.assertEqual(copy.deepcopy(v1), v1)
+        self.assertFalse(hasattr(v1, '__dict__'))
+        self.assertRaises(ValueError, lambda: v1 == 1)
+
+    def test_vector_array(self):
+        vectors = VectorArray([Vector(1, 2, 3), (4, 5, 6)])
+        self.assertEqual(len(vectors), 2)
+        self.assertEqual(vectors[1], Vector(4, 5, 6))
+        self.assertEqual(list(vectors), [Vector(1, 2, 3), Vector(4, 5, 6)])
+
+        self.assertEqual(vectors + Vector(1, 1, 1), [(2, 3, 4), (5, 6, 7)])
+        self.assertEqual(vectors - vectors, [(0, 0, 0), (0, 0, 0)])
+        self.assertEqual(vectors * 2, [(2, 4, 6), (8, 10, 12)])
+        self.assertEqual(vectors / (1, 2, 3), [(1, 1, 1), (4, 2.5, 2)])
+        self.assertEqual(vectors[1:].to_list(), [Vector(4, 5, 6)])
+        self.assertAlmostEqual(
+            vectors.lengths()[0], Vector(1, 2, 3).length())